@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark One Call parsing and per-object memory.
+
+Compares the original path (plain dataclass built by hand-written dict
+indexing for every daily entry) with the shared parser in
+``src/api/onecall_parser.py``.
+
+    python benchmarks/bench_onecall_parser.py
+"""
+import json
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.api import onecall_parser
+from src.models.weather_data import WeatherData
+
+@dataclass
+class LegacyWeatherData:
+    """The original WeatherData layout (no slots)"""
+    temperature: float
+    feels_like: float
+    humidity: int
+    wind_speed: float
+    wind_deg: int
+    pressure: int
+    description: str
+    timestamp: datetime
+    location: str
+    icon_code: str
+
+def make_payload(days=8, hours=48, minutes=60) -> bytes:
+    """Build a realistic One Call payload"""
+    now = 1760000000
+    weather = [{'id': 500, 'main': 'Rain', 'description': 'light rain', 'icon': '10d'}]
+    current = {'dt': now, 'temp': 12.3, 'feels_like': 11.0, 'humidity': 80, 'wind_speed': 4.1,
+               'wind_deg': 200, 'pressure': 1008, 'weather': weather}
+    hourly = [dict(current, dt=now + 3600 * i, pop=0.2) for i in range(hours)]
+    daily = [dict(current, dt=now + 86400 * i, temp={'day': 20.0, 'min': 9.0, 'max': 22.0},
+                  feels_like={'day': 19.0}, pop=0.5) for i in range(days)]
+    minutely = [{'dt': now + 60 * i, 'precipitation': 0.1} for i in range(minutes)]
+    return json.dumps({'current': current, 'minutely': minutely,
+                       'hourly': hourly, 'daily': daily}).encode()
+
+def legacy_parse(raw: bytes, city: str):
+    """The original parsing path from weather_service.py"""
+    data = json.loads(raw)
+    current = data['current']
+    weather = LegacyWeatherData(
+        temperature=current['temp'],
+        feels_like=current['feels_like'],
+        humidity=current['humidity'],
+        wind_speed=current['wind_speed'],
+        wind_deg=current['wind_deg'],
+        pressure=current['pressure'],
+        description=current['weather'][0]['description'],
+        timestamp=datetime.fromtimestamp(current['dt']),
+        location=city,
+        icon_code=current['weather'][0]['icon']
+    )
+    forecasts = []
+    for item in data['daily'][:7]:
+        forecasts.append(LegacyWeatherData(
+            temperature=item['temp']['day'],
+            feels_like=item['feels_like']['day'],
+            humidity=item['humidity'],
+            wind_speed=item['wind_speed'],
+            wind_deg=item['wind_deg'],
+            pressure=item['pressure'],
+            description=item['weather'][0]['description'],
+            timestamp=datetime.fromtimestamp(item['dt']),
+            location=city,
+            icon_code=item['weather'][0]['icon']
+        ))
+    return weather, forecasts
+
+def new_parse(raw: bytes, city: str):
+    """The shared parser (current, daily, hourly and minutely)"""
+    return onecall_parser.parse_onecall(onecall_parser.loads(raw), city)
+
+def object_memory(cls, count=10000) -> float:
+    """Average bytes allocated per instance"""
+    args = (20.0, 19.0, 60, 5.0, 90, 1015, 'clear sky', datetime.now(), 'London', '01d')
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [cls(*args) for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    del objects
+    return size / count
+
+def main():
+    raw = make_payload()
+    number = 2000
+
+    print(f"JSON backend: {onecall_parser.JSON_BACKEND}")
+    print(f"{'':28}{'legacy':>12}{'new':>12}")
+
+    legacy = timeit.timeit(lambda: legacy_parse(raw, "London"), number=number) / number
+    new = timeit.timeit(lambda: new_parse(raw, "London"), number=number) / number
+    print(f"{'parse payload (µs)':28}{legacy * 1e6:12.1f}{new * 1e6:12.1f}")
+    print(f"{'  points kept':28}{8:12d}{1 + 7 + 48 + 60:12d}")
+
+    legacy_mem = object_memory(LegacyWeatherData)
+    new_mem = object_memory(WeatherData)
+    print(f"{'WeatherData bytes/object':28}{legacy_mem:12.0f}{new_mem:12.0f}")
+
+if __name__ == "__main__":
+    main()
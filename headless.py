@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Headless weather monitor.
+
+Fetches weather for one or more cities using the same configuration as the
+desktop app and writes one JSON object per line to stdout. Nothing from
+PyQt5 or matplotlib is imported, so this is suitable for monitoring hosts.
+
+Examples:
+    python headless.py London Paris             # one-shot
+    python headless.py London --interval        # every REFRESH_INTERVAL seconds
+    python headless.py London --interval 60 --forecast
+"""
+import argparse
+import contextlib
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.append(str(project_root))
+
+from src.utils.config import Config
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Headless weather monitor emitting JSON lines")
+    parser.add_argument('cities', nargs='+', help="City names to monitor")
+    parser.add_argument(
+        '--interval', type=int, nargs='?', const=0, default=None, metavar='SECONDS',
+        help="Keep running and refresh periodically (default: REFRESH_INTERVAL from config)"
+    )
+    parser.add_argument('--forecast', action='store_true', help="Also emit the 7-day forecast")
+    parser.add_argument('--no-history', action='store_true',
+                        help="Don't record observations in the local history store")
+    return parser.parse_args(argv)
+
+def weather_to_dict(weather_data) -> dict:
+    """Convert a WeatherData object into JSON-serialisable values"""
+    return {
+        'temperature': weather_data.temperature,
+        'feels_like': weather_data.feels_like,
+        'humidity': weather_data.humidity,
+        'wind_speed': weather_data.wind_speed,
+        'wind_deg': weather_data.wind_deg,
+        'wind_direction': weather_data.get_wind_direction(),
+        'pressure': weather_data.pressure,
+        'description': weather_data.description,
+        'timestamp': weather_data.timestamp.isoformat(),
+        'icon_code': weather_data.icon_code
+    }
+
+def emit(record: dict, out=sys.stdout):
+    """Write a single JSON line and flush so consumers see it immediately"""
+    out.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+    out.flush()
+
+def alert_event_to_dict(event) -> dict:
+    """Convert an AlertEvent into JSON-serialisable values"""
+    rule = event.rule or event.previous
+    return {
+        'type': 'alert',
+        'event': event.kind,
+        'location': event.location,
+        'group': event.group,
+        'rule': event.rule.id if event.rule else None,
+        'previous': event.previous.id if event.previous else None,
+        'severity': rule.severity,
+        'title': rule.title,
+        'time': datetime.fromtimestamp(event.timestamp).isoformat(timespec='seconds')
+    }
+
+def official_alert_to_dict(location: str, change: str, alert) -> dict:
+    """Convert an official alert change into JSON-serialisable values"""
+    return {
+        'type': 'official_alert',
+        'event': change,
+        'location': location,
+        'sender': alert.sender,
+        'title': alert.event,
+        'start': datetime.fromtimestamp(alert.start).isoformat(timespec='seconds'),
+        'end': datetime.fromtimestamp(alert.end).isoformat(timespec='seconds'),
+        'description': alert.description,
+        'tags': list(alert.tags)
+    }
+
+def poll_city(weather_service, alert_service, alert_tracker, official_feed,
+              city: str, include_forecast: bool, store=None):
+    """Fetch and evaluate one city, yielding output records"""
+    fetched_at = datetime.now().isoformat(timespec='seconds')
+
+    # The services report problems with print(); keep stdout clean for JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        result = weather_service.get_weather(city)
+
+    weather_data = result.current if result else None
+    if not weather_data:
+        yield {'type': 'error', 'location': city, 'fetched_at': fetched_at,
+               'message': "Error fetching weather data"}
+        return
+
+    if store is not None:
+        with contextlib.redirect_stdout(sys.stderr):
+            store.append(weather_data)
+
+    from src.utils.weather_warnings import WeatherWarnings
+
+    yield {
+        'type': 'current',
+        'location': weather_data.location,
+        'fetched_at': fetched_at,
+        'cached': result.cached,
+        'weather': weather_to_dict(weather_data),
+        'alerts': alert_service.check_alerts(weather_data),
+        'warnings': [
+            {'severity': w.severity, 'title': w.title, 'message': w.message}
+            for w in WeatherWarnings.check_warnings(weather_data)
+        ]
+    }
+
+    # Alert transitions since the previous poll
+    for event in alert_tracker.update(weather_data):
+        yield alert_event_to_dict(event)
+
+    # Official alerts that are new, changed or no longer in effect
+    diff = official_feed.update(weather_data.location, result.alerts)
+    for change, alerts in (('new', diff.new), ('updated', diff.updated), ('expired', diff.expired)):
+        for alert in alerts:
+            yield official_alert_to_dict(weather_data.location, change, alert)
+
+    if include_forecast:
+        forecast_data = result.forecast
+        if forecast_data:
+            yield {
+                'type': 'forecast',
+                'location': forecast_data.location,
+                'fetched_at': fetched_at,
+                'daily': [weather_to_dict(f) for f in forecast_data.daily_forecasts]
+            }
+        else:
+            yield {'type': 'error', 'location': city, 'fetched_at': fetched_at,
+                   'message': "Error fetching forecast data"}
+
+def run(args) -> int:
+    """Run the monitor in one-shot or periodic mode"""
+    if not Config.OPENWEATHER_API_KEY:
+        print("OpenWeather API key not found. Please set OPENWEATHER_API_KEY in .env file",
+              file=sys.stderr)
+        return 1
+
+    # Imported here so startup (and --help) doesn't pay for requests, NumPy,
+    # sqlite3 or http.server until they are needed
+    from src.api.weather_service import WeatherService
+    from src.notifications.alert_service import AlertService
+    from src.notifications.alert_tracker import AlertTracker
+    from src.notifications.government_alerts import GovernmentAlertFeed
+
+    if Config.METRICS_PORT:
+        from src.utils.metrics import start_metrics_server
+        start_metrics_server(Config.METRICS_PORT)
+
+    weather_service = WeatherService()
+    alert_service = AlertService()
+    alert_tracker = AlertTracker(alert_service.engine)
+    official_feed = GovernmentAlertFeed()
+    store = None
+    if not args.no_history:
+        from src.utils.observation_store import ObservationStore
+        store = ObservationStore()
+
+    interval = args.interval
+    if interval == 0:
+        interval = Config.REFRESH_INTERVAL
+
+    next_run = time.monotonic()
+    while True:
+        failures = 0
+        for city in args.cities:
+            for record in poll_city(weather_service, alert_service, alert_tracker,
+                                    official_feed, city, args.forecast, store):
+                if record['type'] == 'error':
+                    failures += 1
+                emit(record)
+
+        if interval is None:
+            break
+
+        # Spread rounds out when many cities would otherwise exceed the One Call budget
+        round_interval = max(interval, weather_service.quota.suggested_interval(len(args.cities)))
+
+        # Schedule against the monotonic clock so slow fetches don't cause drift
+        next_run = max(next_run + round_interval, time.monotonic())
+        time.sleep(max(0.0, next_run - time.monotonic()))
+
+    return 1 if failures else 0
+
+def main(argv=None) -> int:
+    """Headless entry point"""
+    args = parse_args(argv)
+    try:
+        return run(args)
+    except KeyboardInterrupt:
+        return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,8 @@ sys.path.append(str(project_root))
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 from src.utils.config import Config
+from src.utils.metrics import start_metrics_server
+from src.utils.tracing import span
 from src.ui.main_window import MainWindow
 
 def verify_project_structure():
@@ -75,9 +77,14 @@ def main():
         if not Config.OPENWEATHER_API_KEY:
             raise ValueError("OpenWeather API key not found. Please set OPENWEATHER_API_KEY in .env file")
         
+        # Expose metrics for fleet monitoring
+        if Config.METRICS_PORT:
+            start_metrics_server(Config.METRICS_PORT)
+        
         # Create and show main window
-        window = MainWindow()
-        window.show()
+        with span("startup", "startup"):
+            window = MainWindow()
+            window.show()
         
         # Start event loop
         return app.exec_()
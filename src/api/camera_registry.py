@@ -0,0 +1,80 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+import json
+import threading
+import time
+from ..utils.config import Config
+
+@dataclass
+class CameraDiff:
+    """Changes in the camera list between two refreshes"""
+    added: List[Dict] = field(default_factory=list)
+    removed: List[Dict] = field(default_factory=list)
+    updated: List[Dict] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed or self.updated)
+
+class CameraRegistry:
+    """Frigate camera list, cached on disk and refreshed in the background.
+
+    Frigate only exposes cameras through its full ``/api/config``, which is
+    large on big installs. The parsed list (name, size, fps) is kept in
+    ``Config.CACHE_DIR`` so the camera panel can start from it immediately,
+    and ``refresh`` reports what changed so callers can patch their views.
+    """
+
+    def __init__(self, frigate_service, path: Path = None):
+        self.frigate_service = frigate_service
+        self.path = Path(path) if path is not None else Config.CACHE_DIR / "frigate_cameras.json"
+        self.cameras: List[Dict] = []
+        self.fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            state = json.loads(self.path.read_text())
+            self.cameras, self.fetched_at = list(state['cameras']), float(state['fetched_at'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def _save(self):
+        try:
+            self.path.write_text(json.dumps({'fetched_at': self.fetched_at, 'cameras': self.cameras}))
+        except OSError as e:
+            print(f"Error saving camera list: {e}")
+
+    def names(self) -> List[str]:
+        return [camera['name'] for camera in self.cameras]
+
+    def refresh(self) -> CameraDiff:
+        """Fetch the camera list and return what changed (nothing if Frigate is unreachable).
+
+        Safe to call from a worker thread; concurrent refreshes are skipped.
+        """
+        if not self._lock.acquire(blocking=False):
+            return CameraDiff()
+        try:
+            try:
+                cameras = self.frigate_service.fetch_cameras()
+            except Exception as e:
+                print(f"Error refreshing camera list: {e}")
+                return CameraDiff()
+
+            previous = {camera['name']: camera for camera in self.cameras}
+            current = {camera['name']: camera for camera in cameras}
+            diff = CameraDiff(
+                added=[camera for name, camera in current.items() if name not in previous],
+                removed=[camera for name, camera in previous.items() if name not in current],
+                updated=[camera for name, camera in current.items()
+                         if name in previous and previous[name] != camera]
+            )
+            self.cameras = cameras
+            self.fetched_at = time.time()
+            self._save()
+            return diff
+        finally:
+            self._lock.release()
@@ -1,8 +1,38 @@
 import requests
 from typing import List, Dict, Optional
+from ..models.frigate_event import FrigateEvent
 from ..utils.config import Config
+from ..utils.event_index import EventIndex
+from ..utils.frame_ring import FrameRing
+from ..utils.metrics import REGISTRY
+from ..utils.tracing import span
+import threading
 import time
 
+REQUEST_LATENCY = REGISTRY.histogram('frigate_request_seconds', "Frigate API request latency",
+                                     ('endpoint',))
+SNAPSHOT_CACHE_HITS = REGISTRY.counter('frigate_snapshot_cache_hits', "Snapshots served from cache")
+ERRORS = REGISTRY.counter('frigate_errors', "Failed Frigate requests", ('endpoint',))
+SNAPSHOTS = REGISTRY.counter('frigate_snapshots', "Snapshots fetched from Frigate", ('camera',))
+EVENTS = REGISTRY.counter('frigate_events', "New or updated Frigate detection events", ('camera', 'label'))
+
+# Events requested per page when polling
+EVENTS_PAGE_SIZE = 50
+
+# Seconds before the newest known start that each poll asks from again, for
+# events Frigate stores late; the overlap is de-duplicated by id
+EVENTS_OVERLAP = 5.0
+
+# Frigate's ``before`` is exclusive; paging uses this much past the oldest
+# start of the previous page so events sharing that start are not skipped
+EVENTS_BOUNDARY = 0.001
+
+# Events in progress for longer than this (seconds) are no longer refreshed
+OPEN_EVENT_MAX_AGE = 3600
+
+# Event thumbnails kept in memory
+THUMBNAIL_CACHE_SIZE = 100
+
 class FrigateService:
     """Service for interacting with Frigate API"""
     
@@ -11,29 +41,41 @@ class FrigateService:
         self.api_key = Config.FRIGATE_API_KEY
         self.cache = {}  # Cache for snapshots
         self.cache_timeout = 1  # Cache timeout in seconds
+        self.replay = FrameRing()  # Recent snapshots of each camera
+        self.events = EventIndex()
+        self.thumbnails = {}  # Event id -> thumbnail JPEG, oldest first
+        self._poll_lock = threading.Lock()
         
         # Setup headers if API key is provided
         self.headers = {}
         if self.api_key:
             self.headers['Authorization'] = f'Bearer {self.api_key}'
     
+    def fetch_cameras(self) -> List[Dict]:
+        """Download the camera list from Frigate's config (raises on failure)"""
+        with REQUEST_LATENCY.time(endpoint='config'), span("frigate config", "http"):
+            response = requests.get(f"{self.base_url}/api/config", headers=self.headers, timeout=10)
+        response.raise_for_status()
+        config = response.json()
+        
+        cameras = []
+        for name, details in config.get('cameras', {}).items():
+            # Frigate 0.10+ keeps the dimensions under ``detect``
+            detect = details.get('detect') or {}
+            cameras.append({
+                'name': name,
+                'width': details.get('width', detect.get('width', 1280)),
+                'height': details.get('height', detect.get('height', 720)),
+                'fps': details.get('fps', detect.get('fps', 30))
+            })
+        return cameras
+    
     def get_cameras(self) -> List[Dict]:
         """Get list of available cameras"""
         try:
-            response = requests.get(f"{self.base_url}/api/config", headers=self.headers)
-            response.raise_for_status()
-            config = response.json()
-            
-            cameras = []
-            for name, details in config.get('cameras', {}).items():
-                cameras.append({
-                    'name': name,
-                    'width': details.get('width', 1280),
-                    'height': details.get('height', 720),
-                    'fps': details.get('fps', 30)
-                })
-            return cameras
+            return self.fetch_cameras()
         except Exception as e:
+            ERRORS.inc(endpoint='config')
             print(f"Error getting camera list: {e}")
             return []
     
@@ -45,27 +87,112 @@ class FrigateService:
         if camera_name in self.cache:
             cached_time, cached_data = self.cache[camera_name]
             if current_time - cached_time < self.cache_timeout:
+                SNAPSHOT_CACHE_HITS.inc()
                 return cached_data
         
         try:
-            response = requests.get(
-                f"{self.base_url}/api/{camera_name}/latest.jpg",
-                headers=self.headers,
-                timeout=2  # Add timeout
-            )
+            with REQUEST_LATENCY.time(endpoint='snapshot'), span("frigate snapshot", "http", camera=camera_name):
+                response = requests.get(
+                    f"{self.base_url}/api/{camera_name}/latest.jpg",
+                    headers=self.headers,
+                    timeout=2  # Add timeout
+                )
             response.raise_for_status()
             
             # Update cache
+            SNAPSHOTS.inc(camera=camera_name)
             self.cache[camera_name] = (current_time, response.content)
+            self.replay.add(camera_name, response.content, current_time)
             return response.content
             
         except Exception as e:
+            ERRORS.inc(endpoint='snapshot')
             print(f"Error getting camera snapshot: {e}")
             # Return cached data if available
             if camera_name in self.cache:
                 return self.cache[camera_name][1]
             return None
     
+    def get_events(self, after: float = None, before: float = None,
+                   limit: int = EVENTS_PAGE_SIZE) -> List[FrigateEvent]:
+        """Get detection events started after ``after``, newest first"""
+        # Thumbnails are fetched separately, only for events that are shown
+        params = {'limit': limit, 'include_thumbnails': 0}
+        if after is not None:
+            params['after'] = after
+        if before is not None:
+            params['before'] = before
+        with REQUEST_LATENCY.time(endpoint='events'), span("frigate events", "http"):
+            response = requests.get(f"{self.base_url}/api/events", params=params,
+                                    headers=self.headers, timeout=5)
+        response.raise_for_status()
+        return [FrigateEvent.from_api(item) for item in response.json()]
+    
+    def get_event(self, event_id: str) -> FrigateEvent:
+        """Get the current state of one event (raises on failure)"""
+        with REQUEST_LATENCY.time(endpoint='event'), span("frigate event", "http"):
+            response = requests.get(f"{self.base_url}/api/events/{event_id}",
+                                    headers=self.headers, timeout=5)
+        response.raise_for_status()
+        return FrigateEvent.from_api(response.json())
+    
+    def poll_events(self) -> List[FrigateEvent]:
+        """Fetch events since the last poll into ``self.events``; returns the new or changed ones.
+        
+        Safe to call from a worker thread; a poll started while one is running is skipped.
+        """
+        if not self._poll_lock.acquire(blocking=False):
+            return []
+        try:
+            return self._poll_events()
+        finally:
+            self._poll_lock.release()
+    
+    def _poll_events(self) -> List[FrigateEvent]:
+        # The first poll only takes the latest page rather than the whole history
+        after = self.events.latest - EVENTS_OVERLAP if len(self.events) else None
+        events = {}
+        try:
+            page = self.get_events(after=after)
+            # Page backwards (newest first) through a burst larger than one page,
+            # stopping if a page brings nothing new
+            while True:
+                new = [event for event in page if event.id not in events]
+                events.update((event.id, event) for event in page)
+                if after is None or len(page) < EVENTS_PAGE_SIZE or not new:
+                    break
+                page = self.get_events(after=after, before=page[-1].start_time + EVENTS_BOUNDARY)
+        except Exception as e:
+            ERRORS.inc(endpoint='events')
+            print(f"Error getting Frigate events: {e}")
+            return []
+        
+        # Events that started before this poll's window are refreshed by id,
+        # so one that never ends cannot hold the poll back
+        for event_id in self.events.in_progress(since=time.time() - OPEN_EVENT_MAX_AGE):
+            if event_id in events:
+                continue
+            try:
+                events[event_id] = self.get_event(event_id)
+            except Exception as e:
+                ERRORS.inc(endpoint='event')
+                print(f"Error getting Frigate event {event_id}: {e}")
+        
+        changed = self.events.add(list(events.values()))
+        for event in changed:
+            EVENTS.inc(camera=event.camera, label=event.label)
+        return changed
+    
+    def event_thumbnail_url(self, event_id: str) -> str:
+        """URL of an event's thumbnail (downloaded by the event strip)"""
+        return f"{self.base_url}/api/events/{event_id}/thumbnail.jpg"
+    
+    def cache_thumbnail(self, event_id: str, data: bytes):
+        """Keep a downloaded event thumbnail, dropping the oldest beyond the cache size"""
+        self.thumbnails[event_id] = data
+        if len(self.thumbnails) > THUMBNAIL_CACHE_SIZE:
+            del self.thumbnails[next(iter(self.thumbnails))]
+    
     def get_camera_stream_url(self, camera_name: str) -> str:
         """Get the MJPEG stream URL for a camera"""
         return f"{self.base_url}/api/{camera_name}/stream" 
\ No newline at end of file
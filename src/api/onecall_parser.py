@@ -0,0 +1,141 @@
+"""Parser for OpenWeather One Call 3.0 payloads.
+
+Turns a One Call response into the app's models in a single pass over the
+payload. Uses orjson for decoding when it is installed and falls back to the
+standard library otherwise.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+import json
+import numpy as np
+from ..models.weather_data import (WeatherData, ForecastData, ForecastSeries, PrecipitationSeries,
+                                   GovernmentAlert)
+
+try:
+    import orjson
+    JSON_BACKEND = "orjson"
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on the environment
+    JSON_BACKEND = "json"
+    _loads = json.loads
+
+# Number of daily entries shown in the UI
+DAILY_DAYS = 7
+
+@dataclass
+class OneCallResult:
+    """Models parsed from a single One Call response"""
+    current: Optional[WeatherData]
+    forecast: Optional[ForecastData]
+    alerts: List[GovernmentAlert] = field(default_factory=list)
+    cached: bool = False  # Served from the last response because the quota ran out
+
+def loads(raw: Union[bytes, str]) -> Dict:
+    """Decode a JSON document with the fastest available backend"""
+    return _loads(raw)
+
+def parse_current(item: Dict, location: str) -> WeatherData:
+    """Parse the ``current`` block into a WeatherData"""
+    weather = item['weather'][0]
+    return WeatherData(
+        temperature=item['temp'],
+        feels_like=item['feels_like'],
+        humidity=item['humidity'],
+        wind_speed=item['wind_speed'],
+        wind_deg=item['wind_deg'],
+        pressure=item['pressure'],
+        description=weather['description'],
+        timestamp=datetime.fromtimestamp(item['dt']),
+        location=location,
+        icon_code=weather['icon']
+    )
+
+def parse_series(items: List[Dict], location: str) -> ForecastSeries:
+    """Parse a ``daily`` or ``hourly`` block into a columnar ForecastSeries"""
+    n = len(items)
+    timestamps = np.empty(n, dtype=np.int64)
+    temperature = np.empty(n, dtype=np.float32)
+    feels_like = np.empty(n, dtype=np.float32)
+    humidity = np.empty(n, dtype=np.int16)
+    wind_speed = np.empty(n, dtype=np.float32)
+    wind_deg = np.empty(n, dtype=np.int16)
+    pressure = np.empty(n, dtype=np.int16)
+    codes = np.empty(n, dtype=np.int16)
+    precipitation = np.zeros(n, dtype=np.float32)
+    pop = np.zeros(n, dtype=np.float32)
+
+    condition_index = {}
+    for i, item in enumerate(items):
+        temp = item['temp']
+        feels = item['feels_like']
+        # Daily entries nest temperatures by time of day, hourly entries don't
+        if isinstance(temp, dict):
+            temp = temp['day']
+            feels = feels['day']
+        weather = item['weather'][0]
+        condition = (weather['description'], weather['icon'])
+        code = condition_index.get(condition)
+        if code is None:
+            code = condition_index[condition] = len(condition_index)
+
+        rain = item.get('rain', 0)
+        if isinstance(rain, dict):
+            rain = rain.get('1h', 0)
+
+        timestamps[i] = item['dt']
+        temperature[i] = temp
+        feels_like[i] = feels
+        humidity[i] = item['humidity']
+        wind_speed[i] = item['wind_speed']
+        wind_deg[i] = item['wind_deg']
+        pressure[i] = item['pressure']
+        codes[i] = code
+        precipitation[i] = rain
+        pop[i] = item.get('pop', 0)
+
+    return ForecastSeries(location, timestamps, temperature, feels_like, humidity,
+                          wind_speed, wind_deg, pressure, codes, list(condition_index),
+                          precipitation=precipitation, pop=pop)
+
+def parse_minutely(items: List[Dict], location: str) -> PrecipitationSeries:
+    """Parse the ``minutely`` block into a PrecipitationSeries"""
+    n = len(items)
+    timestamps = np.fromiter((item['dt'] for item in items), dtype=np.int64, count=n)
+    precipitation = np.fromiter((item.get('precipitation', 0) for item in items),
+                                dtype=np.float32, count=n)
+    return PrecipitationSeries(location, timestamps, precipitation)
+
+def parse_alerts(items: List[Dict]) -> List[GovernmentAlert]:
+    """Parse the ``alerts`` block into GovernmentAlerts"""
+    return [
+        GovernmentAlert(
+            sender=item.get('sender_name', ""),
+            event=item.get('event', ""),
+            start=int(item.get('start', 0)),
+            end=int(item.get('end', 0)),
+            description=item.get('description', "").strip(),
+            tags=tuple(item.get('tags', ()))
+        )
+        for item in items
+    ]
+
+def parse_onecall(payload: Dict, location: str) -> OneCallResult:
+    """Parse every block present in a One Call payload"""
+    current = payload.get('current')
+    daily = payload.get('daily')
+
+    forecast = None
+    if daily is not None:
+        forecast = ForecastData(
+            location=location,
+            daily=parse_series(daily[:DAILY_DAYS], location),
+            hourly=parse_series(payload.get('hourly', []), location),
+            minutely=parse_minutely(payload.get('minutely', []), location)
+        )
+
+    return OneCallResult(
+        current=parse_current(current, location) if current is not None else None,
+        forecast=forecast,
+        alerts=parse_alerts(payload.get('alerts', []))
+    )
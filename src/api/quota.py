@@ -0,0 +1,155 @@
+"""OpenWeather One Call quota management.
+
+One Call 3.0 is billed per call, so ``WeatherService`` asks a QuotaManager
+before every request. Calls are limited by a token bucket (bursts such as a
+user hammering Search) and by a daily budget that resets at midnight UTC, as
+OpenWeather's billing does. The day's count is kept in ``Config.CACHE_DIR``
+so restarts and the headless monitor share one budget; each reservation
+reads, increments and rewrites it under an exclusive lock on a sidecar lock
+file, and the file is replaced atomically so readers never see a partial
+write.
+"""
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+import json
+import os
+import time
+try:
+    import fcntl
+except ImportError:  # Windows: no inter-process locking
+    fcntl = None
+from ..utils.config import Config
+from ..utils.metrics import REGISTRY
+
+QUOTA_REMAINING = REGISTRY.gauge('openweather_quota_remaining', "One Call requests left in today's budget")
+QUOTA_TOKENS = REGISTRY.gauge('openweather_rate_tokens', "One Call requests available in the rate limiter")
+QUOTA_DENIED = REGISTRY.counter('openweather_quota_denied', "One Call requests refused locally", ('reason',))
+
+class QuotaExceeded(Exception):
+    """Raised when a request would exceed the rate limit or daily budget"""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(f"OpenWeather {reason} limit reached; retry in {retry_after:.0f}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second up to ``capacity``"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, now: float = None) -> bool:
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def wait_time(self, now: float = None) -> float:
+        """Seconds until a token is available"""
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+class QuotaManager:
+    """Daily budget plus per-minute rate limit for One Call requests"""
+
+    def __init__(self, daily_budget: int = None, per_minute: float = None, path: Path = None):
+        self.daily_budget = Config.ONECALL_DAILY_BUDGET if daily_budget is None else daily_budget
+        per_minute = Config.ONECALL_CALLS_PER_MINUTE if per_minute is None else per_minute
+        self.bucket = TokenBucket(per_minute / 60.0, max(1.0, per_minute))
+        self.path = Path(path) if path is not None else Config.CACHE_DIR / "onecall_quota.json"
+        self.day = None
+        self.used = 0
+        self._load()
+
+    @staticmethod
+    def _today(now: float) -> str:
+        return datetime.fromtimestamp(now, timezone.utc).strftime('%Y-%m-%d')
+
+    def _load(self):
+        """Pick up the count recorded by this or another process"""
+        try:
+            state = json.loads(self.path.read_text())
+            day, used = state['day'], int(state['used'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        if day == self.day:
+            self.used = max(self.used, used)
+        elif self.day is None or day > self.day:
+            self.day, self.used = day, used
+
+    def _save(self):
+        temporary = self.path.with_suffix('.tmp')
+        try:
+            temporary.write_text(json.dumps({'day': self.day, 'used': self.used}))
+            os.replace(temporary, self.path)
+        except OSError as e:
+            print(f"Error saving quota state: {e}")
+
+    @contextmanager
+    def _locked(self):
+        """Hold the inter-process lock on the shared count (best effort)"""
+        try:
+            lock = open(self.path.with_suffix('.lock'), 'a')
+        except OSError:
+            yield
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+        finally:
+            lock.close()  # Also releases the lock
+
+    def _roll_over(self, now: float):
+        today = self._today(now)
+        if self.day != today:
+            self.day, self.used = today, 0
+
+    def remaining(self, now: float = None) -> int:
+        """Requests left in today's budget"""
+        self._roll_over(time.time() if now is None else now)
+        return max(0, self.daily_budget - self.used)
+
+    def seconds_until_reset(self, now: float = None) -> float:
+        now = time.time() if now is None else now
+        return 86400 - now % 86400
+
+    def acquire(self, now: float = None):
+        """Reserve one request or raise QuotaExceeded"""
+        now = time.time() if now is None else now
+        with self._locked():
+            self._load()
+            self._roll_over(now)
+            if self.used >= self.daily_budget:
+                QUOTA_DENIED.inc(reason='daily')
+                raise QuotaExceeded('daily', self.seconds_until_reset(now))
+            if not self.bucket.try_acquire():
+                QUOTA_DENIED.inc(reason='rate')
+                raise QuotaExceeded('rate', self.bucket.wait_time())
+            self.used += 1
+            self._save()
+        self.update_metrics(now)
+
+    def update_metrics(self, now: float = None):
+        QUOTA_REMAINING.set(self.remaining(now))
+        QUOTA_TOKENS.set(self.bucket.tokens)
+
+    def suggested_interval(self, locations: int = 1, now: float = None) -> float:
+        """Refresh interval per location that spreads the remaining budget over the rest of the day"""
+        now = time.time() if now is None else now
+        remaining = self.remaining(now)
+        if remaining <= 0:
+            return self.seconds_until_reset(now)
+        return self.seconds_until_reset(now) * max(1, locations) / remaining
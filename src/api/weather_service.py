@@ -1,137 +1,135 @@
 import requests
-from typing import Dict, Any, Optional
+from dataclasses import replace
+from typing import Dict, Any, Optional, Tuple
 from ..utils.config import Config
+from ..utils.metrics import REGISTRY
+from ..utils.tracing import span
 from ..models.weather_data import WeatherData, ForecastData
-from datetime import datetime
+from .onecall_parser import OneCallResult, loads, parse_onecall
+from .quota import QuotaManager, QuotaExceeded
+
+REQUEST_LATENCY = REGISTRY.histogram('weather_api_request_seconds', "OpenWeather request latency",
+                                     ('endpoint',))
+GEOCODE_CACHE_HITS = REGISTRY.counter('weather_geocode_cache_hits', "Geocoding lookups served from cache")
+ERRORS = REGISTRY.counter('weather_service_errors', "Failed weather service calls", ('method', 'reason'))
 
 class WeatherService:
     """Service for interacting with OpenWeather API"""
-    
+
     def __init__(self):
         self.api_key = Config.OPENWEATHER_API_KEY
         if not self.api_key:
             raise ValueError("OpenWeather API key not found in configuration")
         self.base_url = "http://api.openweathermap.org/data/3.0"
+        self.geocoding_url = "http://api.openweathermap.org/geo/1.0/direct"
+        # City coordinates never change, so only geocode each city once
+        self._coordinates: Dict[str, Tuple[float, float]] = {}
+        # One Call is billed per request; fall back to the last result when over quota
+        self.quota = QuotaManager()
+        self.quota.update_metrics()
+        self._last_results: Dict[str, OneCallResult] = {}
+
+    def _get_coordinates(self, city: str) -> Tuple[float, float]:
+        """Get (lat, lon) for a city using the geocoding API"""
+        if city in self._coordinates:
+            GEOCODE_CACHE_HITS.inc()
+            return self._coordinates[city]
+
+        params = {
+            'q': city,
+            'limit': 1,
+            'appid': self.api_key
+        }
+        with REQUEST_LATENCY.time(endpoint='geocoding'), span("geocoding", "http", city=city):
+            response = requests.get(self.geocoding_url, params=params)
+        response.raise_for_status()
+
+        locations = loads(response.content)
+        if not locations:
+            raise ValueError(f"City not found: {city}")
+
+        location = locations[0]
+        coordinates = (location['lat'], location['lon'])
+        self._coordinates[city] = coordinates
+        return coordinates
+
+    def _get_onecall(self, city: str, exclude: str = '') -> Dict[str, Any]:
+        """Fetch the raw One Call payload for a city"""
+        lat, lon = self._get_coordinates(city)
+        self.quota.acquire()
+        params = {
+            'lat': lat,
+            'lon': lon,
+            'appid': self.api_key,
+            'units': 'metric'
+        }
+        if exclude:
+            params['exclude'] = exclude
+
+        with REQUEST_LATENCY.time(endpoint='onecall'), span("one call", "http", exclude=exclude):
+            response = requests.get(f"{self.base_url}/onecall", params=params)
+        if response.status_code == 401:
+            raise ValueError(f"Invalid API key: {self.api_key}")
+        response.raise_for_status()
+        return loads(response.content)
+
+    def get_weather(self, city: str) -> Optional[OneCallResult]:
+        """Get current weather, forecasts and official alerts with a single One Call request"""
+        try:
+            payload = self._get_onecall(city)
+            with span("parse one call"):
+                result = parse_onecall(payload, city)
+            self._last_results[city] = result
+            return result
+        except QuotaExceeded as e:
+            cached = self._last_results.get(city)
+            print(f"{e}; {'using cached data' if cached else 'no cached data'}")
+            return replace(cached, cached=True) if cached else None
+        except requests.exceptions.RequestException as e:
+            ERRORS.inc(method='get_weather', reason='request')
+            print(f"Error getting weather data: {e}")
+            return None
+        except ValueError as e:
+            ERRORS.inc(method='get_weather', reason='configuration')
+            print(f"Configuration error: {e}")
+            return None
+        except Exception as e:
+            ERRORS.inc(method='get_weather', reason='unexpected')
+            print(f"Unexpected error: {e}")
+            return None
 
     def get_current_weather(self, city: str) -> Optional[WeatherData]:
         """Get current weather for a city"""
         try:
-            # First get coordinates from geocoding API
-            geocoding_url = "http://api.openweathermap.org/geo/1.0/direct"
-            params = {
-                'q': city,
-                'limit': 1,
-                'appid': self.api_key
-            }
-            
-            response = requests.get(geocoding_url, params=params)
-            response.raise_for_status()
-            
-            locations = response.json()
-            if not locations:
-                raise ValueError(f"City not found: {city}")
-            
-            location = locations[0]
-            lat = location['lat']
-            lon = location['lon']
-            
-            # Get current weather using coordinates
-            url = f"{self.base_url}/onecall"
-            params = {
-                'lat': lat,
-                'lon': lon,
-                'appid': self.api_key,
-                'units': 'metric',
-                'exclude': 'minutely,hourly,daily,alerts'
-            }
-            
-            response = requests.get(url, params=params)
-            if response.status_code == 401:
-                raise ValueError(f"Invalid API key: {self.api_key}")
-            response.raise_for_status()
-            
-            data = response.json()
-            current = data['current']
-            
-            return WeatherData(
-                temperature=current['temp'],
-                feels_like=current['feels_like'],
-                humidity=current['humidity'],
-                wind_speed=current['wind_speed'],
-                wind_deg=current['wind_deg'],
-                pressure=current['pressure'],
-                description=current['weather'][0]['description'],
-                timestamp=datetime.fromtimestamp(current['dt']),
-                location=city,
-                icon_code=current['weather'][0]['icon']
-            )
-            
+            data = self._get_onecall(city, 'minutely,hourly,daily,alerts')
+            return parse_onecall(data, city).current
+        except QuotaExceeded as e:
+            print(e)
+            cached = self._last_results.get(city)
+            return cached.current if cached else None
         except requests.exceptions.RequestException as e:
+            ERRORS.inc(method='get_current_weather', reason='request')
             print(f"Error getting weather data: {e}")
             return None
         except ValueError as e:
+            ERRORS.inc(method='get_current_weather', reason='configuration')
             print(f"Configuration error: {e}")
             return None
         except Exception as e:
+            ERRORS.inc(method='get_current_weather', reason='unexpected')
             print(f"Unexpected error: {e}")
             return None
 
     def get_forecast(self, city: str) -> Optional[ForecastData]:
-        """Get 7-day forecast for a city"""
+        """Get 7-day, 48-hour and 60-minute forecasts for a city"""
         try:
-            # First get coordinates from geocoding API
-            geocoding_url = "http://api.openweathermap.org/geo/1.0/direct"
-            params = {
-                'q': city,
-                'limit': 1,
-                'appid': self.api_key
-            }
-            
-            response = requests.get(geocoding_url, params=params)
-            response.raise_for_status()
-            
-            locations = response.json()
-            if not locations:
-                raise ValueError(f"City not found: {city}")
-            
-            location = locations[0]
-            lat = location['lat']
-            lon = location['lon']
-            
-            # Get forecast using coordinates
-            url = f"{self.base_url}/onecall"
-            params = {
-                'lat': lat,
-                'lon': lon,
-                'appid': self.api_key,
-                'units': 'metric',
-                'exclude': 'current,minutely,hourly,alerts'
-            }
-            
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            forecasts = []
-            for item in data['daily'][:7]:  # Get first 7 days
-                forecast = WeatherData(
-                    temperature=item['temp']['day'],
-                    feels_like=item['feels_like']['day'],
-                    humidity=item['humidity'],
-                    wind_speed=item['wind_speed'],
-                    wind_deg=item['wind_deg'],
-                    pressure=item['pressure'],
-                    description=item['weather'][0]['description'],
-                    timestamp=datetime.fromtimestamp(item['dt']),
-                    location=city,
-                    icon_code=item['weather'][0]['icon']
-                )
-                forecasts.append(forecast)
-            
-            return ForecastData(
-                location=city,
-                daily_forecasts=forecasts
-            )
+            data = self._get_onecall(city, 'current,alerts')
+            return parse_onecall(data, city).forecast
+        except QuotaExceeded as e:
+            print(e)
+            cached = self._last_results.get(city)
+            return cached.forecast if cached else None
         except Exception as e:
+            ERRORS.inc(method='get_forecast', reason='unexpected')
             print(f"Error getting forecast data: {e}")
-            return None 
\ No newline at end of file
+            return None
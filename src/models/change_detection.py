@@ -0,0 +1,97 @@
+"""Change detection between successive refreshes.
+
+A refresh often returns the same data as the last one (the observation is
+only republished every ten minutes, and the forecast less often). The
+detector keeps small keys for each part of the UI, so an unchanged refresh
+can skip the matching redraws:
+
+* ``observation``: a new observation time, which adds a point to the
+  observed history;
+* ``days``: indices of daily forecast rows that differ;
+* ``chart``: the daily temperature chart;
+* ``hourly``: the hourly forecast.
+
+The weather card compares its own ``weather_key`` (the displayed values, not
+the observation time) with what it last showed, since it also shows
+clicked forecast days.
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import hashlib
+from .weather_data import ForecastData, ForecastSeries, WeatherData
+
+# WeatherData fields shown on the weather card
+DISPLAY_FIELDS = ('location', 'temperature', 'feels_like', 'humidity', 'wind_speed',
+                  'wind_deg', 'pressure', 'description', 'icon_code')
+
+def weather_key(weather: WeatherData) -> Tuple:
+    """Displayed values of an observation or forecast row"""
+    return tuple(getattr(weather, name) for name in DISPLAY_FIELDS)
+
+def day_keys(series: ForecastSeries) -> List[Tuple]:
+    """Key for each row of a forecast series (including its date)"""
+    conditions = [series.conditions[code] for code in series.condition_codes.tolist()]
+    return list(zip(series.timestamps.tolist(), series.temperature.tolist(),
+                    series.feels_like.tolist(), series.humidity.tolist(),
+                    series.wind_speed.tolist(), series.wind_deg.tolist(),
+                    series.pressure.tolist(), conditions))
+
+def series_digest(series: Optional[ForecastSeries], *columns: str) -> Optional[bytes]:
+    """Content hash of a forecast series (all columns unless named)"""
+    if series is None:
+        return None
+    columns = columns or ('timestamps', 'temperature', 'feels_like', 'humidity', 'wind_speed',
+                          'wind_deg', 'pressure', 'condition_codes', 'precipitation', 'pop')
+    digest = hashlib.blake2b(series.location.encode(), digest_size=16)
+    for name in columns:
+        digest.update(getattr(series, name).tobytes())
+    if 'condition_codes' in columns:
+        digest.update(repr(series.conditions).encode())
+    return digest.digest()
+
+@dataclass
+class RefreshChanges:
+    """Parts of the UI whose data changed in a refresh"""
+    observation: bool = True
+    days: Tuple[int, ...] = ()
+    chart: bool = True
+    hourly: bool = True
+
+    @property
+    def unchanged(self) -> bool:
+        return not (self.observation or self.days or self.chart or self.hourly)
+
+class ChangeDetector:
+    """Compares each refresh with the previous one"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget the previous refresh so everything counts as changed"""
+        self._observed = None
+        self._days: List[Tuple] = []
+        self._chart = None
+        self._hourly = None
+
+    def update(self, current: WeatherData, forecast: Optional[ForecastData] = None) -> RefreshChanges:
+        """Record a refresh and return what changed since the previous one"""
+        changes = RefreshChanges()
+
+        observed = (current.location, current.timestamp)
+        changes.observation = observed != self._observed
+        self._observed = observed
+
+        if forecast is not None:
+            days = day_keys(forecast.daily)
+            if len(days) != len(self._days):
+                changes.days = tuple(range(len(days)))
+            else:
+                changes.days = tuple(i for i, (new, old) in enumerate(zip(days, self._days))
+                                     if new != old)
+            chart = series_digest(forecast.daily, 'timestamps', 'temperature')
+            hourly = series_digest(forecast.hourly)
+            changes.chart = chart != self._chart
+            changes.hourly = hourly != self._hourly
+            self._days, self._chart, self._hourly = days, chart, hourly
+        return changes
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+@dataclass
+class FrigateEvent:
+    """Object detection event reported by Frigate"""
+    id: str
+    camera: str
+    label: str
+    start_time: float  # Epoch seconds
+    end_time: Optional[float] = None  # None while the object is still tracked
+    score: float = 0.0
+    has_snapshot: bool = False
+    has_clip: bool = False
+    zones: Tuple[str, ...] = ()
+
+    @property
+    def in_progress(self) -> bool:
+        return self.end_time is None
+
+    @classmethod
+    def from_api(cls, item: dict) -> 'FrigateEvent':
+        """Build an event from an ``/api/events`` item"""
+        # Newer Frigate versions report the score under ``data``
+        score = item.get('top_score')
+        if score is None:
+            score = (item.get('data') or {}).get('top_score', 0.0)
+        return cls(
+            id=item['id'],
+            camera=item['camera'],
+            label=item['label'],
+            start_time=float(item['start_time']),
+            end_time=float(item['end_time']) if item.get('end_time') is not None else None,
+            score=float(score or 0.0),
+            has_snapshot=bool(item.get('has_snapshot')),
+            has_clip=bool(item.get('has_clip')),
+            zones=tuple(item.get('zones') or ())
+        )
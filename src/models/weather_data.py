@@ -1,10 +1,15 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
 
 @dataclass
 class WeatherData:
     """Weather data model"""
+    # Slots keep per-instance memory down and make attribute access cheaper
+    __slots__ = ('temperature', 'feels_like', 'humidity', 'wind_speed', 'wind_deg',
+                 'pressure', 'description', 'timestamp', 'location', 'icon_code')
+
     temperature: float
     feels_like: float
     humidity: int
@@ -15,28 +20,194 @@ class WeatherData:
     timestamp: datetime
     location: str
     icon_code: str
-    
+
     def temperature_fahrenheit(self) -> float:
         """Convert temperature to Fahrenheit"""
         return (self.temperature * 9/5) + 32
-    
+
     def get_wind_direction(self) -> str:
         """Convert wind degrees to cardinal direction"""
         directions = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
                      'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
         index = round(self.wind_deg / 22.5) % 16
         return directions[index]
-    
+
     def get_pressure_trend(self) -> str:
-        """Get pressure trend indicator"""
+        """Get pressure relative to the 1013 hPa standard atmosphere.
+
+        This is not a tendency; see ``utils.pressure_tendency`` for the change
+        over time.
+        """
         if self.pressure > 1013:
             return "↑"  # High pressure
         elif self.pressure < 1013:
             return "↓"  # Low pressure
         return "→"  # Normal pressure
 
+class ForecastPoint:
+    """Row view into a ForecastSeries that behaves like WeatherData"""
+
+    __slots__ = ('_series', '_index')
+
+    def __init__(self, series: 'ForecastSeries', index: int):
+        self._series = series
+        self._index = index
+
+    @property
+    def temperature(self) -> float:
+        return round(float(self._series.temperature[self._index]), 2)
+
+    @property
+    def feels_like(self) -> float:
+        return round(float(self._series.feels_like[self._index]), 2)
+
+    @property
+    def humidity(self) -> int:
+        return int(self._series.humidity[self._index])
+
+    @property
+    def wind_speed(self) -> float:
+        return round(float(self._series.wind_speed[self._index]), 2)
+
+    @property
+    def wind_deg(self) -> int:
+        return int(self._series.wind_deg[self._index])
+
+    @property
+    def pressure(self) -> int:
+        return int(self._series.pressure[self._index])
+
+    @property
+    def description(self) -> str:
+        return self._series.conditions[self._series.condition_codes[self._index]][0]
+
+    @property
+    def icon_code(self) -> str:
+        return self._series.conditions[self._series.condition_codes[self._index]][1]
+
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(int(self._series.timestamps[self._index]))
+
+    @property
+    def location(self) -> str:
+        return self._series.location
+
+    # Share the behaviour of WeatherData rather than duplicating it
+    temperature_fahrenheit = WeatherData.temperature_fahrenheit
+    get_wind_direction = WeatherData.get_wind_direction
+    get_pressure_trend = WeatherData.get_pressure_trend
+
+    def to_weather_data(self) -> WeatherData:
+        """Materialise this row as a standalone WeatherData"""
+        return WeatherData(
+            temperature=self.temperature,
+            feels_like=self.feels_like,
+            humidity=self.humidity,
+            wind_speed=self.wind_speed,
+            wind_deg=self.wind_deg,
+            pressure=self.pressure,
+            description=self.description,
+            timestamp=self.timestamp,
+            location=self.location,
+            icon_code=self.icon_code
+        )
+
+    def __repr__(self) -> str:
+        return f"ForecastPoint({self.location!r}, {self.timestamp.isoformat()}, {self.temperature}°C)"
+
+class ForecastSeries:
+    """Columnar forecast series backed by NumPy arrays.
+
+    Timestamps are int64 epoch seconds, measurements are float32/int16 and the
+    (description, icon_code) pair of each point is an index into a small
+    per-series ``conditions`` table. Indexing or iterating yields ForecastPoint
+    views, so the series can be used wherever a list of WeatherData was.
+    """
+
+    def __init__(self, location: str, timestamps, temperature, feels_like, humidity,
+                 wind_speed, wind_deg, pressure, condition_codes,
+                 conditions: Sequence[Tuple[str, str]], precipitation=None, pop=None):
+        n = len(timestamps)
+        self.location = location
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.temperature = np.asarray(temperature, dtype=np.float32)
+        self.feels_like = np.asarray(feels_like, dtype=np.float32)
+        self.humidity = np.asarray(humidity, dtype=np.int16)
+        self.wind_speed = np.asarray(wind_speed, dtype=np.float32)
+        self.wind_deg = np.asarray(wind_deg, dtype=np.int16)
+        self.pressure = np.asarray(pressure, dtype=np.int16)
+        self.condition_codes = np.asarray(condition_codes, dtype=np.int16)
+        self.conditions = list(conditions)
+        # Precipitation (mm) and probability of precipitation (0-1)
+        self.precipitation = (np.zeros(n, dtype=np.float32) if precipitation is None
+                              else np.asarray(precipitation, dtype=np.float32))
+        self.pop = (np.zeros(n, dtype=np.float32) if pop is None
+                    else np.asarray(pop, dtype=np.float32))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ForecastPoint(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("forecast index out of range")
+        return ForecastPoint(self, index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield ForecastPoint(self, i)
+
+    def descriptions(self) -> List[str]:
+        """Get the description of every point"""
+        return [self.conditions[code][0] for code in self.condition_codes]
+
+    def datetimes(self) -> List[datetime]:
+        """Get the timestamp of every point as a datetime"""
+        return [datetime.fromtimestamp(ts) for ts in self.timestamps.tolist()]
+
+class PrecipitationSeries:
+    """Minute-level precipitation series (mm/h) from the One Call ``minutely`` block"""
+
+    def __init__(self, location: str, timestamps, precipitation):
+        self.location = location
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.precipitation = np.asarray(precipitation, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+@dataclass
+class GovernmentAlert:
+    """Official severe-weather alert from a national warning service"""
+    sender: str
+    event: str
+    start: int  # Epoch seconds
+    end: int    # Epoch seconds
+    description: str
+    tags: Tuple[str, ...] = ()
+
+    @property
+    def key(self) -> Tuple[str, str, int]:
+        """Identity of the alert across fetches"""
+        return (self.sender, self.event, self.start)
+
+    def is_active(self, now: float) -> bool:
+        """Whether the alert is in effect (or upcoming) at ``now``"""
+        return self.end >= now
+
 @dataclass
 class ForecastData:
     """Forecast data model"""
     location: str
-    daily_forecasts: List[WeatherData] 
\ No newline at end of file
+    daily: ForecastSeries
+    hourly: Optional[ForecastSeries] = None
+    minutely: Optional[PrecipitationSeries] = None
+
+    @property
+    def daily_forecasts(self) -> ForecastSeries:
+        """Daily forecasts as a sequence of WeatherData-like row views"""
+        return self.daily
@@ -1,39 +1,28 @@
-from typing import List
+from typing import List, Sequence
+import numpy as np
 from ..models.weather_data import WeatherData
-from ..utils.config import Config
+from ..utils.rule_engine import Rule, RuleEngine, PANEL_ALERTS
 
 class AlertService:
     """Service for checking weather alerts"""
-    
+
+    def __init__(self, engine: RuleEngine = None):
+        self.engine = engine or RuleEngine.shared()
+
+    def format_alerts(self, rules: Sequence[Rule], weather_data) -> List[str]:
+        """Format fired alert rules for display"""
+        return [f"{rule.icon} {rule.format_title(weather_data)}\n{rule.message}"
+                for rule in rules if rule.panel == PANEL_ALERTS]
+
     def check_alerts(self, weather_data) -> List[str]:
         """Check for weather alerts based on thresholds"""
-        alerts = []
-        
-        # Temperature alerts
-        if weather_data.temperature > Config.MAX_TEMP_THRESHOLD:
-            alerts.append(
-                f"⚠️ High temperature alert: {weather_data.temperature}°C\n"
-                "Stay hydrated and avoid prolonged sun exposure"
-            )
-        elif weather_data.temperature < Config.MIN_TEMP_THRESHOLD:
-            alerts.append(
-                f"❄️ Low temperature alert: {weather_data.temperature}°C\n"
-                "Dress warmly and watch for icy conditions"
-            )
-        
-        # Wind alerts
-        if weather_data.wind_speed > Config.SEVERE_WIND_THRESHOLD:
-            alerts.append(
-                f"💨 High wind alert: {weather_data.wind_speed} m/s\n"
-                "Secure loose objects and exercise caution outdoors"
-            )
-        
-        # Severe weather conditions
-        if any(condition in weather_data.description.lower() 
-               for condition in ['thunderstorm', 'tornado', 'hurricane']):
-            alerts.append(
-                "⛈️ Severe weather warning!\n"
-                "Stay indoors and follow local authority guidelines"
-            )
-        
-        return alerts 
\ No newline at end of file
+        return self.format_alerts(self.engine.evaluate(weather_data), weather_data)
+
+    def evaluate_series(self, *series_list) -> np.ndarray:
+        """Evaluate the alert rules over one or more ForecastSeries at once.
+
+        Returns the same compact table as WeatherWarnings.evaluate_series,
+        restricted to alert rules; ``rule`` indexes ``engine.rules``.
+        """
+        table = self.engine.evaluate_series(series_list)
+        return table[np.isin(table['rule'], self.engine.panel_rule_numbers(PANEL_ALERTS))]
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import time
+from ..utils.config import Config
+from ..utils.rule_engine import Rule, RuleEngine
+
+# Event kinds
+ALERT_RAISED = "raised"
+ALERT_CHANGED = "changed"
+ALERT_CLEARED = "cleared"
+
+@dataclass
+class AlertEvent:
+    """A change in the alert state of a location"""
+    kind: str                  # ALERT_RAISED, ALERT_CHANGED or ALERT_CLEARED
+    location: str
+    group: str
+    rule: Optional[Rule]       # Rule now in effect (None once cleared)
+    previous: Optional[Rule]   # Rule in effect before the change
+    timestamp: float
+
+@dataclass
+class ActiveAlert:
+    """Alert currently in effect for a (location, rule group)"""
+    rule: Rule
+    since: float
+
+class AlertTracker:
+    """Stateful alert tracker with hysteresis and minimum hold times.
+
+    Alerts are tracked per (location, rule group). A rule raises as soon as
+    the engine fires it, but an active rule only clears once its value has
+    fallen back past the threshold by the rule's hysteresis margin and it has
+    been held for at least ``min_hold`` seconds. ``update`` returns only the
+    transitions, so callers can redraw or notify on change instead of on
+    every refresh.
+    """
+
+    # Clear margins for rules that don't set their own hysteresis
+    DEFAULT_HYSTERESIS = {
+        'temperature': 1.0,   # °C
+        'feels_like': 1.0,    # °C
+        'wind_speed': 2.0,    # m/s
+        'humidity': 3.0,      # %
+        'pressure': 1.0,      # hPa
+    }
+
+    def __init__(self, engine: RuleEngine = None, min_hold: float = None):
+        self.engine = engine or RuleEngine.shared()
+        self.min_hold = Config.ALERT_MIN_HOLD if min_hold is None else min_hold
+        self._states: Dict[str, Dict[str, ActiveAlert]] = {}
+
+    def hysteresis_for(self, rule: Rule) -> float:
+        """Clear margin for a rule"""
+        if rule.hysteresis is not None:
+            return rule.hysteresis
+        return self.DEFAULT_HYSTERESIS.get(rule.field, 0.0)
+
+    def active(self, location: str) -> List[Rule]:
+        """Rules currently in effect for a location, in rule order"""
+        state = self._states.get(location, {})
+        order = {rule.id: i for i, rule in enumerate(self.engine.rules)}
+        return sorted((alert.rule for alert in state.values()),
+                      key=lambda rule: order.get(rule.id, len(order)))
+
+    def update(self, weather_data, now: float = None) -> List[AlertEvent]:
+        """Feed a new observation and get the resulting transitions"""
+        now = time.time() if now is None else now
+        location = weather_data.location
+        state = self._states.setdefault(location, {})
+        fired = {rule.group: rule for rule in self.engine.evaluate(weather_data)}
+        priority = {rule.id: i for i, rule in enumerate(self.engine.rules)}
+        events = []
+
+        for group in list(state.keys() | fired.keys()):
+            active = state.get(group)
+            candidate = fired.get(group)
+
+            if active is None:
+                state[group] = ActiveAlert(candidate, now)
+                events.append(AlertEvent(ALERT_RAISED, location, group, candidate, None, now))
+                continue
+
+            if candidate is not None and candidate.id == active.rule.id:
+                continue
+
+            # Escalating to an earlier (more important) rule in the group is immediate
+            escalating = (candidate is not None and
+                          priority.get(candidate.id, 0) < priority.get(active.rule.id, len(priority)))
+            if not escalating:
+                if active.rule.holds(weather_data, self.hysteresis_for(active.rule)):
+                    continue
+                if now - active.since < self.min_hold:
+                    continue
+
+            if candidate is None:
+                del state[group]
+                events.append(AlertEvent(ALERT_CLEARED, location, group, None, active.rule, now))
+            else:
+                state[group] = ActiveAlert(candidate, now)
+                events.append(AlertEvent(ALERT_CHANGED, location, group, candidate, active.rule, now))
+
+        return events
+
+    def reset(self, location: str = None):
+        """Forget the state of one location, or of all locations"""
+        if location is None:
+            self._states.clear()
+        else:
+            self._states.pop(location, None)
@@ -0,0 +1,77 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+import time
+from ..models.weather_data import GovernmentAlert
+from ..utils.weather_warnings import WeatherWarning, WeatherWarnings
+
+@dataclass
+class AlertDiff:
+    """Changes in official alerts between two fetches"""
+    new: List[GovernmentAlert] = field(default_factory=list)
+    updated: List[GovernmentAlert] = field(default_factory=list)
+    expired: List[GovernmentAlert] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.new or self.updated or self.expired)
+
+class GovernmentAlertFeed:
+    """Official alerts per location, diffed incrementally between fetches.
+
+    Alerts are identified by (sender, event, start). Only alerts that are new,
+    whose content changed, or that ended or were withdrawn are reported.
+    """
+
+    ICON = "📢"
+
+    def __init__(self):
+        self._alerts: Dict[str, Dict[Tuple[str, str, int], GovernmentAlert]] = {}
+
+    def update(self, location: str, alerts: List[GovernmentAlert], now: float = None) -> AlertDiff:
+        """Merge a fresh alerts block for a location and get what changed"""
+        now = time.time() if now is None else now
+        previous = self._alerts.get(location, {})
+        current = {alert.key: alert for alert in alerts if alert.is_active(now)}
+        diff = AlertDiff()
+
+        for key, alert in current.items():
+            known = previous.get(key)
+            if known is None:
+                diff.new.append(alert)
+            elif known != alert:
+                diff.updated.append(alert)
+
+        for key, alert in previous.items():
+            if key not in current:
+                diff.expired.append(alert)
+
+        self._alerts[location] = current
+        return diff
+
+    def active(self, location: str) -> List[GovernmentAlert]:
+        """Official alerts currently known for a location, by start time"""
+        return sorted(self._alerts.get(location, {}).values(), key=lambda alert: alert.start)
+
+    def warnings(self, location: str, start: float = None, end: float = None) -> List[WeatherWarning]:
+        """Official alerts as warnings, optionally limited to those overlapping [start, end]"""
+        warnings = []
+        for alert in self.active(location):
+            if start is not None and alert.end < start:
+                continue
+            if end is not None and alert.start > end:
+                continue
+            warnings.append(self.to_warning(alert))
+        return warnings
+
+    @classmethod
+    def to_warning(cls, alert: GovernmentAlert) -> WeatherWarning:
+        """Show an official alert in the warnings panel"""
+        summary = alert.description.split("\n\n")[0].replace("\n", " ")
+        if len(summary) > 200:
+            summary = summary[:197] + "..."
+        return WeatherWarning(
+            severity=WeatherWarnings.SEVERITY_HIGH,
+            title=f"{alert.event} ({alert.sender})" if alert.sender else alert.event,
+            message=summary,
+            icon=cls.ICON
+        )
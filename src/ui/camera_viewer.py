@@ -1,23 +1,27 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                            QPushButton, QFrame, QComboBox, QSizeGrip,
-                           QMainWindow)
-from PyQt5.QtCore import Qt, QTimer, QUrl, QSize, pyqtSignal
+                           QMainWindow, QSlider)
+from PyQt5.QtCore import Qt, QTimer, QUrl, QSize, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QPixmap, QResizeEvent
 from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest
+from datetime import datetime
+import threading
+from ..api.camera_registry import CameraRegistry
 from ..api.frigate_service import FrigateService
-from ..utils.styles import Styles
+from ..utils.config import Config
+from ..utils.tracing import traced
+from ..utils.metrics import REGISTRY
+from ..utils.motion_scheduler import shared_motion_scheduler
+from .decode_pool import decode_image, gray_thumbnail, shared_decode_pool
+from .event_strip import EventStrip
+
+FRAMES_DECODED = REGISTRY.counter('camera_frames_decoded', "Camera frames decoded for display", ('camera',))
 
 class ResizableLabel(QFrame):
     """A resizable and movable label for camera display"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(f"""
-            background-color: {Styles.BACKGROUND_COLOR};
-            border: 1px solid {Styles.BORDER_COLOR};
-            border-radius: 5px;
-            padding: 5px;
-        """)
         
         # Main layout
         layout = QVBoxLayout(self)
@@ -30,10 +34,6 @@ class ResizableLabel(QFrame):
         
         # Size grip in bottom-right corner
         self.size_grip = QSizeGrip(self)
-        self.size_grip.setStyleSheet(f"""
-            background-color: {Styles.PRIMARY_COLOR};
-            border-radius: 2px;
-        """)
         
         # Position size grip
         self.size_grip.setFixedSize(16, 16)
@@ -65,9 +65,12 @@ class FullscreenCameraWindow(QMainWindow):
         super().__init__(parent)
         self.camera_name = camera_name
         self.frigate_service = frigate_service
+        self.decode_pool = shared_decode_pool()
+        self.motion = shared_motion_scheduler()
         
         # Set window icon
-        self.setWindowIcon(parent.windowIcon())
+        if parent is not None:
+            self.setWindowIcon(parent.windowIcon())
         
         # Setup window properties
         self.setWindowTitle(f"Camera: {camera_name}")
@@ -83,6 +86,27 @@ class FullscreenCameraWindow(QMainWindow):
         self.camera_view.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.camera_view)
         
+        # Replay slider over the frames in the replay buffer; the right end is live
+        replay = QHBoxLayout()
+        self.replay_slider = QSlider(Qt.Horizontal)
+        self.replay_slider.setRange(0, 0)
+        self.replay_slider.valueChanged.connect(self.on_replay_moved)
+        replay.addWidget(self.replay_slider)
+        
+        self.replay_label = QLabel("Live")
+        self.replay_label.setMinimumWidth(70)
+        replay.addWidget(self.replay_label)
+        
+        self.live_btn = QPushButton("Live")
+        self.live_btn.clicked.connect(self.go_live)
+        replay.addWidget(self.live_btn)
+        
+        layout.addLayout(replay)
+        
+        # Frame times shown on the slider; frozen while scrubbing
+        self.replay_times = []
+        self.scrubbing = False
+        
         # Controls
         controls = QHBoxLayout()
         
@@ -96,10 +120,10 @@ class FullscreenCameraWindow(QMainWindow):
         
         layout.addLayout(controls)
         
-        # Faster refresh rate for fullscreen
+        # Refresh rate follows motion in the picture, starting at 1 second
         self.timer = QTimer()
         self.timer.timeout.connect(self.refresh_camera)
-        self.timer.start(1000)  # Refresh every 1 second
+        self.timer.start(1000)
         
         # Cache the last image to prevent flickering
         self.last_image = None
@@ -107,38 +131,103 @@ class FullscreenCameraWindow(QMainWindow):
         # Initial refresh
         self.refresh_camera()
     
+    @pyqtSlot()
+    @traced()
     def refresh_camera(self):
         """Refresh the camera view"""
         try:
+            # Fetched while scrubbing too, so the replay buffer has no gap
             image_data = self.frigate_service.get_camera_snapshot(self.camera_name)
-            if image_data:
-                pixmap = QPixmap()
-                pixmap.loadFromData(image_data)
-                if not pixmap.isNull():
-                    self.last_image = pixmap
-                    scaled = pixmap.scaled(
-                        self.camera_view.size(),
-                        Qt.KeepAspectRatio,
-                        Qt.FastTransformation  # Faster scaling
-                    )
-                    self.camera_view.setPixmap(scaled)
+            if image_data and not self.scrubbing:
+                self.update_replay_slider()
+                # Decoded straight to the view size, off the GUI thread when a pool is configured
+                self.decode_pool.submit((id(self), self.camera_name), image_data,
+                                        self.camera_view.size(), self.show_frame)
         except Exception as e:
             print(f"Error refreshing camera: {e}")
     
+    def show_frame(self, image, live=True):
+        """Display a decoded snapshot unless it no longer matches the live/replay mode"""
+        FRAMES_DECODED.inc(camera=self.camera_name)
+        if image.isNull():
+            return
+        if live:
+            # Scored even while scrubbing, so the live rate keeps following motion
+            key = (id(self), self.camera_name)
+            self.motion.observe(key, gray_thumbnail(image), camera=self.camera_name)
+            self.timer.setInterval(int(self.motion.interval(key) * 1000))
+        if live == (not self.scrubbing):
+            pixmap = QPixmap.fromImage(image)
+            self.last_image = pixmap
+            self.camera_view.setPixmap(pixmap)
+    
+    def update_replay_slider(self):
+        """Extend the slider to the frames now in the replay buffer and pin it to live"""
+        self.replay_times = self.frigate_service.replay.timestamps(self.camera_name)
+        self.replay_slider.blockSignals(True)
+        self.replay_slider.setRange(0, max(0, len(self.replay_times) - 1))
+        self.replay_slider.setValue(self.replay_slider.maximum())
+        self.replay_slider.blockSignals(False)
+        self.replay_label.setText("Live")
+    
+    @pyqtSlot(int)
+    def on_replay_moved(self, index):
+        """Show the buffered frame under the slider, or go live at its right end"""
+        if index >= self.replay_slider.maximum():
+            self.go_live()
+            return
+        self.scrubbing = True
+        self.show_replay_frame(index)
+    
+    def show_replay_frame(self, index):
+        """Decode just the frame at ``index`` of the frozen slider range"""
+        if not 0 <= index < len(self.replay_times):
+            return
+        timestamp = self.replay_times[index]
+        self.replay_label.setText(datetime.fromtimestamp(timestamp).strftime('%H:%M:%S'))
+        data = self.frigate_service.replay.frame(self.camera_name, timestamp)
+        if data is None:
+            # Overwritten since the slider range was taken
+            self.replay_label.setText("Expired")
+            return
+        # Keyed separately from live frames; fast scrubbing only decodes the latest position
+        self.decode_pool.submit((id(self), 'replay'), data, self.camera_view.size(),
+                                lambda image: self.show_frame(image, live=False))
+    
+    @pyqtSlot()
+    def go_live(self):
+        """Leave replay and resume the live feed"""
+        self.scrubbing = False
+        self.refresh_camera()
+    
+    def closeEvent(self, event):
+        """Stop polling and hand this window's share of the frame budget back"""
+        self.timer.stop()
+        self.motion.forget((id(self), self.camera_name))
+        super().closeEvent(event)
+    
     def resizeEvent(self, event):
         """Handle window resize events"""
         super().resizeEvent(event)
-        if self.camera_view.pixmap():
+        if self.scrubbing:
+            self.show_replay_frame(self.replay_slider.value())
+        elif self.camera_view.pixmap():
             self.refresh_camera()
 
 class CameraViewer(QFrame):
     """Widget to display Frigate cameras"""
     
+    # Emitted from the registry refresh and event poll threads; delivered on the GUI thread
+    cameras_changed = pyqtSignal(object)
+    events_polled = pyqtSignal(object)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(Styles.CAMERA_VIEWER)
         
         self.frigate_service = FrigateService()
+        self.camera_registry = CameraRegistry(self.frigate_service)
+        self.decode_pool = shared_decode_pool()
+        self.motion = shared_motion_scheduler()
         self.current_camera = None
         self.fullscreen_window = None  # Store reference to fullscreen window
         
@@ -152,10 +241,7 @@ class CameraViewer(QFrame):
         
         # Title
         title = QLabel("Security Camera")
-        title.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-        """)
+        title.setObjectName("sectionTitle")
         header.addWidget(title)
         
         # Camera selector
@@ -184,29 +270,85 @@ class CameraViewer(QFrame):
         self.camera_view.mouseDoubleClickEvent = self.on_double_click
         layout.addWidget(self.camera_view)
         
-        # Load cameras
-        self.load_cameras()
+        # Latest detection events for the selected camera
+        self.event_strip = EventStrip(self.frigate_service)
+        layout.addWidget(self.event_strip)
         
-        # Faster refresh for thumbnail
+        # Refresh rate follows motion in the picture, starting at 2 seconds
         self.timer = QTimer()
         self.timer.timeout.connect(self.refresh_camera)
-        self.timer.start(2000)  # Refresh every 2 seconds
+        self.timer.start(2000)
         
-        # Cache the last image
+        # Cache the last image, and the snapshot it came from for the saved UI state
         self.last_image = None
+        self.last_snapshot = None
+        
+        # Start from the cached camera list and refresh it in the background
+        self.load_cameras()
+        self.cameras_changed.connect(self.apply_camera_diff)
+        self.camera_timer = QTimer()
+        self.camera_timer.timeout.connect(self.refresh_cameras)
+        self.camera_timer.start(int(Config.FRIGATE_CAMERA_INTERVAL * 1000))
+        self.refresh_cameras()
+        
+        # Poll for new detection events
+        self.events_polled.connect(self.event_strip.show_changes)
+        self.event_timer = QTimer()
+        self.event_timer.timeout.connect(self.poll_events)
+        if Config.FRIGATE_EVENT_INTERVAL > 0:
+            self.event_timer.start(int(Config.FRIGATE_EVENT_INTERVAL * 1000))
     
     def load_cameras(self):
-        """Load available cameras"""
-        cameras = self.frigate_service.get_cameras()
+        """Fill the selector from the cached camera list"""
         self.camera_selector.clear()
-        for camera in cameras:
+        self.camera_selector.addItems(self.camera_registry.names())
+    
+    def refresh_cameras(self):
+        """Refresh the camera list on a worker thread"""
+        threading.Thread(target=lambda: self.cameras_changed.emit(self.camera_registry.refresh()),
+                         name="camera-registry", daemon=True).start()
+    
+    @pyqtSlot(object)
+    def apply_camera_diff(self, diff):
+        """Add and remove selector entries without rebuilding the list"""
+        for camera in diff.removed:
+            index = self.camera_selector.findText(camera['name'])
+            if index >= 0:
+                self.camera_selector.removeItem(index)
+        for camera in diff.added:
             self.camera_selector.addItem(camera['name'])
     
     def on_camera_changed(self, camera_name):
         """Handle camera selection change"""
+        self.motion.forget((id(self), self.current_camera))
         self.current_camera = camera_name
-        self.refresh_camera()
+        self.last_snapshot = None
+        self.event_strip.set_camera(camera_name)
+        # Fetched once the event loop runs, so startup never waits on Frigate
+        QTimer.singleShot(0, self.refresh_camera)
+    
+    def restore_frame(self, camera, data):
+        """Select a camera and show a saved snapshot of it until a fresh one arrives"""
+        index = self.camera_selector.findText(camera)
+        if index < 0:
+            return
+        self.camera_selector.setCurrentIndex(index)
+        image = decode_image(data, self.camera_view.size())
+        if not image.isNull():
+            self.last_snapshot = data
+            self.last_image = QPixmap.fromImage(image)
+            self.camera_view.setPixmap(self.last_image)
     
+    @pyqtSlot()
+    def poll_events(self):
+        """Fetch events since the last poll on a worker thread; the strip updates when it is done"""
+        if not self.current_camera:
+            return
+        threading.Thread(target=lambda: self.events_polled.emit(self.frigate_service.poll_events()),
+                         name="frigate-events", daemon=True).start()
+    
+    @pyqtSlot()
+    @traced()
     def refresh_camera(self):
         """Refresh the camera view"""
         if not self.current_camera:
@@ -215,16 +357,26 @@ class CameraViewer(QFrame):
         try:
             image_data = self.frigate_service.get_camera_snapshot(self.current_camera)
             if image_data:
-                pixmap = QPixmap()
-                pixmap.loadFromData(image_data)
-                if not pixmap.isNull():
-                    self.last_image = pixmap
-                    self.camera_view.setPixmap(pixmap)
+                camera = self.current_camera
+                self.last_snapshot = image_data
+                self.decode_pool.submit((id(self), camera), image_data, self.camera_view.size(),
+                                        lambda image: self.show_frame(camera, image))
         except Exception as e:
             if self.last_image:  # Use cached image if refresh fails
                 self.camera_view.setPixmap(self.last_image)
             print(f"Error refreshing camera: {e}")
     
+    def show_frame(self, camera, image):
+        """Display a decoded snapshot unless another camera was selected meanwhile"""
+        FRAMES_DECODED.inc(camera=camera)
+        if camera == self.current_camera and not image.isNull():
+            key = (id(self), camera)
+            self.motion.observe(key, gray_thumbnail(image), camera=camera)
+            self.timer.setInterval(int(self.motion.interval(key) * 1000))
+            pixmap = QPixmap.fromImage(image)
+            self.last_image = pixmap
+            self.camera_view.setPixmap(pixmap)
+    
     def show_fullscreen(self):
         """Show the current camera in a fullscreen window"""
         if self.current_camera:
@@ -244,4 +396,4 @@ class CameraViewer(QFrame):
     def resizeEvent(self, event):
         """Handle widget resize events"""
         super().resizeEvent(event)
-        self.refresh_camera() 
\ No newline at end of file
+        QTimer.singleShot(0, self.refresh_camera) 
\ No newline at end of file
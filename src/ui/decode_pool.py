@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Optional, Set, Tuple
+import os
+import numpy as np
+from PyQt5.QtCore import Qt, QObject, QBuffer, QByteArray, QIODevice, QSize, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QImage, QImageReader
+from ..utils.config import Config
+from ..utils.metrics import REGISTRY
+from ..utils.motion_scheduler import THUMBNAIL_SIZE
+from ..utils.tracing import span
+
+DECODE_LATENCY = REGISTRY.histogram('camera_decode_seconds', "Snapshot decode time", ('backend',),
+                                    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25))
+FRAMES_DROPPED = REGISTRY.counter('camera_frames_dropped', "Snapshots replaced before they were decoded")
+
+def decode_image(data: bytes, size: QSize = None) -> QImage:
+    """Decode image bytes, letting the JPEG decoder scale down to fit ``size``.
+
+    Decoding straight to tile size with ``QImageReader.setScaledSize`` uses
+    libjpeg's reduced-resolution decoding, several times faster than a full
+    decode followed by a resize. Works off the GUI thread, and PyQt releases
+    the GIL while Qt decodes.
+    """
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QIODevice.ReadOnly)
+    reader = QImageReader(buffer)
+    source = reader.size()
+    if size is not None and size.isValid() and source.isValid():
+        target = source.scaled(size, Qt.KeepAspectRatio)
+        if target.width() < source.width():
+            reader.setScaledSize(target)
+    return reader.read()
+
+def gray_thumbnail(image: QImage, side: int = THUMBNAIL_SIZE) -> np.ndarray:
+    """Small grayscale copy of a decoded frame for motion scoring"""
+    small = image.scaled(side, side, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    small = small.convertToFormat(QImage.Format_Grayscale8)
+    # Rows are padded to 32-bit boundaries
+    data = np.frombuffer(small.constBits().asstring(small.bytesPerLine() * side), np.uint8)
+    return data.reshape(side, small.bytesPerLine())[:, :side].copy()
+
+class DecodePool(QObject):
+    """Decodes camera snapshots on worker threads.
+
+    ``submit`` returns at once and the callback runs on the GUI thread with
+    the decoded QImage, which is handed over without copying. Each key (one
+    camera in one view) has at most one decode in flight; a newer snapshot
+    replaces one still waiting, so slow decoding drops frames instead of
+    building a backlog. With no workers, decoding happens inline.
+    """
+
+    _finished = pyqtSignal(object)
+
+    def __init__(self, workers: int = None, parent=None):
+        super().__init__(parent)
+        workers = Config.CAMERA_DECODE_WORKERS if workers is None else workers
+        if workers < 0:
+            workers = os.cpu_count() or 1
+        self.workers = workers
+        self.executor = (ThreadPoolExecutor(workers, thread_name_prefix="decode")
+                         if workers > 0 else None)
+        self._busy: Set[Hashable] = set()
+        self._waiting: Dict[Hashable, Tuple[bytes, Optional[QSize], Callable]] = {}
+        self._finished.connect(self._deliver)
+
+    def submit(self, key: Hashable, data: bytes, size: QSize, callback: Callable[[QImage], None]):
+        """Decode ``data`` to fit ``size`` and pass the image to ``callback``"""
+        if self.executor is None:
+            callback(self._decode(data, size, 'inline'))
+            return
+        if key in self._busy:
+            if key in self._waiting:
+                FRAMES_DROPPED.inc()
+            self._waiting[key] = (data, size, callback)
+            return
+        self._busy.add(key)
+        future = self.executor.submit(self._decode, data, size, 'pool')
+        future.add_done_callback(lambda done: self._finished.emit((key, done, callback)))
+
+    def _decode(self, data: bytes, size: QSize, backend: str) -> QImage:
+        with DECODE_LATENCY.time(backend=backend), span("decode snapshot", "camera"):
+            return decode_image(data, size)
+
+    @pyqtSlot(object)
+    def _deliver(self, result):
+        """Runs on the GUI thread once a worker has finished"""
+        key, future, callback = result
+        self._busy.discard(key)
+        waiting = self._waiting.pop(key, None)
+        if waiting is not None:
+            self.submit(key, *waiting)
+
+        try:
+            image = future.result()
+        except Exception as e:
+            print(f"Error decoding snapshot: {e}")
+            return
+        callback(image)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+_shared_pool = None
+
+def shared_decode_pool() -> DecodePool:
+    """Decode pool shared by all camera views"""
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = DecodePool()
+    return _shared_pool
@@ -0,0 +1,85 @@
+from collections import deque
+import sys
+import threading
+import time
+import traceback
+from PyQt5.QtCore import Qt, QObject, QTimer
+from ..utils.config import Config
+from ..utils.metrics import REGISTRY
+
+LOOP_LAG = REGISTRY.histogram('event_loop_lag_seconds', "Lateness of the GUI heartbeat timer",
+                              buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0))
+STALLS = REGISTRY.counter('event_loop_stalls', "GUI event loop stalls past the threshold")
+STALL_DURATION = REGISTRY.histogram('event_loop_stall_seconds', "Duration of GUI event loop stalls")
+
+class EventLoopWatchdog(QObject):
+    """Detects GUI event-loop stalls and reports where the GUI thread was blocked.
+
+    A heartbeat timer on the GUI thread records when it last ran. A monitor
+    thread checks the heartbeat and, once it is older than ``threshold``,
+    captures the GUI thread's Python stack while it is still blocked. When
+    the event loop recovers the stall is logged with its duration and the
+    captured stack.
+    """
+
+    def __init__(self, parent=None, threshold: float = None, interval: float = 0.1):
+        super().__init__(parent)
+        self.threshold = Config.EVENT_LOOP_STALL_THRESHOLD if threshold is None else threshold
+        self.interval = interval
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stall_stack = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._monitor = None
+        self.recent_lags = deque(maxlen=50)  # Seconds, most recent last
+
+        self.heartbeat = QTimer(self)
+        self.heartbeat.setTimerType(Qt.PreciseTimer)
+        self.heartbeat.setInterval(int(interval * 1000))
+        self.heartbeat.timeout.connect(self.beat)
+
+    def start(self):
+        """Start the heartbeat and the monitor thread"""
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self.heartbeat.start()
+        self._monitor = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._monitor.start()
+
+    def stop(self):
+        self.heartbeat.stop()
+        self._stop.set()
+
+    def beat(self):
+        """Heartbeat on the GUI thread"""
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._last_beat
+            self._last_beat = now
+            stack, self._stall_stack = self._stall_stack, None
+
+        lag = max(0.0, elapsed - self.interval)
+        self.recent_lags.append(lag)
+        LOOP_LAG.observe(lag)
+        if elapsed >= self.threshold:
+            self.report_stall(elapsed, stack)
+
+    def report_stall(self, duration: float, stack):
+        """Log a stall with the stack captured while it was happening"""
+        STALLS.inc()
+        STALL_DURATION.observe(duration)
+        location = "".join(stack) if stack else "  (stack not captured)\n"
+        print(f"Event loop stalled for {duration:.2f}s; GUI thread was at:\n{location}",
+              file=sys.stderr)
+
+    def _watch(self):
+        """Monitor thread: capture the GUI stack once per stall"""
+        while not self._stop.wait(self.interval / 2):
+            with self._lock:
+                stalled = time.monotonic() - self._last_beat >= self.threshold
+                if not stalled or self._stall_stack is not None:
+                    continue
+                frame = sys._current_frames().get(self._gui_thread_id)
+                if frame is not None:
+                    self._stall_stack = traceback.format_stack(frame)
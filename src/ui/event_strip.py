@@ -0,0 +1,175 @@
+from datetime import datetime
+from typing import Dict, List
+from PyQt5.QtWidgets import QScrollArea, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QFrame
+from PyQt5.QtCore import Qt, QSize, QTimer, QUrl, pyqtSlot
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+from ..api.frigate_service import ERRORS
+from ..models.frigate_event import FrigateEvent
+from .decode_pool import shared_decode_pool
+
+# Milliseconds before a thumbnail download is abandoned
+THUMBNAIL_TIMEOUT = 2000
+
+class EventTile(QFrame):
+    """Thumbnail and caption for one detection event"""
+
+    THUMBNAIL_SIZE = (64, 40)
+
+    def __init__(self, event: FrigateEvent, parent=None):
+        super().__init__(parent)
+        self.event = event
+        self.thumbnail_requested = False
+        self.setFixedSize(76, 66)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(2, 2, 2, 2)
+        layout.setSpacing(1)
+
+        self.thumbnail_label = QLabel()
+        self.thumbnail_label.setFixedSize(*self.THUMBNAIL_SIZE)
+        self.thumbnail_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.thumbnail_label, alignment=Qt.AlignHCenter)
+
+        self.caption = QLabel()
+        self.caption.setObjectName("eventCaption")
+        self.caption.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.caption)
+        self.set_event(event)
+
+    def set_event(self, event: FrigateEvent):
+        """Show updated details of the same event"""
+        self.event = event
+        started = datetime.fromtimestamp(event.start_time).strftime('%H:%M')
+        self.caption.setText(f"{event.label} {started}")
+        zones = f"\nZones: {', '.join(event.zones)}" if event.zones else ""
+        state = "in progress" if event.in_progress else "ended"
+        self.setToolTip(f"{event.label.title()} on {event.camera} ({event.score:.0%}, {state}){zones}")
+
+class EventStrip(QScrollArea):
+    """Horizontally scrolling strip of the latest detection events for one camera.
+
+    Thumbnails are only requested for tiles that are scrolled into view. They
+    are downloaded with QNetworkAccessManager and decoded on the decode pool,
+    so the GUI thread never waits on Frigate.
+    """
+
+    MAX_TILES = 30
+
+    def __init__(self, frigate_service, parent=None):
+        super().__init__(parent)
+        self.frigate_service = frigate_service
+        self.camera = None
+        self.tiles: Dict[str, EventTile] = {}
+        self.decode_pool = shared_decode_pool()
+        self.network_manager = QNetworkAccessManager(self)
+        self.network_manager.finished.connect(self.handle_thumbnail_response)
+
+        self.setWidgetResizable(True)
+        self.setFixedHeight(84)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.viewport().setAutoFillBackground(False)
+
+        contents = QWidget()
+        contents.setObjectName("eventStripContents")
+        self.tiles_layout = QHBoxLayout(contents)
+        self.tiles_layout.setContentsMargins(0, 0, 0, 0)
+        self.tiles_layout.setSpacing(4)
+        self.tiles_layout.addStretch()
+        self.setWidget(contents)
+        self.horizontalScrollBar().valueChanged.connect(self.load_visible_thumbnails)
+
+    def set_camera(self, camera: str):
+        self.camera = camera
+        self.refresh()
+
+    @pyqtSlot(object)
+    def show_changes(self, changed: List[FrigateEvent]):
+        """Update the strip after a poll if any event belongs to the shown camera"""
+        if any(event.camera == self.camera for event in changed):
+            self.refresh()
+
+    def refresh(self):
+        """Show the newest events, reusing tiles (and their thumbnails) for known events"""
+        events = self.frigate_service.events.recent(self.camera, limit=self.MAX_TILES) if self.camera else []
+
+        order = list(self.tiles)
+        tiles = {}
+        for event in events:
+            tile = self.tiles.pop(event.id, None)
+            if tile is None:
+                tile = EventTile(event)
+            elif tile.event != event:
+                tile.set_event(event)
+            tiles[event.id] = tile
+        for tile in self.tiles.values():
+            tile.setParent(None)
+        self.tiles = tiles
+
+        # Re-order newest first, keeping the trailing stretch
+        if list(tiles) != order:
+            for index, tile in enumerate(tiles.values()):
+                self.tiles_layout.removeWidget(tile)
+                self.tiles_layout.insertWidget(index, tile)
+        # Once the layout has placed the tiles
+        QTimer.singleShot(0, self.load_visible_thumbnails)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        QTimer.singleShot(0, self.load_visible_thumbnails)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        QTimer.singleShot(0, self.load_visible_thumbnails)
+
+    @pyqtSlot()
+    def load_visible_thumbnails(self):
+        """Request thumbnails for the tiles in view that have not asked for one yet"""
+        if not self.isVisible():
+            return
+        # Tiles have a fixed width, so their position follows from their index
+        # even before the layout has placed them
+        left = self.horizontalScrollBar().value()
+        right = left + self.viewport().width()
+        for index, (event_id, tile) in enumerate(self.tiles.items()):
+            start = index * (tile.width() + self.tiles_layout.spacing())
+            if start >= right:
+                break
+            if start + tile.width() > left and not tile.thumbnail_requested and tile.event.has_snapshot:
+                tile.thumbnail_requested = True
+                self.load_thumbnail(event_id)
+
+    def load_thumbnail(self, event_id: str):
+        """Show a cached thumbnail, or start downloading it"""
+        data = self.frigate_service.thumbnails.get(event_id)
+        if data:
+            self.decode_thumbnail(event_id, data)
+            return
+        request = QNetworkRequest(QUrl(self.frigate_service.event_thumbnail_url(event_id)))
+        for name, value in self.frigate_service.headers.items():
+            request.setRawHeader(name.encode(), value.encode())
+        request.setAttribute(QNetworkRequest.User, event_id)
+        request.setTransferTimeout(THUMBNAIL_TIMEOUT)
+        self.network_manager.get(request)
+
+    def handle_thumbnail_response(self, reply: QNetworkReply):
+        """Cache a downloaded thumbnail and decode it"""
+        event_id = reply.request().attribute(QNetworkRequest.User)
+        if reply.error() == QNetworkReply.NoError:
+            data = bytes(reply.readAll())
+            self.frigate_service.cache_thumbnail(event_id, data)
+            self.decode_thumbnail(event_id, data)
+        else:
+            ERRORS.inc(endpoint='thumbnail')
+            print(f"Error getting event thumbnail: {reply.errorString()}")
+        reply.deleteLater()
+
+    def decode_thumbnail(self, event_id: str, data: bytes):
+        self.decode_pool.submit((id(self), event_id), data, QSize(*EventTile.THUMBNAIL_SIZE),
+                                lambda image: self.show_thumbnail(event_id, image))
+
+    def show_thumbnail(self, event_id: str, image):
+        """Display a decoded thumbnail if its tile is still shown"""
+        tile = self.tiles.get(event_id)
+        if tile is not None and not image.isNull():
+            tile.thumbnail_label.setPixmap(QPixmap.fromImage(image))
@@ -2,21 +2,21 @@ from PyQt5.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QGridLayou
 from PyQt5.QtCore import Qt, QUrl, pyqtSignal
 from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest
 from PyQt5.QtGui import QPixmap
-from ..utils.styles import Styles
 from ..models.weather_data import WeatherData
 from ..utils.resources import Resources
+from ..utils.tracing import traced
 
 class ForecastCard(QFrame):
     """Widget to display a daily forecast"""
     
     # Add signal for click events
-    clicked = pyqtSignal(WeatherData)
+    clicked = pyqtSignal(object)  # WeatherData or a forecast row view
     
-    def __init__(self, forecast: WeatherData, parent=None):
+    def __init__(self, forecast: WeatherData, pressure_trend: str = "–", parent=None):
         super().__init__(parent)
-        self.setStyleSheet(Styles.FORECAST_CARD)
         self.setFixedWidth(150)
         self.forecast = forecast
+        self.pressure_trend = pressure_trend
         self.is_selected = False  # Track selection state
         
         # Make the card look clickable
@@ -113,7 +113,7 @@ class ForecastCard(QFrame):
         pressure_value.setObjectName("forecastDetailValue")
         pressure_layout.addWidget(pressure_value)
         
-        pressure_trend = QLabel(f"{forecast.get_pressure_trend()}")
+        pressure_trend = QLabel(pressure_trend)
         pressure_trend.setObjectName("forecastDetailSecondary")
         pressure_layout.addWidget(pressure_trend)
         
@@ -121,9 +121,10 @@ class ForecastCard(QFrame):
         
         layout.addLayout(details_layout)
         
+    @traced("ForecastCard.load_icon")
     def load_icon(self, icon_code: str):
-        """Load weather icon"""
-        icon_data = Resources.download_icon(icon_code)
+        """Show the weather icon (downloaded beforehand on the fetch thread)"""
+        icon_data = Resources.cached_icon(icon_code)
         if icon_data:
             pixmap = QPixmap()
             pixmap.loadFromData(icon_data)
@@ -132,23 +133,15 @@ class ForecastCard(QFrame):
                 self.icon_label.setPixmap(pixmap)
 
     def enterEvent(self, event):
-        """Handle mouse enter events"""
+        """Handle mouse enter events (the border comes from ForecastCard:hover)"""
         if not self.is_selected:
             self.spacer.setFixedWidth(10)  # Add indent on hover
-            self.setStyleSheet(f"""
-                {Styles.FORECAST_CARD}
-                QFrame {{
-                    background-color: {Styles.CARD_COLOR};
-                    border: 1px solid {Styles.PRIMARY_COLOR};
-                }}
-            """)
         super().enterEvent(event)
     
     def leaveEvent(self, event):
         """Handle mouse leave events"""
         if not self.is_selected:
             self.spacer.setFixedWidth(0)  # Remove indent
-            self.setStyleSheet(Styles.FORECAST_CARD)
         super().leaveEvent(event)
     
     def mousePressEvent(self, event):
@@ -160,15 +153,9 @@ class ForecastCard(QFrame):
     def set_selected(self, selected: bool):
         """Set the selected state of the card"""
         self.is_selected = selected
-        if selected:
-            self.spacer.setFixedWidth(15)  # Larger indent for selection
-            self.setStyleSheet(f"""
-                {Styles.FORECAST_CARD}
-                QFrame {{
-                    background-color: {Styles.CARD_COLOR};
-                    border: 1px solid {Styles.PRIMARY_COLOR};
-                }}
-            """)
-        else:
-            self.spacer.setFixedWidth(0)
-            self.setStyleSheet(Styles.FORECAST_CARD) 
\ No newline at end of file
+        self.spacer.setFixedWidth(15 if selected else 0)  # Larger indent for selection
+        
+        # Re-match the ForecastCard[selected="true"] rule for this card only
+        self.setProperty("selected", selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
@@ -0,0 +1,121 @@
+from datetime import datetime
+from typing import Dict, Optional
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from PyQt5.QtCore import QTimer
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+from matplotlib.figure import Figure
+from ..models.weather_data import ForecastSeries
+from ..utils.downsample import lttb_indices
+from ..utils.styles import Styles
+
+class HourlyForecastView(QWidget):
+    """Hourly temperature chart that downsamples each series to the pixel width"""
+
+    # Line colors for additional cities
+    SERIES_COLORS = [Styles.PRIMARY_COLOR, Styles.ACCENT_COLOR, "#03DAC6", "#FB8C00", "#FDD835"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.series: Dict[str, ForecastSeries] = {}
+        self.lines = {}
+        self.observed: Optional[ForecastSeries] = None
+        self.observed_line = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.figure = Figure(figsize=(8, 3))
+        self.figure.patch.set_facecolor(Styles.BACKGROUND_COLOR)
+        self.canvas = FigureCanvasQTAgg(self.figure)
+        self.canvas.setMinimumHeight(200)
+        layout.addWidget(self.canvas)
+
+        self.ax = self.figure.add_subplot(111)
+        self.style_axes()
+
+        # Re-downsample once resizing settles instead of on every resize event
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(150)
+        self.resize_timer.timeout.connect(self.redraw)
+
+    def style_axes(self):
+        """Apply the app's dark theme to the axes"""
+        ax = self.ax
+        ax.set_facecolor(Styles.GRAPH_BG)
+        ax.xaxis_date()
+        ax.set_ylabel("Temperature (°C)", fontsize=12, color=Styles.TEXT_COLOR)
+        ax.grid(True, linestyle='--', alpha=0.3, color=Styles.GRAPH_GRID)
+        for spine in ax.spines.values():
+            spine.set_color(Styles.BORDER_COLOR)
+        ax.tick_params(axis='both', colors=Styles.TEXT_COLOR)
+
+    def set_forecast(self, forecast_data, observed: ForecastSeries = None):
+        """Show the hourly series of a single forecast, optionally after recent observations"""
+        if forecast_data.hourly is None or not len(forecast_data.hourly):
+            self.set_series({})
+            return
+        self.set_series({forecast_data.location: forecast_data.hourly}, observed)
+
+    def set_series(self, series: Dict[str, ForecastSeries], observed: ForecastSeries = None):
+        """Show one hourly series per location and an optional observed series"""
+        self.series = dict(series)
+        for line in self.lines.values():
+            line.remove()
+        self.lines = {}
+        if self.observed_line is not None:
+            self.observed_line.remove()
+            self.observed_line = None
+
+        self.observed = observed if observed is not None and len(observed) else None
+        if self.observed is not None:
+            self.observed_line, = self.ax.plot([], [], color=Styles.SECONDARY_TEXT, linewidth=1.5,
+                                               linestyle='--', label="Observed")
+
+        for i, (location, data) in enumerate(self.series.items()):
+            color = self.SERIES_COLORS[i % len(self.SERIES_COLORS)]
+            line, = self.ax.plot([], [], color=color, linewidth=2, label=location)
+            self.lines[location] = line
+
+        legend = self.ax.get_legend()
+        if legend:
+            legend.remove()
+        if len(self.series) > 1 or self.observed is not None:
+            self.ax.legend(facecolor=Styles.CARD_COLOR, labelcolor=Styles.TEXT_COLOR,
+                           edgecolor=Styles.BORDER_COLOR)
+
+        title = "48-Hour Forecast"
+        if len(self.series) == 1:
+            title += f" for {next(iter(self.series))}"
+        self.ax.set_title(title, fontsize=14, pad=20, color=Styles.TEXT_COLOR)
+        self.redraw()
+
+    def target_points(self) -> int:
+        """Number of points worth drawing at the current canvas width"""
+        return max(3, int(self.canvas.width() * self.canvas.devicePixelRatioF()))
+
+    def redraw(self):
+        """Downsample every series to the canvas width and redraw"""
+        threshold = self.target_points()
+        for location, data in self.series.items():
+            indices = lttb_indices(data.timestamps, data.temperature, threshold)
+            times = [datetime.fromtimestamp(ts) for ts in data.timestamps[indices].tolist()]
+            self.lines[location].set_data(times, data.temperature[indices])
+
+        if self.observed is not None:
+            data = self.observed
+            indices = lttb_indices(data.timestamps, data.temperature, threshold)
+            times = [datetime.fromtimestamp(ts) for ts in data.timestamps[indices].tolist()]
+            self.observed_line.set_data(times, data.temperature[indices])
+
+        if self.series:
+            self.ax.relim()
+            self.ax.autoscale_view()
+        self.figure.autofmt_xdate()
+        self.canvas.draw_idle()
+
+    def resizeEvent(self, event):
+        """Handle resize events"""
+        super().resizeEvent(event)
+        if self.series:
+            self.resize_timer.start()
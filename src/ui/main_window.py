@@ -1,59 +1,80 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                           QLabel, QLineEdit, QPushButton, QFrame, QGridLayout, QScrollArea, QSplitter)
-from PyQt5.QtCore import Qt, QTimer, QUrl, QPropertyAnimation, QEasingCurve, QSequentialAnimationGroup, QVariantAnimation
-from PyQt5.QtGui import QPixmap, QFont, QPalette, QColor, QIcon
+                           QLabel, QLineEdit, QPushButton, QFrame, QGridLayout, QScrollArea, QSplitter,
+                           QTabWidget, QSystemTrayIcon, QShortcut, QApplication, QStackedWidget)
+from PyQt5.QtCore import Qt, QTimer, QUrl, QBuffer, QByteArray, QIODevice, pyqtSignal, pyqtSlot, QPropertyAnimation, QEasingCurve, QSequentialAnimationGroup, QVariantAnimation
+from PyQt5.QtGui import QPixmap, QFont, QPalette, QColor, QIcon, QKeySequence, QPainter, QPen, QRegion
 from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+import threading
+import time
 import matplotlib
 matplotlib.use('Qt5Agg')  # Must be called before importing pyplot
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
 from ..api.weather_service import WeatherService
+from ..models.change_detection import ChangeDetector, weather_key
 from ..notifications.alert_service import AlertService
+from ..notifications.alert_tracker import AlertTracker, ALERT_CLEARED
+from ..notifications.government_alerts import GovernmentAlertFeed
+from ..utils.config import Config
 from ..utils.resources import Resources
 from ..utils.styles import Styles
 from ..utils.weather_warnings import WeatherWarnings
+from ..utils.rule_engine import PANEL_WARNINGS
+from ..utils.nowcast import Nowcast
+from ..utils.observation_store import ObservationStore
+from ..utils.pressure_tendency import PressureTendency, daily_trend_labels
+from ..utils.refresh_scheduler import RefreshScheduler
+from ..utils.metrics import REGISTRY
+from ..utils.tracing import span, traced
+from ..utils.ui_state import UiState
 from .warning_card import WarningCard
 from .forecast_card import ForecastCard
 from .camera_viewer import CameraViewer
+from .hourly_chart import HourlyForecastView
+from .sparkline import PrecipitationSparkline
+from .event_loop_watchdog import EventLoopWatchdog
+from .perf_hud import PerfHud
+
+UI_UPDATE_LATENCY = REGISTRY.histogram('ui_update_seconds', "Time spent in main window updates",
+                                       ('method',))
+REFRESHES = REGISTRY.counter('weather_refreshes', "Weather refreshes by result", ('result',))
+LAST_REFRESH = REGISTRY.gauge('weather_last_refresh_timestamp_seconds',
+                              "Unix time of the last successful weather refresh")
+NEXT_REFRESH = REGISTRY.gauge('weather_next_refresh_seconds', "Delay chosen for the next weather refresh")
 
 class DetailWidget(QFrame):
     """Widget to display a weather detail with icon"""
     def __init__(self, icon: str, title: str, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(Styles.DETAILS_WIDGET)
         
         layout = QVBoxLayout(self)
         layout.setSpacing(5)
         
         icon_label = QLabel(icon)
         icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet("font-size: 24px;")
+        icon_label.setObjectName("detailIcon")
         layout.addWidget(icon_label)
         
         self.title_label = QLabel(title)
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("color: #666666;")
+        self.title_label.setObjectName("detailTitle")
         layout.addWidget(self.title_label)
         
         self.value_label = QLabel()
         self.value_label.setAlignment(Qt.AlignCenter)
-        self.value_label.setStyleSheet("font-weight: bold;")
+        self.value_label.setObjectName("detailValue")
         layout.addWidget(self.value_label)
         
         # Add optional secondary value label
         self.secondary_label = QLabel()
         self.secondary_label.setAlignment(Qt.AlignCenter)
-        self.secondary_label.setStyleSheet(f"""
-            color: {Styles.SECONDARY_TEXT};
-            font-size: 11px;
-        """)
+        self.secondary_label.setObjectName("detailSecondary")
         layout.addWidget(self.secondary_label)
 
 class WeatherCard(QFrame):
     """A card widget to display weather information"""
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(Styles.WEATHER_CARD)
         
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
@@ -90,7 +111,7 @@ class WeatherCard(QFrame):
         line = QFrame()
         line.setFrameShape(QFrame.HLine)
         line.setFrameShadow(QFrame.Sunken)
-        line.setStyleSheet(f"background-color: {Styles.BORDER_COLOR};")
+        line.setObjectName("separator")
         layout.addWidget(line)
         
         # Details grid
@@ -110,16 +131,67 @@ class WeatherCard(QFrame):
         details_layout.addWidget(self.pressure, 0, 3)
         
         layout.addLayout(details_layout)
+        
+        # Precipitation over the next hour
+        self.nowcast_frame = QWidget()
+        nowcast_layout = QVBoxLayout(self.nowcast_frame)
+        nowcast_layout.setContentsMargins(0, 0, 0, 0)
+        nowcast_layout.setSpacing(4)
+        self.nowcast_label = QLabel()
+        self.nowcast_label.setObjectName("nowcastLabel")
+        nowcast_layout.addWidget(self.nowcast_label)
+        self.nowcast_sparkline = PrecipitationSparkline()
+        nowcast_layout.addWidget(self.nowcast_sparkline)
+        layout.addWidget(self.nowcast_frame)
+        self.nowcast_frame.hide()
+        
+        # Values currently shown, so unchanged refreshes skip the redraw
+        self.shown = None
+    
+    def set_nowcast(self, buffer, now=None):
+        """Show the next-hour precipitation sparkline, or hide it without data"""
+        if buffer is None:
+            self.nowcast_frame.hide()
+            return
+        minutes = buffer.minutes_until_rain(now)
+        if minutes is None:
+            text = "No rain expected in the next hour"
+        elif minutes == 0:
+            text = "Rain now"
+        else:
+            text = f"Rain in {minutes} min"
+        self.nowcast_label.setText(text)
+        self.nowcast_sparkline.set_values(buffer.window(now))
+        self.nowcast_frame.show()
 
 class MainWindow(QMainWindow):
     """Main window of the weather app"""
     
+    # Emitted from the fetch thread; delivered on the GUI thread
+    weather_fetched = pyqtSignal(object)
+    
+    @traced("MainWindow.__init__", "startup")
     def __init__(self):
         super().__init__()
         
+        # Report blocking calls on the GUI thread
+        self.watchdog = EventLoopWatchdog(self)
+        if self.watchdog.threshold > 0:
+            self.watchdog.start()
+        
         # Initialize services
         self.weather_service = WeatherService()
         self.alert_service = AlertService()
+        self.alert_tracker = AlertTracker(self.alert_service.engine)
+        self.panels_show_tracked = False
+        self.official_alerts = GovernmentAlertFeed()
+        self.nowcast = Nowcast()
+        self.observations = ObservationStore()
+        self.pressure_tendency = PressureTendency(self.observations)
+        self.rain_warning = None
+        self.feed_warnings_changed = False
+        self.refresh_scheduler = RefreshScheduler(quota=self.weather_service.quota)
+        self.changes = ChangeDetector()
         
         # Create network manager for loading icons
         self.network_manager = QNetworkAccessManager()
@@ -134,6 +206,13 @@ class MainWindow(QMainWindow):
         self.forecast_data = None
         
         self.selected_forecast_card = None  # Track selected card
+        self.forecast_cards = []
+        self.chart_png = None  # Last drawn 7-day chart, saved with the UI state
+        
+        # Weather is fetched on a worker thread; a search during a fetch runs after it
+        self.fetching = False
+        self.fetch_again = False
+        self.weather_fetched.connect(self.apply_weather)
         
         # Set window icon
         icon_data = Resources.get_app_icon()
@@ -143,10 +222,21 @@ class MainWindow(QMainWindow):
         icon.addPixmap(pixmap)
         self.setWindowIcon(icon)
         
+        # Optional desktop notifications for alert changes
+        self.tray_icon = None
+        if Config.DESKTOP_NOTIFICATIONS and QSystemTrayIcon.isSystemTrayAvailable():
+            self.tray_icon = QSystemTrayIcon(icon, self)
+            self.tray_icon.show()
+        
         self.setup_ui()
         
-        # Load London weather by default
-        self.city_input.setText("London")
+        # Performance overlay, toggled with F12
+        self.perf_hud = PerfHud(self, self.watchdog)
+        QShortcut(QKeySequence(Qt.Key_F12), self, self.perf_hud.toggle)
+        
+        # Paint the last known state, or London by default, then refresh in the background
+        if not self.restore_state():
+            self.city_input.setText("London")
         self.update_weather()
         
         # Setup rainbow border animation
@@ -157,8 +247,9 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Weather App")
         self.setMinimumSize(1200, 800)
         
-        # Set window style
-        self.setStyleSheet(Styles.MAIN_WINDOW)
+        # Style the whole application from one stylesheet
+        Styles.apply(QApplication.instance())
+        self.border_color = QColor(Styles.PRIMARY_COLOR)
         
         # Create main widget and layout
         main_widget = QWidget()
@@ -170,12 +261,14 @@ class MainWindow(QMainWindow):
         # Search bar at very top
         search_layout = QHBoxLayout()
         self.city_input = QLineEdit()
+        self.city_input.setObjectName("cityInput")
         self.city_input.setPlaceholderText("Enter city name...")
         self.city_input.setFixedWidth(200)
         self.city_input.returnPressed.connect(self.update_weather)
         search_layout.addWidget(self.city_input)
         
         self.search_button = QPushButton("Search")
+        self.search_button.setObjectName("searchButton")
         self.search_button.clicked.connect(self.update_weather)
         search_layout.addWidget(self.search_button)
         search_layout.addStretch()
@@ -200,11 +293,7 @@ class MainWindow(QMainWindow):
         forecast_layout.setContentsMargins(0, 0, 0, 0)
         
         forecast_label = QLabel("7-Day Forecast")
-        forecast_label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            margin: 0px;
-        """)
+        forecast_label.setObjectName("sectionTitle")
         forecast_layout.addWidget(forecast_label)
         
         # Horizontal layout for forecast cards
@@ -216,9 +305,19 @@ class MainWindow(QMainWindow):
         forecast_widget.setMinimumHeight(150)  # Reduced height since we only need one row
         weather_splitter.addWidget(forecast_widget)
         
-        # Graph
+        # Graphs: daily and hourly views
         self.canvas.setMinimumHeight(200)
-        weather_splitter.addWidget(self.canvas)
+        self.hourly_view = HourlyForecastView()
+        # The saved chart image stands in for the canvas until the first draw
+        self.chart_preview = QLabel()
+        self.chart_preview.setScaledContents(True)
+        self.chart_stack = QStackedWidget()
+        self.chart_stack.addWidget(self.canvas)
+        self.chart_stack.addWidget(self.chart_preview)
+        self.graph_tabs = QTabWidget()
+        self.graph_tabs.addTab(self.chart_stack, "7-Day")
+        self.graph_tabs.addTab(self.hourly_view, "48-Hour")
+        weather_splitter.addWidget(self.graph_tabs)
         
         content_layout.addWidget(weather_splitter)
         
@@ -231,20 +330,17 @@ class MainWindow(QMainWindow):
         # Camera viewer (positioned at top-right)
         self.camera_viewer = CameraViewer()
         self.camera_viewer.setFixedWidth(350)
-        self.camera_viewer.setFixedHeight(300)
+        self.camera_viewer.setFixedHeight(390)
         alerts_layout.addWidget(self.camera_viewer)
         
         # Alerts frame
         self.alerts_frame = QFrame()
-        self.alerts_frame.setStyleSheet(Styles.ALERTS_FRAME)
+        self.alerts_frame.setObjectName("alertsFrame")
         alerts_frame_layout = QVBoxLayout(self.alerts_frame)
         alerts_frame_layout.setSpacing(5)
         
         alerts_title = QLabel("Weather Alerts")
-        alerts_title.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-        """)
+        alerts_title.setObjectName("sectionTitle")
         alerts_frame_layout.addWidget(alerts_title)
         
         self.alerts_label = QLabel()
@@ -260,11 +356,7 @@ class MainWindow(QMainWindow):
         warnings_layout.setSpacing(5)
         
         warnings_header = QLabel("Weather Warnings")
-        warnings_header.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            margin: 0px;
-        """)
+        warnings_header.setObjectName("sectionTitle")
         warnings_layout.addWidget(warnings_header)
         
         self.warnings_layout = QVBoxLayout()
@@ -273,15 +365,22 @@ class MainWindow(QMainWindow):
         alerts_layout.addWidget(self.warnings_frame)
         self.warnings_frame.hide()
         
+        # Upcoming warning across the hourly forecast
+        self.next_warning_label = QLabel()
+        self.next_warning_label.setWordWrap(True)
+        self.next_warning_label.setObjectName("nextWarning")
+        alerts_layout.addWidget(self.next_warning_label)
+        self.next_warning_label.hide()
+        
         alerts_layout.addStretch()
         content_layout.addWidget(alerts_widget)
         
         layout.addWidget(content_widget)
         
-        # Setup refresh timer
+        # Setup refresh timer; each refresh schedules the next one
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.update_weather)
-        self.timer.start(300000)  # Update every 5 minutes
         
     def setup_border_animation(self):
         """Setup rainbow border animation"""
@@ -313,71 +412,261 @@ class MainWindow(QMainWindow):
     
     def update_border_color(self, color):
         """Update the border color"""
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {Styles.BACKGROUND_COLOR};
-                border: 2px solid {color.name()};
-            }}
-        """)
+        self.border_color = color
+        # Only the border needs repainting, not the widgets inside it
+        rect = self.rect()
+        self.update(QRegion(rect).subtracted(QRegion(rect.adjusted(2, 2, -2, -2))))
+    
+    def paintEvent(self, event):
+        """Paint the animated border on top of the stylesheet background"""
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setPen(QPen(self.border_color, 2))
+        painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
     
+    @pyqtSlot()
     def update_weather(self):
-        """Update weather information"""
+        """Fetch weather for the entered city on a worker thread"""
         city = self.city_input.text()
         if not city:
             self.show_error("Please enter a city name")
+            # Keep the refresh chain going until a city is entered
+            self.schedule_refresh(None)
+            return
+        if self.fetching:
+            self.fetch_again = True
             return
         
-        # Get current weather
-        weather_data = self.weather_service.get_current_weather(city)
-        if weather_data:
+        self.fetching = True
+        threading.Thread(target=self.fetch_weather, args=(city,), name="weather-fetch",
+                         daemon=True).start()
+    
+    def fetch_weather(self, city):
+        """Get current weather and forecast in a single request (runs on the fetch thread)"""
+        with span("fetch", city=city):
+            result = self.weather_service.get_weather(city)
+        # Download any new icons here so showing the result needs no network I/O
+        if result and result.current:
+            with span("icons"):
+                for code in self.icon_codes(result.current, result.forecast):
+                    Resources.download_icon(code)
+        self.weather_fetched.emit(result)
+    
+    @pyqtSlot(object)
+    @UI_UPDATE_LATENCY.timed(method='update_weather')
+    @traced()
+    def apply_weather(self, result):
+        """Show a fetched result"""
+        self.fetching = False
+        if result and result.current:
+            weather_data = result.current
             self.current_weather = weather_data  # Store current weather
-            self.update_weather_display(weather_data)
+            changes = self.changes.update(weather_data, result.forecast)
+            with span("record observation"):
+                self.observations.append(weather_data)
+                self.pressure_tendency.update(weather_data)
             
-            # Get and display forecast
-            forecast_data = self.weather_service.get_forecast(city)
+            # Official alerts only need redrawing when they change
+            diff = self.official_alerts.update(weather_data.location, result.alerts)
+            self.notify_official_alerts(diff.new + diff.updated)
+            
+            # Merge the new minutes into the nowcast
+            if result.forecast and result.forecast.minutely is not None:
+                self.nowcast.update(weather_data.location, result.forecast.minutely)
+            rain_warning = self.nowcast.rain_warning(weather_data.location)
+            self.feed_warnings_changed = diff.changed or rain_warning != self.rain_warning
+            self.rain_warning = rain_warning
+            self.update_weather_display(weather_data, tracked=True)
+            
+            # Display forecast
+            forecast_data = result.forecast
             if forecast_data:
                 self.forecast_data = forecast_data  # Store forecast data
-                self.update_forecast_graph(forecast_data)
-                self.update_forecast_cards(forecast_data)
+                # Only redraw the parts whose data changed
+                if changes.chart:
+                    selected = self.selected_forecast_card
+                    self.update_forecast_graph(
+                        forecast_data, selected_date=selected.forecast.timestamp if selected else None)
+                    self.chart_png = self.grab_png(self.canvas)
+                if changes.hourly or changes.observation:
+                    # Compare the hourly forecast with the last 24 hours of observations
+                    with span("hourly view"):
+                        observed = self.observations.range(weather_data.location, time.time() - 86400)
+                        self.hourly_view.set_forecast(forecast_data, observed)
+                self.update_next_warning(forecast_data)
+                self.update_forecast_cards(forecast_data, changes.days)
+            REFRESHES.inc(result='ok')
+            LAST_REFRESH.set(time.time())
+            self.save_state(weather_data, forecast_data)
+            self.schedule_refresh(weather_data)
         else:
+            REFRESHES.inc(result='error')
             self.show_error("Error fetching weather data")
-    
-    def update_weather_display(self, weather_data):
-        """Update the weather card display"""
-        # Update weather card
-        self.weather_card.location_label.setText(weather_data.location)
-        
-        # Load weather icon
-        icon_data = Resources.download_icon(weather_data.icon_code)
-        if icon_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(icon_data)
-            if not pixmap.isNull():
-                pixmap = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.weather_card.icon_label.setPixmap(pixmap)
-        
-        # Update temperature and description
-        self.weather_card.temp_label.setText(f"{weather_data.temperature:.1f}°")
-        self.weather_card.desc_label.setText(weather_data.description.title())
+            self.schedule_refresh(None)
         
-        # Update details with wind direction and pressure
-        self.weather_card.feels_like.value_label.setText(f"{weather_data.feels_like:.1f}°C")
-        self.weather_card.humidity.value_label.setText(f"{weather_data.humidity}%")
-        self.weather_card.wind.value_label.setText(f"{weather_data.wind_speed} m/s")
-        self.weather_card.wind.secondary_label.setText(f"{weather_data.get_wind_direction()}")
-        self.weather_card.pressure.value_label.setText(f"{weather_data.pressure} hPa")
-        self.weather_card.pressure.secondary_label.setText(f"{weather_data.get_pressure_trend()}")
-        
-        # Check for alerts
-        alerts = self.alert_service.check_alerts(weather_data)
+        if self.fetch_again:
+            self.fetch_again = False
+            self.update_weather()
+    
+    @traced()
+    def restore_state(self) -> bool:
+        """Show the state saved by the last successful refresh, if there is one"""
+        state = UiState.load()
+        if state is None:
+            return False
+        
+        Resources.add_icons(state.icons)
+        self.city_input.setText(state.city)
+        self.current_weather = state.current
+        # Shown untracked: the alert tracker and notifications wait for fresh data
+        self.update_weather_display(state.current, pressure_trend=state.pressure_trend)
+        
+        if state.forecast is not None:
+            self.forecast_data = state.forecast
+            self.update_forecast_cards(state.forecast)
+            self.update_next_warning(state.forecast)
+            observed = self.observations.range(state.current.location, time.time() - 86400)
+            self.hourly_view.set_forecast(state.forecast, observed)
+            if state.chart:
+                pixmap = QPixmap()
+                pixmap.loadFromData(state.chart)
+                self.chart_preview.setPixmap(pixmap)
+                self.chart_stack.setCurrentWidget(self.chart_preview)
+                self.chart_png = state.chart
+            else:
+                self.update_forecast_graph(state.forecast)
+        
+        if state.camera and state.camera_frame:
+            self.camera_viewer.restore_frame(state.camera, state.camera_frame)
+        return True
+    
+    @traced()
+    def save_state(self, weather_data, forecast_data):
+        """Save what is shown so the next launch can paint it immediately"""
+        UiState(
+            city=self.city_input.text(),
+            current=weather_data,
+            forecast=forecast_data,
+            pressure_trend=self.pressure_tendency.label(weather_data.location),
+            icons=Resources.cached_icons(self.icon_codes(weather_data, forecast_data)),
+            chart=self.chart_png,
+            camera=self.camera_viewer.current_camera,
+            camera_frame=self.camera_viewer.last_snapshot
+        ).save()
+    
+    @staticmethod
+    def icon_codes(weather_data, forecast_data):
+        """Icons shown for a result: the current weather and each forecast day"""
+        codes = {weather_data.icon_code}
+        if forecast_data is not None:
+            codes.update(icon for _, icon in forecast_data.daily.conditions)
+        return codes
+    
+    @staticmethod
+    def grab_png(widget) -> bytes:
+        """Render a widget to PNG bytes"""
+        data = QByteArray()
+        buffer = QBuffer(data)
+        buffer.open(QIODevice.WriteOnly)
+        widget.grab().save(buffer, "PNG")
+        return bytes(data)
+    
+    def schedule_refresh(self, weather_data):
+        """Start the timer for the next refresh"""
+        # Only medium and high severity events tighten the schedule; a low one
+        # such as high humidity can last all day
+        warnings_active = False
+        if weather_data is not None:
+            location = weather_data.location
+            shown = self.alert_tracker.active(location) + self.official_alerts.warnings(location)
+            warnings_active = any(warning.severity != WeatherWarnings.SEVERITY_LOW for warning in shown)
+        delay = self.refresh_scheduler.next_delay(weather_data, warnings_active)
+        NEXT_REFRESH.set(delay)
+        self.timer.start(int(delay * 1000))
+    
+    @UI_UPDATE_LATENCY.timed(method='update_weather_display')
+    @traced()
+    def update_weather_display(self, weather_data, tracked: bool = False, pressure_trend: str = None):
+        """Update the weather card display.
+        
+        ``tracked`` observations (fresh current weather) go through the alert
+        tracker and use the observed pressure tendency; others, such as a
+        clicked forecast day, are evaluated as-is and pass their own trend.
+        """
+        if pressure_trend is None:
+            pressure_trend = self.pressure_tendency.label(weather_data.location) if tracked else "–"
+        
+        # Only rewrite the weather card when what it shows has changed
+        # (and again once an icon that was missing has been downloaded)
+        icon_data = Resources.cached_icon(weather_data.icon_code)
+        key = (weather_key(weather_data), pressure_trend, icon_data is not None)
+        if key != self.weather_card.shown:
+            self.weather_card.shown = key
+            self.weather_card.location_label.setText(weather_data.location)
+            
+            # Load weather icon
+            if icon_data:
+                pixmap = QPixmap()
+                pixmap.loadFromData(icon_data)
+                if not pixmap.isNull():
+                    pixmap = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    self.weather_card.icon_label.setPixmap(pixmap)
+            
+            # Update temperature and description
+            self.weather_card.temp_label.setText(f"{weather_data.temperature:.1f}°")
+            self.weather_card.desc_label.setText(weather_data.description.title())
+            
+            # Update details with wind direction and pressure
+            self.weather_card.feels_like.value_label.setText(f"{weather_data.feels_like:.1f}°C")
+            self.weather_card.humidity.value_label.setText(f"{weather_data.humidity}%")
+            self.weather_card.wind.value_label.setText(f"{weather_data.wind_speed} m/s")
+            self.weather_card.wind.secondary_label.setText(f"{weather_data.get_wind_direction()}")
+            self.weather_card.pressure.value_label.setText(f"{weather_data.pressure} hPa")
+            self.weather_card.pressure.secondary_label.setText(pressure_trend)
+        
+        self.weather_card.set_nowcast(
+            self.nowcast.buffer(weather_data.location) if tracked else None)
+        
+        if tracked:
+            # Only redraw the panels when the tracked alert state changes
+            events = self.alert_tracker.update(weather_data)
+            active = self.alert_tracker.active(weather_data.location)
+            self.update_alerts(active, weather_data)
+            if events or self.feed_warnings_changed or not self.panels_show_tracked:
+                feed = self.official_alerts.warnings(weather_data.location)
+                if self.rain_warning:
+                    feed.append(self.rain_warning)
+                self.update_warnings(active, weather_data, feed)
+            self.feed_warnings_changed = False
+            self.panels_show_tracked = True
+            self.notify_alert_events(events)
+        else:
+            # Evaluate alert and warning rules once for both panels
+            fired = self.alert_service.engine.evaluate(weather_data)
+            day_start = weather_data.timestamp.replace(hour=0, minute=0, second=0).timestamp()
+            official = self.official_alerts.warnings(weather_data.location,
+                                                     day_start, day_start + 86400)
+            self.update_alerts(fired, weather_data)
+            self.update_warnings(fired, weather_data, official)
+            self.panels_show_tracked = False
+    
+    def update_alerts(self, rules, weather_data):
+        """Show the alerts panel for the given rules"""
+        alerts = self.alert_service.format_alerts(rules, weather_data)
         if alerts:
-            self.alerts_label.setText("\n".join(alerts))
+            text = "\n".join(alerts)
+            if self.alerts_label.text() != text:
+                self.alerts_label.setText(text)
             self.alerts_frame.show()
         else:
             self.alerts_frame.hide()
-        
-        # Check for warnings
-        warnings = WeatherWarnings.check_warnings(weather_data)
+    
+    @UI_UPDATE_LATENCY.timed(method='update_warnings')
+    @traced()
+    def update_warnings(self, rules, weather_data, feed=()):
+        """Rebuild the warning cards for feed warnings (official alerts, nowcast) and the given rules"""
+        warnings = list(feed) + WeatherWarnings.from_rules(
+            [rule for rule in rules if rule.panel == PANEL_WARNINGS], weather_data)
         if warnings:
             # Clear previous warnings
             for i in reversed(range(self.warnings_layout.count())):
@@ -392,11 +681,53 @@ class MainWindow(QMainWindow):
         else:
             self.warnings_frame.hide()
     
+    def notify_official_alerts(self, alerts):
+        """Show desktop notifications for new or updated official alerts"""
+        if not self.tray_icon:
+            return
+        for alert in alerts:
+            warning = GovernmentAlertFeed.to_warning(alert)
+            self.tray_icon.showMessage(f"{warning.icon} {warning.title}", warning.message,
+                                       QSystemTrayIcon.Critical, 10000)
+    
+    def notify_alert_events(self, events):
+        """Show desktop notifications for newly raised or changed alerts"""
+        if not self.tray_icon:
+            return
+        for event in events:
+            if event.kind == ALERT_CLEARED:
+                continue
+            rule = event.rule
+            icon = (QSystemTrayIcon.Critical if rule.severity == WeatherWarnings.SEVERITY_HIGH
+                    else QSystemTrayIcon.Warning)
+            self.tray_icon.showMessage(f"{event.location}: {rule.icon} {rule.title}",
+                                       rule.message, icon, 10000)
+    
+    @traced()
+    def update_next_warning(self, forecast_data):
+        """Show the next warning expected within the hourly forecast"""
+        hourly = forecast_data.hourly
+        upcoming = None
+        if hourly is not None and len(hourly):
+            table = WeatherWarnings.evaluate_series(hourly)
+            upcoming = WeatherWarnings.next_warning(hourly, table)
+        
+        if upcoming:
+            seconds, warning = upcoming
+            hours = int(seconds // 3600)
+            when = "now" if hours == 0 else f"in {hours} h"
+            self.next_warning_label.setText(f"Next: {warning.icon} {warning.title} {when}")
+            self.next_warning_label.show()
+        else:
+            self.next_warning_label.hide()
+    
     def show_error(self, message: str):
         """Show error message"""
         self.alerts_label.setText(message)
         self.alerts_frame.show()
     
+    @UI_UPDATE_LATENCY.timed(method='update_forecast_graph')
+    @traced()
     def update_forecast_graph(self, forecast_data, selected_date=None):
         """Update the forecast graph"""
         self.figure.clear()
@@ -408,8 +739,10 @@ class MainWindow(QMainWindow):
         ax.set_facecolor(Styles.GRAPH_BG)
         
         # Format dates for x-axis
-        dates = [f.timestamp.strftime('%a\n%m-%d') for f in forecast_data.daily_forecasts]
-        temps = [f.temperature for f in forecast_data.daily_forecasts]
+        daily = forecast_data.daily
+        days = daily.datetimes()
+        dates = [d.strftime('%a\n%m-%d') for d in days]
+        temps = daily.temperature.tolist()
         
         # Plot with style
         ax.plot(dates, temps, marker='o', color=Styles.PRIMARY_COLOR, 
@@ -417,9 +750,9 @@ class MainWindow(QMainWindow):
         
         # Highlight selected date if provided
         if selected_date:
-            for i, date in enumerate(forecast_data.daily_forecasts):
-                if date.timestamp.date() == selected_date.date():
-                    ax.plot(i, date.temperature, 'o', 
+            for i, day in enumerate(days):
+                if day.date() == selected_date.date():
+                    ax.plot(i, temps[i], 'o', 
                            color=Styles.PRIMARY_DARK, 
                            markersize=12, 
                            markeredgewidth=2,
@@ -452,28 +785,60 @@ class MainWindow(QMainWindow):
         ax.tick_params(axis='both', colors=Styles.TEXT_COLOR)
         
         # Adjust layout to prevent label cutoff
-        self.figure.tight_layout()
-        self.canvas.draw()
+        with span("tight_layout"):
+            self.figure.tight_layout()
+        with span("draw"):
+            self.canvas.draw()
+        self.chart_stack.setCurrentWidget(self.canvas)
 
-    def update_forecast_cards(self, forecast_data):
-        """Update the forecast cards"""
-        # Clear previous forecast cards
-        if self.selected_forecast_card:
-            self.selected_forecast_card = None
+    @UI_UPDATE_LATENCY.timed(method='update_forecast_cards')
+    @traced()
+    def update_forecast_cards(self, forecast_data, days=None):
+        """Update the forecast cards.
+        
+        Only the cards for the ``days`` indices (or whose pressure trend
+        changed) are replaced; all cards are rebuilt when ``days`` is None or
+        the number of days changed.
+        """
+        trends = daily_trend_labels(forecast_data)
+        daily = forecast_data.daily_forecasts
+        if days is not None and len(self.forecast_cards) == len(daily):
+            for i, (forecast, trend) in enumerate(zip(daily, trends)):
+                card = self.forecast_cards[i]
+                if i in days or card.pressure_trend != trend:
+                    self.replace_forecast_card(i, ForecastCard(forecast, trend))
+                else:
+                    card.forecast = forecast
+            return
         
-        for i in reversed(range(self.forecast_layout.count())):
-            item = self.forecast_layout.itemAt(i)
+        # Clear previous forecast cards along with their stretches
+        self.selected_forecast_card = None
+        while self.forecast_layout.count():
+            item = self.forecast_layout.takeAt(0)
             if item.widget():
                 item.widget().setParent(None)
+        self.forecast_cards = []
         
         # Add new forecast cards in a single row
-        for forecast in forecast_data.daily_forecasts:
-            card = ForecastCard(forecast)
+        for forecast, trend in zip(daily, trends):
+            card = ForecastCard(forecast, trend)
             card.clicked.connect(self.on_forecast_clicked)
             self.forecast_layout.addWidget(card)
+            self.forecast_cards.append(card)
             # Add a small stretch factor to distribute cards evenly
             self.forecast_layout.addStretch(1)
     
+    def replace_forecast_card(self, index, card):
+        """Swap in a new card for one day, keeping the selection"""
+        old = self.forecast_cards[index]
+        card.clicked.connect(self.on_forecast_clicked)
+        self.forecast_layout.replaceWidget(old, card)
+        old.setParent(None)
+        self.forecast_cards[index] = card
+        if old is self.selected_forecast_card:
+            self.selected_forecast_card = card
+            card.set_selected(True)
+    
     def on_forecast_clicked(self, forecast_data):
         """Handle forecast card clicks"""
         # Update selection
@@ -484,7 +849,7 @@ class MainWindow(QMainWindow):
         sender.set_selected(True)
         
         # Update the main weather display with the forecast data
-        self.update_weather_display(forecast_data)
+        self.update_weather_display(forecast_data, pressure_trend=sender.pressure_trend)
         
         # Highlight the selected day in the graph
         if self.forecast_data:
@@ -0,0 +1,150 @@
+import os
+import sys
+import time
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtCore import Qt, QEvent, QTimer
+from ..utils.metrics import REGISTRY
+
+# Refresh phases shown in the HUD: (label, metric, labels)
+REFRESH_PHASES = [
+    ("geocode", 'weather_api_request_seconds', {'endpoint': 'geocoding'}),
+    ("onecall", 'weather_api_request_seconds', {'endpoint': 'onecall'}),
+    ("display", 'ui_update_seconds', {'method': 'update_weather_display'}),
+    ("warnings", 'ui_update_seconds', {'method': 'update_warnings'}),
+    ("graph", 'ui_update_seconds', {'method': 'update_forecast_graph'}),
+    ("cards", 'ui_update_seconds', {'method': 'update_forecast_cards'}),
+]
+
+def _rss_bytes() -> int:
+    """Current resident set size (peak size where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+class PerfHud(QLabel):
+    """Toggleable overlay with live performance figures.
+
+    Everything is sampled from the metrics registry and the event-loop
+    watchdog on a timer that only runs while the overlay is visible, and the
+    frame counter's event filter is only installed while it is shown, so a
+    hidden HUD costs nothing.
+    """
+
+    def __init__(self, window, watchdog=None, interval_ms: int = 500):
+        super().__init__(window)
+        self.target = window
+        self.watchdog = watchdog
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.PlainText)
+
+        self.frames = 0
+        self._previous = None
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def toggle(self):
+        self.setVisible(not self.isVisible())
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.frames = 0
+        self._previous = self._sample()
+        self.target.installEventFilter(self)
+        self.timer.start()
+        self.setText("Collecting…")
+        self.adjustSize()
+        self.reposition()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+        self.target.removeEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        # Each UpdateRequest on the top-level window is one repaint of the UI
+        if event.type() == QEvent.UpdateRequest:
+            self.frames += 1
+        return False
+
+    def _counter_values(self, name: str):
+        metric = REGISTRY.get(name)
+        if metric is None:
+            return {}
+        return {key[0]: metric.value(**dict(zip(metric.labelnames, key)))
+                for key in metric.label_sets()}
+
+    def _sample(self):
+        return {
+            'time': time.monotonic(),
+            'cpu': time.process_time(),
+            'frames': self.frames,
+            'fetched': self._counter_values('frigate_snapshots'),
+            'decoded': self._counter_values('camera_frames_decoded'),
+        }
+
+    def _hit_rate(self, hits: float, misses: float) -> str:
+        total = hits + misses
+        return f"{100 * hits / total:3.0f}%" if total else "  –"
+
+    def refresh(self):
+        """Sample current figures and redraw the overlay"""
+        sample = self._sample()
+        previous, self._previous = self._previous, sample
+        elapsed = max(sample['time'] - previous['time'], 1e-6)
+        lines = []
+
+        fps = (sample['frames'] - previous['frames']) / elapsed
+        lag = "lag –"
+        if self.watchdog is not None and self.watchdog.recent_lags:
+            lags = self.watchdog.recent_lags
+            lag = f"lag {lags[-1] * 1000:.0f} ms (max {max(lags) * 1000:.0f} ms)"
+        lines.append(f"UI {fps:5.1f} fps  {lag}")
+
+        total = REGISTRY.get('ui_update_seconds')
+        last_refresh = total.last(method='update_weather') if total else None
+        if last_refresh is not None:
+            lines.append(f"Refresh {last_refresh * 1000:.0f} ms")
+            for label, name, labels in REFRESH_PHASES:
+                metric = REGISTRY.get(name)
+                value = metric.last(**labels) if metric else None
+                if value is not None:
+                    lines.append(f"  {label:<9}{value * 1000:7.1f} ms")
+
+        cameras = sorted(set(sample['fetched']) | set(sample['decoded']))
+        if cameras:
+            lines.append("Cameras   fetch/s  decode/s")
+            for camera in cameras:
+                fetched = sample['fetched'].get(camera, 0) - previous['fetched'].get(camera, 0)
+                decoded = sample['decoded'].get(camera, 0) - previous['decoded'].get(camera, 0)
+                lines.append(f"  {camera[:9]:<9}{fetched / elapsed:6.1f}  {decoded / elapsed:7.1f}")
+
+        icons = REGISTRY.get('icon_cache_lookups')
+        snapshot_hits = REGISTRY.get('frigate_snapshot_cache_hits')
+        snapshot_fetches = REGISTRY.get('frigate_request_seconds')
+        icon_rate = self._hit_rate(icons.value(result='hit'), icons.value(result='miss')) if icons else "  –"
+        snapshot_rate = "  –"
+        if snapshot_hits and snapshot_fetches:
+            snapshot_rate = self._hit_rate(snapshot_hits.value(),
+                                           snapshot_fetches.count(endpoint='snapshot'))
+        lines.append(f"Cache  icons {icon_rate}  snapshots {snapshot_rate}")
+
+        cpu = 100 * (sample['cpu'] - previous['cpu']) / elapsed
+        lines.append(f"RSS {_rss_bytes() / 2**20:.0f} MB  CPU {cpu:.0f}%")
+
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        self.reposition()
+
+    def reposition(self):
+        """Keep the overlay in the top-right corner of its parent"""
+        parent = self.parentWidget()
+        if parent is not None:
+            self.move(parent.width() - self.width() - 12, 12)
+            self.raise_()
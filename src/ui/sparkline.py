@@ -0,0 +1,42 @@
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QRectF
+from PyQt5.QtGui import QPainter, QColor
+import numpy as np
+from ..utils.styles import Styles
+
+class PrecipitationSparkline(QWidget):
+    """Tiny bar sparkline of minute-level precipitation for the next hour"""
+
+    # Intensity (mm/h) drawn at full height; heavier rain is clipped
+    FULL_SCALE = 4.0
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(28)
+        self.values = np.zeros(0, dtype=np.float32)
+
+    def set_values(self, values):
+        """Show a precipitation window (NaN for unknown minutes)"""
+        values = np.asarray(values, dtype=np.float32)
+        if not np.array_equal(values, self.values, equal_nan=True):
+            self.values = values
+            self.update()
+
+    def paintEvent(self, event):
+        n = len(self.values)
+        if not n:
+            return
+        painter = QPainter(self)
+        painter.setPen(Qt.NoPen)
+        width = self.width() / n
+        height = self.height()
+        baseline = QColor(Styles.BORDER_COLOR)
+        bar = QColor(Styles.ACCENT_COLOR)
+        scaled = np.clip(np.nan_to_num(self.values) / self.FULL_SCALE, 0, 1)
+        for i, value in enumerate(scaled):
+            if value > 0:
+                bar_height = max(2.0, value * height)
+                painter.fillRect(QRectF(i * width, height - bar_height, width, bar_height), bar)
+            else:
+                painter.fillRect(QRectF(i * width, height - 1, width, 1), baseline)
+        painter.end()
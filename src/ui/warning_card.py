@@ -1,23 +1,14 @@
 from PyQt5.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel
 from PyQt5.QtCore import Qt
-from ..utils.styles import Styles
-from ..utils.weather_warnings import WeatherWarning, WeatherWarnings
+from ..utils.weather_warnings import WeatherWarning
 
 class WarningCard(QFrame):
     """Widget to display a weather warning"""
     def __init__(self, warning: WeatherWarning, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(Styles.WARNING_CARD)
         
-        # Set color based on severity
-        color = WeatherWarnings.SEVERITY_COLORS[warning.severity]
-        self.setStyleSheet(f"""
-            {Styles.WARNING_CARD}
-            QFrame {{
-                background-color: {color}22;
-                border-color: {color};
-            }}
-        """)
+        # Colors come from the app stylesheet's WarningCard[severity=...] rules
+        self.setProperty("severity", warning.severity)
         
         # Create layout
         layout = QHBoxLayout(self)
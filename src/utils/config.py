@@ -33,10 +33,41 @@ class Config:
         cls.SEVERE_WIND_THRESHOLD = float(os.getenv('WIND_THRESHOLD', '20'))   # m/s
         cls.WIND_THRESHOLD = cls.SEVERE_WIND_THRESHOLD  # Alias for backward compatibility
         
+        # Alert and warning rules (falls back to the bundled defaults if missing)
+        cls.RULES_FILE = Path(os.getenv('RULES_FILE', str(cls.CONFIG_DIR / "rules.json")))
+        cls.ALERT_MIN_HOLD = float(os.getenv('ALERT_MIN_HOLD', '900'))  # seconds
+        cls.DESKTOP_NOTIFICATIONS = os.getenv('DESKTOP_NOTIFICATIONS', 'false').lower() in ('1', 'true', 'yes')
+        
+        # Observation history kept in CACHE_DIR/observations.db
+        cls.HISTORY_RETENTION_DAYS = float(os.getenv('HISTORY_RETENTION_DAYS', '30'))
+        
+        # Prometheus metrics on http://127.0.0.1:METRICS_PORT/metrics (0 disables)
+        cls.METRICS_PORT = int(os.getenv('METRICS_PORT', '0'))
+        
+        # Chrome trace-event JSON written on exit when set
+        trace_file = os.getenv('TRACE_FILE')
+        cls.TRACE_FILE = Path(os.path.expanduser(trace_file)) if trace_file else None
+        
+        # Log the GUI thread's stack when the event loop stalls this long (0 disables)
+        cls.EVENT_LOOP_STALL_THRESHOLD = float(os.getenv('EVENT_LOOP_STALL_THRESHOLD', '0.5'))  # seconds
+        
         # API configurations
         cls.OPENWEATHER_API_KEY = os.getenv('OPENWEATHER_API_KEY')
+        cls.ONECALL_DAILY_BUDGET = int(os.getenv('ONECALL_DAILY_BUDGET', '1000'))  # billed calls per UTC day
+        cls.ONECALL_CALLS_PER_MINUTE = float(os.getenv('ONECALL_CALLS_PER_MINUTE', '10'))
         cls.FRIGATE_URL = os.getenv('FRIGATE_URL', 'http://localhost:5000')
         cls.FRIGATE_API_KEY = os.getenv('FRIGATE_API_KEY')
+        cls.FRIGATE_EVENT_INTERVAL = float(os.getenv('FRIGATE_EVENT_INTERVAL', '5'))  # seconds, 0 disables
+        cls.FRIGATE_CAMERA_INTERVAL = float(os.getenv('FRIGATE_CAMERA_INTERVAL', '600'))  # seconds
+        # Threads decoding camera snapshots (0 decodes on the GUI thread, -1 uses one per core)
+        cls.CAMERA_DECODE_WORKERS = int(os.getenv('CAMERA_DECODE_WORKERS', '0'))
+        # Snapshots per second shared by camera views by motion, and each view's interval bounds
+        cls.CAMERA_FRAME_BUDGET = float(os.getenv('CAMERA_FRAME_BUDGET', '1.5'))
+        cls.CAMERA_MIN_INTERVAL = float(os.getenv('CAMERA_MIN_INTERVAL', '1'))  # seconds
+        cls.CAMERA_MAX_INTERVAL = float(os.getenv('CAMERA_MAX_INTERVAL', '5'))  # seconds
+        # Recent snapshots kept for instant replay in CACHE_DIR/camera_replay.ring (0 MB disables)
+        cls.CAMERA_REPLAY_SECONDS = float(os.getenv('CAMERA_REPLAY_SECONDS', '60'))
+        cls.CAMERA_REPLAY_MB = int(os.getenv('CAMERA_REPLAY_MB', '32'))
 
 # Initialize configuration when module is loaded
 Config.initialize() 
\ No newline at end of file
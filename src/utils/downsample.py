@@ -0,0 +1,45 @@
+import numpy as np
+
+def lttb_indices(x, y, threshold: int) -> np.ndarray:
+    """Pick indices to keep using Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are always kept. Each bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves peaks and troughs far
+    better than taking every n-th sample.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # threshold - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+
+    return indices
+
+def lttb(x, y, threshold: int):
+    """Downsample a series to at most ``threshold`` points, returning (x, y)"""
+    indices = lttb_indices(x, y, threshold)
+    return np.asarray(x)[indices], np.asarray(y)[indices]
@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import threading
+from ..models.frigate_event import FrigateEvent
+
+# Events kept in memory across all cameras
+MAX_EVENTS = 500
+
+class EventIndex:
+    """Bounded in-memory index of Frigate events by camera and label.
+
+    Events are kept in start-time order; once ``max_events`` is exceeded the
+    oldest are evicted. ``latest`` (the newest start time seen) is where the
+    next poll starts; events still ``in_progress`` are refreshed separately
+    so their end time and score are picked up when they end. Polls merge
+    from a worker thread while the GUI reads, so access is locked.
+    """
+
+    def __init__(self, max_events: int = MAX_EVENTS):
+        self.max_events = max_events
+        self._events: 'OrderedDict[str, FrigateEvent]' = OrderedDict()
+        self._by_key: Dict[Tuple[str, str], List[str]] = {}
+        self.latest = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, events: List[FrigateEvent]) -> List[FrigateEvent]:
+        """Merge polled events and return those that are new or changed"""
+        with self._lock:
+            return self._add(events)
+
+    def _add(self, events: List[FrigateEvent]) -> List[FrigateEvent]:
+        changed = []
+        for event in sorted(events, key=lambda event: event.start_time):
+            known = self._events.get(event.id)
+            if known == event:
+                continue
+            if known is None:
+                self._insert(event)
+            else:
+                self._events[event.id] = event
+            self.latest = max(self.latest, event.start_time)
+            changed.append(event)
+
+        while len(self._events) > self.max_events:
+            _, oldest = self._events.popitem(last=False)
+            self._by_key[(oldest.camera, oldest.label)].remove(oldest.id)
+        return changed
+
+    def _insert(self, event: FrigateEvent):
+        self._events[event.id] = event
+        # Polls return events in start order, so an out-of-order insert is rare
+        if event.start_time < self.latest:
+            items = sorted(self._events.items(), key=lambda item: item[1].start_time)
+            self._events = OrderedDict(items)
+        self._by_key.setdefault((event.camera, event.label), []).append(event.id)
+
+    def in_progress(self, since: float = 0.0) -> List[str]:
+        """Ids of events still in progress that started at or after ``since``"""
+        with self._lock:
+            return [event.id for event in self._events.values()
+                    if event.in_progress and event.start_time >= since]
+
+    def recent(self, camera: Optional[str] = None, label: Optional[str] = None,
+               limit: int = 20) -> List[FrigateEvent]:
+        """Newest events first, optionally for one camera and/or label"""
+        with self._lock:
+            if camera is not None and label is not None:
+                ids = self._by_key.get((camera, label), [])
+                events = [self._events[event_id] for event_id in ids]
+            else:
+                events = [event for event in self._events.values()
+                          if (camera is None or event.camera == camera)
+                          and (label is None or event.label == label)]
+        events.sort(key=lambda event: event.start_time, reverse=True)
+        return events[:limit]
+
+    def labels(self, camera: Optional[str] = None) -> Dict[str, int]:
+        """Number of indexed events per label"""
+        with self._lock:
+            return {label: len(ids) for (cam, label), ids in sorted(self._by_key.items())
+                    if ids and (camera is None or cam == camera)}
@@ -0,0 +1,97 @@
+"""Instant-replay buffer of recent camera frames.
+
+Snapshots are kept as the JPEG bytes Frigate sent, appended to one
+fixed-size memory-mapped file under ``Config.CACHE_DIR`` that all cameras
+share, so memory use is bounded by ``Config.CAMERA_REPLAY_MB`` however many
+cameras are recorded. Writes wrap around to the start of the file, and a
+frame is dropped once newer frames overwrite it or it falls out of the
+``Config.CAMERA_REPLAY_SECONDS`` window. The index (camera, time, offset,
+length) lives in memory; the file is scratch space and is not reused
+across runs.
+"""
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, NamedTuple, Optional
+import mmap
+import time
+from .config import Config
+from .metrics import REGISTRY
+
+REPLAY_FRAMES = REGISTRY.gauge('camera_replay_frames', "Frames held in the replay buffer")
+
+class Frame(NamedTuple):
+    timestamp: float
+    position: int  # bytes written to the ring before this frame
+    length: int
+
+class FrameRing:
+    """Per-camera replay of recent JPEG frames in one shared ring buffer"""
+
+    def __init__(self, path: Path = None, size: int = None, window: float = None):
+        self.path = Path(path) if path is not None else Config.CACHE_DIR / "camera_replay.ring"
+        self.size = Config.CAMERA_REPLAY_MB * 1024 * 1024 if size is None else size
+        self.window = Config.CAMERA_REPLAY_SECONDS if window is None else window
+        self.written = 0
+        self._frames: Dict[str, Deque[Frame]] = {}
+        self._file = None
+        self._map = None
+
+    def _open(self) -> bool:
+        """Create the ring file on first use"""
+        if self._map is None:
+            try:
+                self._file = open(self.path, 'w+b')
+                self._file.truncate(self.size)
+                self._map = mmap.mmap(self._file.fileno(), self.size)
+            except (OSError, ValueError) as e:
+                print(f"Error opening replay buffer: {e}")
+                self.size = 0
+                return False
+        return True
+
+    def _expire(self, camera: str, now: float):
+        """Drop frames that were overwritten or are older than the window"""
+        frames = self._frames.get(camera)
+        while frames and (frames[0].position < self.written - self.size
+                          or frames[0].timestamp < now - self.window):
+            frames.popleft()
+
+    def add(self, camera: str, data: bytes, timestamp: float = None):
+        """Record a snapshot of ``camera``"""
+        if not data or len(data) > self.size or not self._open():
+            return
+        timestamp = time.time() if timestamp is None else timestamp
+
+        # Frames never straddle the end of the file; skip to the start instead
+        offset = self.written % self.size
+        if offset + len(data) > self.size:
+            self.written += self.size - offset
+            offset = 0
+        self._map[offset:offset + len(data)] = data
+        self._frames.setdefault(camera, deque()).append(Frame(timestamp, self.written, len(data)))
+        self.written += len(data)
+
+        for name in self._frames:
+            self._expire(name, timestamp)
+        REPLAY_FRAMES.set(sum(len(frames) for frames in self._frames.values()))
+
+    def timestamps(self, camera: str, now: float = None) -> List[float]:
+        """Times of the frames held for ``camera``, oldest first"""
+        self._expire(camera, time.time() if now is None else now)
+        return [frame.timestamp for frame in self._frames.get(camera, ())]
+
+    def frame(self, camera: str, timestamp: float) -> Optional[bytes]:
+        """JPEG bytes of the frame taken at ``timestamp``, or None once it has been dropped"""
+        for frame in self._frames.get(camera, ()):
+            if frame.timestamp == timestamp:
+                if frame.position < self.written - self.size:
+                    return None
+                offset = frame.position % self.size
+                return self._map[offset:offset + frame.length]
+        return None
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
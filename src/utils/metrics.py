@@ -0,0 +1,245 @@
+"""In-process metrics with a Prometheus text endpoint.
+
+Counters, gauges and latency histograms are registered once at module level
+by the code they instrument and updated in place. ``start_metrics_server``
+serves the registry on localhost in the Prometheus text exposition format
+so fleet monitoring can scrape kiosks; nothing is served unless it is called.
+"""
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import bisect
+import functools
+import threading
+import time
+
+# Latency buckets in seconds, from icon cache hits to slow API calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+class Metric:
+    """Base class for a metric family with optional labels"""
+
+    kind = "untyped"
+    # Appended to the name in HELP/TYPE when the samples carry it too
+    family_suffix = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def label_sets(self) -> List[Tuple[str, ...]]:
+        """Label values of every series recorded so far"""
+        with self._lock:
+            return sorted(self._values)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        """(suffix, labels, value) for every sample in the family"""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        family = self.name + self.family_suffix
+        lines = [f"# HELP {family} {self.documentation}", f"# TYPE {family} {self.kind}"]
+        lines.extend(f"{self.name}{suffix}{labels} {_format_value(value)}"
+                     for suffix, labels, value in self.samples())
+        return lines
+
+class Counter(Metric):
+    """Monotonically increasing count"""
+
+    kind = "counter"
+    family_suffix = "_total"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield "_total", _format_labels(self.labelnames, key), value
+
+class Gauge(Metric):
+    """Value that can go up and down"""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield "", _format_labels(self.labelnames, key), value
+
+class Histogram(Metric):
+    """Distribution of observed values (latencies in seconds) in fixed buckets"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Per-bucket counts (last one is +Inf), sum, count, last value
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0, 0.0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+            state[3] = value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of a block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def timed(self, **labels):
+        """Decorator observing the duration of each call"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.time(**labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def last(self, **labels) -> Optional[float]:
+        """Most recently observed value, if any"""
+        state = self._values.get(self._key(labels))
+        return state[3] if state else None
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, ([*state[0]], state[1], state[2]))
+                           for key, state in self._values.items())
+        bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                yield "_bucket", _format_labels(self.labelnames, key, f'le="{bound}"'), cumulative
+            yield "_sum", _format_labels(self.labelnames, key), total
+            yield "_count", _format_labels(self.labelnames, key), count
+
+class MetricsRegistry:
+    """Named collection of metrics"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets)
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+# Registry shared by the whole app
+REGISTRY = MetricsRegistry()
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes are frequent; keep them out of the app's output
+        pass
+
+def start_metrics_server(port: int, host: str = "127.0.0.1",
+                         registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """Serve ``registry`` at http://host:port/metrics from a daemon thread"""
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    return server
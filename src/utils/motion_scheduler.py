@@ -0,0 +1,99 @@
+"""Motion-aware camera refresh scheduling.
+
+Each camera view used to poll Frigate at a fixed rate. Instead, every
+decoded frame is reduced to a small grayscale thumbnail and compared with
+the previous one; the fraction of cells that changed is the motion score.
+A camera's activity jumps up with motion and decays with a half-life while
+the picture is still. The scheduler then splits a fixed snapshot budget
+(``Config.CAMERA_FRAME_BUDGET`` frames per second over all views):
+
+* every view gets at least one frame per ``Config.CAMERA_MAX_INTERVAL``;
+* an active view asks for up to one frame per ``Config.CAMERA_MIN_INTERVAL``;
+* if the requests add up to more than the budget, the part above the
+  minimum is scaled down so the total stays within it.
+"""
+from typing import Dict, Hashable, Optional
+import time
+import numpy as np
+from .config import Config
+from .metrics import REGISTRY
+
+CAMERA_ACTIVITY = REGISTRY.gauge('camera_motion_activity', "Motion activity of a viewed camera (0-1)",
+                                 ('camera',))
+
+# Thumbnail side used for the motion score
+THUMBNAIL_SIZE = 32
+
+# Gray-level change of a thumbnail cell that counts as motion (JPEG noise is a few levels)
+PIXEL_THRESHOLD = 12
+
+# Fraction of changed cells that counts as fully active
+ACTIVE_FRACTION = 0.05
+
+# Seconds for the activity of a still camera to halve
+ACTIVITY_HALF_LIFE = 20.0
+
+def motion_score(previous: Optional[np.ndarray], current: np.ndarray) -> float:
+    """Fraction of thumbnail cells that changed noticeably between two frames"""
+    if previous is None or previous.shape != current.shape:
+        return 0.0
+    changed = np.abs(current.astype(np.int16) - previous.astype(np.int16)) > PIXEL_THRESHOLD
+    return float(changed.mean())
+
+class MotionScheduler:
+    """Shares the snapshot budget between camera views by motion activity"""
+
+    def __init__(self, budget: float = None, min_interval: float = None, max_interval: float = None):
+        self.budget = Config.CAMERA_FRAME_BUDGET if budget is None else budget
+        self.min_interval = Config.CAMERA_MIN_INTERVAL if min_interval is None else min_interval
+        self.max_interval = Config.CAMERA_MAX_INTERVAL if max_interval is None else max_interval
+        self._thumbnails: Dict[Hashable, np.ndarray] = {}
+        self._activity: Dict[Hashable, float] = {}
+        self._updated: Dict[Hashable, float] = {}
+
+    def observe(self, key: Hashable, thumbnail: np.ndarray, now: float = None,
+                camera: str = None) -> float:
+        """Score a new frame for the view ``key`` and return its activity (0-1)"""
+        now = time.monotonic() if now is None else now
+        score = motion_score(self._thumbnails.get(key), thumbnail)
+        self._thumbnails[key] = thumbnail
+
+        activity = max(self._decayed(key, now), min(1.0, score / ACTIVE_FRACTION))
+        self._activity[key], self._updated[key] = activity, now
+        if camera is not None:
+            CAMERA_ACTIVITY.set(activity, camera=camera)
+        return activity
+
+    def forget(self, key: Hashable):
+        """Stop scheduling a view (closed, or switched to another camera)"""
+        for table in (self._thumbnails, self._activity, self._updated):
+            table.pop(key, None)
+
+    def _decayed(self, key: Hashable, now: float) -> float:
+        """Activity of the view ``key`` decayed to ``now``"""
+        elapsed = max(0.0, now - self._updated.get(key, now))
+        return self._activity.get(key, 0.0) * 0.5 ** (elapsed / ACTIVITY_HALF_LIFE)
+
+    def interval(self, key: Hashable, now: float = None) -> float:
+        """Seconds until the view ``key`` should fetch its next frame"""
+        now = time.monotonic() if now is None else now
+        self._activity.setdefault(key, 0.0)
+        self._updated.setdefault(key, now)
+        min_rate, max_rate = 1 / self.max_interval, 1 / self.min_interval
+        # Views whose frames stopped arriving (stalled or slow) still cool down
+        extra = {view: (max_rate - min_rate) * self._decayed(view, now) for view in self._activity}
+
+        # Scale the part above the minimum rate down to fit the budget
+        spare = max(0.0, self.budget - min_rate * len(extra))
+        requested = sum(extra.values())
+        scale = 1.0 if requested <= spare else spare / requested
+        return 1 / (min_rate + extra[key] * scale)
+
+_shared_scheduler = None
+
+def shared_motion_scheduler() -> MotionScheduler:
+    """Scheduler shared by all camera views"""
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        _shared_scheduler = MotionScheduler()
+    return _shared_scheduler
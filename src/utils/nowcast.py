@@ -0,0 +1,90 @@
+from typing import Dict, Optional
+import time
+import numpy as np
+from ..models.weather_data import PrecipitationSeries
+from .weather_warnings import WeatherWarning, WeatherWarnings
+
+# Minutes covered by the One Call ``minutely`` block
+NOWCAST_MINUTES = 60
+
+# Precipitation (mm/h) from which a minute counts as rain
+RAIN_THRESHOLD = 0.1
+
+class NowcastBuffer:
+    """Fixed-size ring buffer of minute-level precipitation for one location.
+
+    Each minute lives in slot ``minute % capacity``, so a refresh writes only
+    the minutes it adds or revises in place and nothing is ever shifted or
+    reallocated. Slots remember which minute they hold, which lets reads
+    skip minutes that were never fetched or have rolled out of the window.
+    """
+
+    def __init__(self, location: str, capacity: int = NOWCAST_MINUTES):
+        self.location = location
+        self.capacity = capacity
+        self.minutes = np.full(capacity, -1, dtype=np.int64)   # Epoch minute held by each slot
+        self.precipitation = np.zeros(capacity, dtype=np.float32)
+        self.latest = -1
+
+    def update(self, series: PrecipitationSeries) -> int:
+        """Merge a minutely block and return the number of minutes written"""
+        minutes = series.timestamps[-self.capacity:] // 60
+        values = series.precipitation[-self.capacity:]
+        slots = minutes % self.capacity
+
+        # New minutes replace the oldest slots; known minutes are only rewritten if revised
+        write = (self.minutes[slots] != minutes) | (self.precipitation[slots] != values)
+        slots = slots[write]
+        self.minutes[slots] = minutes[write]
+        self.precipitation[slots] = values[write]
+        if len(minutes):
+            self.latest = max(self.latest, int(minutes[-1]))
+        return int(np.count_nonzero(write))
+
+    def window(self, now: float = None) -> np.ndarray:
+        """Precipitation for the next ``capacity`` minutes from ``now`` (NaN where unknown)"""
+        now = time.time() if now is None else now
+        minutes = np.arange(int(now // 60), int(now // 60) + self.capacity)
+        slots = minutes % self.capacity
+        values = self.precipitation[slots].astype(np.float32)
+        values[self.minutes[slots] != minutes] = np.nan
+        return values
+
+    def minutes_until_rain(self, now: float = None, threshold: float = RAIN_THRESHOLD) -> Optional[int]:
+        """Minutes until precipitation reaches ``threshold``, or None if none is expected"""
+        rain = np.flatnonzero(self.window(now) >= threshold)
+        return int(rain[0]) if len(rain) else None
+
+class Nowcast:
+    """Per-location minute-level precipitation nowcasts"""
+
+    def __init__(self, capacity: int = NOWCAST_MINUTES):
+        self.capacity = capacity
+        self._buffers: Dict[str, NowcastBuffer] = {}
+
+    def update(self, location: str, series: PrecipitationSeries) -> int:
+        """Merge a fresh minutely block for a location"""
+        buffer = self._buffers.get(location)
+        if buffer is None:
+            buffer = self._buffers[location] = NowcastBuffer(location, self.capacity)
+        return buffer.update(series)
+
+    def buffer(self, location: str) -> Optional[NowcastBuffer]:
+        """Ring buffer for a location, if any data has been received"""
+        return self._buffers.get(location)
+
+    def rain_warning(self, location: str, now: float = None) -> Optional[WeatherWarning]:
+        """Warning for rain starting within the window, or None if dry or already raining"""
+        buffer = self._buffers.get(location)
+        if buffer is None:
+            return None
+        window = buffer.window(now)
+        minutes = buffer.minutes_until_rain(now)
+        if not minutes:
+            return None
+        return WeatherWarning(
+            severity=WeatherWarnings.SEVERITY_LOW,
+            title=f"Rain starting in {minutes} minute{'s' if minutes != 1 else ''}",
+            message=f"Up to {np.nanmax(window):.1f} mm/h expected within the hour.",
+            icon=WeatherWarnings.ICONS["rain"]
+        )
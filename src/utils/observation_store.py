@@ -0,0 +1,163 @@
+"""Local time-series store for observed weather.
+
+Every fetched WeatherData is appended to a SQLite database under
+``Config.CACHE_DIR``. The database runs in WAL mode so the desktop app and
+the headless monitor can write while charts read, and observations are
+clustered by (location, time) so a range query is a single index scan.
+Range queries return a columnar ForecastSeries, which the charts and the
+rule engine already understand.
+"""
+from pathlib import Path
+from typing import List, Optional
+import sqlite3
+import time
+import numpy as np
+from .config import Config
+from ..models.weather_data import WeatherData, ForecastSeries
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS locations (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS conditions (
+    id INTEGER PRIMARY KEY,
+    description TEXT NOT NULL,
+    icon TEXT NOT NULL,
+    UNIQUE (description, icon)
+);
+CREATE TABLE IF NOT EXISTS observations (
+    location_id INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    temperature REAL NOT NULL,
+    feels_like REAL NOT NULL,
+    humidity INTEGER NOT NULL,
+    wind_speed REAL NOT NULL,
+    wind_deg INTEGER NOT NULL,
+    pressure INTEGER NOT NULL,
+    condition_id INTEGER NOT NULL,
+    PRIMARY KEY (location_id, ts)
+) WITHOUT ROWID;
+"""
+
+# Row layout returned by range queries
+ROW_DTYPE = np.dtype([
+    ('ts', np.int64),
+    ('temperature', np.float32),
+    ('feels_like', np.float32),
+    ('humidity', np.int16),
+    ('wind_speed', np.float32),
+    ('wind_deg', np.int16),
+    ('pressure', np.int16),
+    ('condition_id', np.int32),
+])
+
+# How often retention is enforced while appending
+COMPACT_INTERVAL = 3600  # seconds
+
+class ObservationStore:
+    """Append-only store of observed weather with retention"""
+
+    def __init__(self, path: Path = None, retention_days: float = None):
+        self.path = Path(path) if path is not None else Config.CACHE_DIR / "observations.db"
+        self.retention = 86400 * (Config.HISTORY_RETENTION_DAYS if retention_days is None
+                                  else retention_days)
+        self._location_ids = {}
+        self._condition_ids = {}
+        self._conditions = {}
+        self._last_compact = 0.0
+
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def _location_id(self, name: str, create: bool = True) -> Optional[int]:
+        location_id = self._location_ids.get(name)
+        if location_id is None:
+            if create:
+                self.connection.execute("INSERT OR IGNORE INTO locations (name) VALUES (?)", (name,))
+            row = self.connection.execute("SELECT id FROM locations WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return None
+            location_id = self._location_ids[name] = row[0]
+        return location_id
+
+    def _condition_id(self, description: str, icon: str) -> int:
+        key = (description, icon)
+        condition_id = self._condition_ids.get(key)
+        if condition_id is None:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO conditions (description, icon) VALUES (?, ?)", key)
+            condition_id, = self.connection.execute(
+                "SELECT id FROM conditions WHERE description = ? AND icon = ?", key).fetchone()
+            self._condition_ids[key] = condition_id
+            self._conditions[condition_id] = key
+        return condition_id
+
+    def _condition(self, condition_id: int):
+        key = self._conditions.get(condition_id)
+        if key is None:
+            key = self.connection.execute(
+                "SELECT description, icon FROM conditions WHERE id = ?", (condition_id,)).fetchone()
+            self._conditions[condition_id] = key
+        return key
+
+    def append(self, weather_data: WeatherData, now: float = None):
+        """Record an observation (repeated timestamps for a location are ignored)"""
+        try:
+            with self.connection:
+                self.connection.execute(
+                    "INSERT OR IGNORE INTO observations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (self._location_id(weather_data.location),
+                     int(weather_data.timestamp.timestamp()),
+                     weather_data.temperature, weather_data.feels_like, weather_data.humidity,
+                     weather_data.wind_speed, weather_data.wind_deg, weather_data.pressure,
+                     self._condition_id(weather_data.description, weather_data.icon_code)))
+
+            now = time.time() if now is None else now
+            if now - self._last_compact >= COMPACT_INTERVAL:
+                self.compact(now)
+        except sqlite3.Error as e:
+            print(f"Error recording observation: {e}")
+
+    def compact(self, now: float = None) -> int:
+        """Drop observations past the retention period and return how many were removed"""
+        now = time.time() if now is None else now
+        self._last_compact = now
+        with self.connection:
+            removed = self.connection.execute(
+                "DELETE FROM observations WHERE ts < ?", (int(now - self.retention),)).rowcount
+        if removed:
+            self.connection.execute("PRAGMA incremental_vacuum")
+            self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
+
+    def locations(self) -> List[str]:
+        """Locations with recorded observations"""
+        rows = self.connection.execute(
+            "SELECT name FROM locations WHERE id IN (SELECT DISTINCT location_id FROM observations)"
+            " ORDER BY name")
+        return [name for name, in rows]
+
+    def range(self, location: str, start: float, end: float = None) -> ForecastSeries:
+        """Observations for a location with start <= time <= end as a columnar series"""
+        end = time.time() if end is None else end
+        location_id = self._location_id(location, create=False)
+        rows = [] if location_id is None else self.connection.execute(
+            "SELECT ts, temperature, feels_like, humidity, wind_speed, wind_deg, pressure,"
+            " condition_id FROM observations WHERE location_id = ? AND ts BETWEEN ? AND ?"
+            " ORDER BY ts", (location_id, int(start), int(end))).fetchall()
+        table = np.array(rows, dtype=ROW_DTYPE)
+
+        # Renumber conditions densely, as the parser does for forecasts
+        condition_ids, codes = np.unique(table['condition_id'], return_inverse=True)
+        conditions = [self._condition(int(condition_id)) for condition_id in condition_ids]
+
+        return ForecastSeries(location, table['ts'], table['temperature'], table['feels_like'],
+                              table['humidity'], table['wind_speed'], table['wind_deg'],
+                              table['pressure'], codes.astype(np.int16), conditions)
+
+    def close(self):
+        self.connection.close()
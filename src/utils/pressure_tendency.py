@@ -0,0 +1,121 @@
+"""Barometric pressure tendency.
+
+Meteorologists describe pressure change over the last three hours. The
+tracker keeps a short rolling window of observations per location, so each
+refresh only appends one sample and trims the front of the window. The
+history store is read once per location to seed the window after a restart.
+"""
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+import numpy as np
+
+# Standard tendency period
+TENDENCY_WINDOW = 3 * 3600  # seconds
+
+# Shortest history worth reporting a tendency for
+MIN_SPAN = 3600  # seconds
+
+# Classification thresholds in hPa per 3 hours
+STEADY_LIMIT = 1.0
+RAPID_LIMIT = 3.5
+
+def describe_tendency(change: Optional[float], hours: float = 3) -> str:
+    """Format a pressure change over ``hours`` as a trend label"""
+    if change is None or np.isnan(change):
+        return "–"
+    rate = abs(change) * 3 / hours
+    if rate < STEADY_LIMIT:
+        arrow = "→"
+    elif change > 0:
+        arrow = "⇈" if rate >= RAPID_LIMIT else "↑"
+    else:
+        arrow = "⇊" if rate >= RAPID_LIMIT else "↓"
+    return f"{arrow} {change:+.1f} hPa/{hours:g}h"
+
+class PressureTendency:
+    """Incremental 3-hour pressure tendency per location"""
+
+    def __init__(self, store=None, window: float = TENDENCY_WINDOW):
+        self.store = store
+        self.window = window
+        self._samples: Dict[str, Deque[Tuple[float, float]]] = {}
+        self._tendencies: Dict[str, Optional[float]] = {}
+
+    def _seed(self, location: str, ts: float) -> Deque[Tuple[float, float]]:
+        """Start a window, from the history store if one is available"""
+        samples = deque()
+        if self.store is not None:
+            # Include some slack before the window so there is a sample at or before its start
+            history = self.store.range(location, ts - 2 * self.window, ts)
+            samples.extend(zip(history.timestamps.tolist(), history.pressure.tolist()))
+        self._samples[location] = samples
+        return samples
+
+    def update(self, weather_data) -> Optional[float]:
+        """Add an observation and return the pressure change over the window (hPa)"""
+        location = weather_data.location
+        ts = weather_data.timestamp.timestamp()
+        samples = self._samples.get(location)
+        if samples is None:
+            samples = self._seed(location, ts)
+
+        if not samples or ts > samples[-1][0]:
+            samples.append((ts, weather_data.pressure))
+
+        # Keep exactly one sample at or before the start of the window
+        start = ts - self.window
+        while len(samples) > 1 and samples[1][0] <= start:
+            samples.popleft()
+
+        oldest_ts, oldest_pressure = samples[0]
+        span = ts - oldest_ts
+        if span < MIN_SPAN:
+            tendency = None
+        else:
+            # Normalise to the standard period when history is shorter or sparser
+            tendency = (weather_data.pressure - oldest_pressure) * self.window / span
+        self._tendencies[location] = tendency
+        return tendency
+
+    def tendency(self, location: str) -> Optional[float]:
+        """Latest pressure change over the window for a location, if known"""
+        return self._tendencies.get(location)
+
+    def label(self, location: str) -> str:
+        """Trend label for a location"""
+        return describe_tendency(self.tendency(location), self.window / 3600)
+
+def series_tendency(series, times, window: float = TENDENCY_WINDOW) -> np.ndarray:
+    """Pressure change over ``window`` ending at each of ``times`` from a forecast series.
+
+    NaN where the series doesn't cover the whole window.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    if not len(series):
+        return np.full(len(times), np.nan)
+    ts = series.timestamps.astype(np.float64)
+    pressure = series.pressure.astype(np.float64)
+    change = np.interp(times, ts, pressure) - np.interp(times - window, ts, pressure)
+    change[(times - window < ts[0]) | (times > ts[-1])] = np.nan
+    return change
+
+def daily_trend_labels(forecast_data) -> List[str]:
+    """Trend labels for each day of a forecast.
+
+    Days covered by the hourly forecast get a 3-hour tendency; later days fall
+    back to the change since the previous day.
+    """
+    daily = forecast_data.daily
+    hourly = forecast_data.hourly
+    three_hour = (series_tendency(hourly, daily.timestamps) if hourly is not None
+                  else np.full(len(daily), np.nan))
+    day_over_day = np.full(len(daily), np.nan)
+    day_over_day[1:] = np.diff(daily.pressure.astype(np.float64))
+
+    labels = []
+    for change_3h, change_24h in zip(three_hour.tolist(), day_over_day.tolist()):
+        if not np.isnan(change_3h):
+            labels.append(describe_tendency(change_3h))
+        else:
+            labels.append(describe_tendency(change_24h, hours=24))
+    return labels
@@ -0,0 +1,118 @@
+"""Adaptive refresh scheduling.
+
+OpenWeather republishes current conditions roughly every ten minutes and
+stamps them with the observation time (``dt``), so refreshing more often than
+that mostly downloads the same observation again. The scheduler starts from
+``Config.REFRESH_INTERVAL`` and
+
+* backs off, up to ``MAX_BACKOFF`` times the interval, while successive
+  observations barely change;
+* tightens to ``MIN_FACTOR`` of the interval while warnings are active or
+  temperature, pressure or wind are changing fast;
+* otherwise lands each fetch just after the observation is expected to be
+  republished;
+* never refreshes faster than the One Call quota can sustain.
+"""
+from typing import Dict, Optional, Tuple
+import math
+import time
+from .config import Config
+
+# How often OpenWeather republishes current conditions, and how long after
+# that to wait before fetching
+PUBLISH_INTERVAL = 600  # seconds
+PUBLISH_GRACE = 30  # seconds
+
+# Never schedule sooner than this
+MIN_DELAY = 60  # seconds
+
+# Interval multipliers for volatile and stable conditions
+MIN_FACTOR = 0.5
+BACKOFF = 1.5
+MAX_BACKOFF = 3.0
+
+# Rates of change per hour that count as fast
+VOLATILITY_LIMITS = {
+    'temperature': 2.0,  # °C
+    'pressure': 1.5,     # hPa
+    'wind_speed': 4.0,   # m/s
+}
+
+# Below this fraction of the limits conditions count as stable
+STABLE_LEVEL = 0.25
+
+class RefreshScheduler:
+    """Picks the delay until the next weather refresh"""
+
+    def __init__(self, base_interval: float = None, quota=None):
+        self.base_interval = Config.REFRESH_INTERVAL if base_interval is None else base_interval
+        self.quota = quota
+        self.location = None
+        self.volatility = None
+        self.stable_runs = 0
+        self._previous: Optional[Tuple[float, Dict[str, float]]] = None
+
+    def _observe(self, weather_data) -> Optional[float]:
+        """Update the volatility score from a new observation.
+
+        The score is the fastest rate of change relative to
+        ``VOLATILITY_LIMITS``; 1.0 or more counts as fast. A repeated
+        observation (same ``dt``) leaves the score unchanged.
+        """
+        observed = weather_data.timestamp.timestamp()
+        values = {name: float(getattr(weather_data, name)) for name in VOLATILITY_LIMITS}
+        if weather_data.location != self.location:
+            self.location = weather_data.location
+            self.volatility = None
+            self.stable_runs = 0
+            self._previous = None
+
+        previous, self._previous = self._previous, (observed, values)
+        if previous is None:
+            return self.volatility
+        if observed <= previous[0]:
+            self._previous = previous
+            return self.volatility
+
+        hours = max(observed - previous[0], PUBLISH_INTERVAL) / 3600
+        self.volatility = max(abs(values[name] - previous[1][name]) / hours / limit
+                              for name, limit in VOLATILITY_LIMITS.items())
+        return self.volatility
+
+    def next_publish(self, weather_data, now: float = None) -> float:
+        """Earliest time a newer observation than ``weather_data`` should be available"""
+        now = time.time() if now is None else now
+        observed = weather_data.timestamp.timestamp()
+        cycles = max(1, math.ceil((now - PUBLISH_GRACE - observed) / PUBLISH_INTERVAL))
+        return observed + cycles * PUBLISH_INTERVAL + PUBLISH_GRACE
+
+    def next_delay(self, weather_data=None, warnings_active: bool = False, now: float = None) -> float:
+        """Seconds until the next refresh after one that returned ``weather_data``"""
+        now = time.time() if now is None else now
+        if weather_data is None:
+            # Failed refresh: try again on the baseline schedule
+            return self._within_quota(self.base_interval, now)
+
+        volatility = self._observe(weather_data)
+        if warnings_active or (volatility is not None and volatility >= 1.0):
+            # Events in progress: the nowcast and alerts change by the minute
+            self.stable_runs = 0
+            delay = self.base_interval * MIN_FACTOR
+        else:
+            if volatility is not None and volatility < STABLE_LEVEL:
+                self.stable_runs += 1
+            else:
+                self.stable_runs = 0
+            interval = self.base_interval * min(MAX_BACKOFF, BACKOFF ** self.stable_runs)
+
+            # Snap to the publish slot nearest the interval
+            publish = self.next_publish(weather_data, now)
+            slots = max(0, round((now + interval - publish) / PUBLISH_INTERVAL))
+            delay = publish + slots * PUBLISH_INTERVAL - now
+
+        return self._within_quota(max(MIN_DELAY, delay), now)
+
+    def _within_quota(self, delay: float, now: float) -> float:
+        if self.quota is None:
+            return delay
+        return max(delay, self.quota.suggested_interval(1, now))
@@ -1,8 +1,14 @@
 import os
 from pathlib import Path
 import requests
-from typing import Optional
+from typing import Dict, Optional
 import base64
+from .metrics import REGISTRY
+from .tracing import span
+
+ICON_DOWNLOAD_LATENCY = REGISTRY.histogram('icon_download_seconds', "Weather icon download latency")
+ICON_DOWNLOAD_ERRORS = REGISTRY.counter('icon_download_errors', "Failed weather icon downloads")
+ICON_CACHE_LOOKUPS = REGISTRY.counter('icon_cache_lookups', "Weather icon cache lookups", ('result',))
 
 class Resources:
     """Resource manager for the application"""
@@ -54,16 +60,44 @@ class Resources:
         # Try HTTP first as it's more likely to work with SSL issues
         return cls.WEATHER_ICON_URLS[0].format(icon_code=icon_code)
 
+    # Downloaded icons by code; OpenWeather only has a few dozen
+    _icon_cache = {}
+
     @classmethod
     def download_icon(cls, icon_code: str) -> Optional[bytes]:
         """Download weather icon and return the raw data"""
+        cached = cls._icon_cache.get(icon_code)
+        if cached is not None:
+            ICON_CACHE_LOOKUPS.inc(result='hit')
+            return cached
+        ICON_CACHE_LOOKUPS.inc(result='miss')
+
         for url_template in cls.WEATHER_ICON_URLS:
             try:
                 url = url_template.format(icon_code=icon_code)
-                response = requests.get(url, timeout=5)
+                with ICON_DOWNLOAD_LATENCY.time(), span("icon download", "http", icon=icon_code):
+                    response = requests.get(url, timeout=5)
                 if response.status_code == 200:
+                    cls._icon_cache[icon_code] = response.content
                     return response.content
             except Exception as e:
+                ICON_DOWNLOAD_ERRORS.inc()
                 print(f"Error downloading icon from {url}: {e}")
                 continue
-        return None 
\ No newline at end of file
+        return None
+
+    @classmethod
+    def cached_icon(cls, icon_code: str) -> Optional[bytes]:
+        """A downloaded icon, or None; never downloads, so it is safe on the GUI thread"""
+        return cls._icon_cache.get(icon_code)
+
+    @classmethod
+    def cached_icons(cls, icon_codes) -> Dict[str, bytes]:
+        """Downloaded icons for the given codes (those not yet downloaded are skipped)"""
+        return {code: cls._icon_cache[code] for code in icon_codes if code in cls._icon_cache}
+
+    @classmethod
+    def add_icons(cls, icons: Dict[str, bytes]):
+        """Seed the icon cache, e.g. from the saved UI state, so they need no download"""
+        for code, data in icons.items():
+            cls._icon_cache.setdefault(code, data)
@@ -0,0 +1,297 @@
+"""Declarative weather rule engine.
+
+Alert and warning rules are loaded from a JSON file and compiled once into
+per-group predicate lists plus a keyword matcher for descriptions, which is
+memoised per distinct description. The file is re-read automatically when it
+changes on disk, so rules can be edited without restarting the app.
+"""
+from dataclasses import dataclass
+from operator import attrgetter, gt, ge, lt, le
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+import json
+import os
+import time
+import numpy as np
+from .config import Config
+
+# Severity levels, lowest first
+SEVERITY_LEVELS = ["low", "medium", "high"]
+
+# Where a fired rule is shown
+PANEL_ALERTS = "alerts"
+PANEL_WARNINGS = "warnings"
+
+NUMERIC_OPS = {'>': gt, '>=': ge, '<': lt, '<=': le}
+
+# Row layout of the compact table returned by evaluate_series
+WARNING_TABLE_DTYPE = np.dtype([
+    ('series', np.int32),      # Index of the series (city) in the batch
+    ('time_index', np.int32),  # Index of the point within that series
+    ('rule', np.int16),        # Index into RuleEngine.rules
+    ('severity', np.int8),     # Index into SEVERITY_LEVELS
+])
+
+@dataclass
+class Rule:
+    """A threshold or keyword rule.
+
+    Rules sharing a ``group`` are mutually exclusive: only the first matching
+    rule of a group fires, like an if/elif chain.
+    """
+    id: str
+    group: str
+    field: str   # WeatherData attribute, or 'description'
+    op: str      # '>', '>=', '<', '<=' or 'contains'
+    value: object
+    severity: str
+    title: str
+    message: str
+    icon: str
+    panel: str = PANEL_WARNINGS
+    hysteresis: Optional[float] = None  # Clear margin used by the alert tracker
+
+    def holds(self, weather_data, hysteresis: float = 0.0) -> bool:
+        """Check the rule with its threshold relaxed by ``hysteresis``.
+
+        Used to decide whether an active alert should clear, so values hovering
+        around the threshold don't flip it on and off.
+        """
+        if self.op == 'contains':
+            return self.value in weather_data.description.lower()
+        actual = getattr(weather_data, self.field)
+        if self.op in ('>', '>='):
+            return NUMERIC_OPS[self.op](actual, self.value - hysteresis)
+        return NUMERIC_OPS[self.op](actual, self.value + hysteresis)
+
+    def format_title(self, weather_data) -> str:
+        """Title with ``{value}`` replaced by the measured value"""
+        if '{value}' not in self.title:
+            return self.title
+        return self.title.format(value=getattr(weather_data, self.field))
+
+class RuleError(ValueError):
+    """Raised when a rules file is invalid"""
+
+def parse_rules(document: Dict) -> List[Rule]:
+    """Validate a rules document and resolve ``$SETTING`` references"""
+    rules = []
+    seen = set()
+    for i, entry in enumerate(document.get('rules', [])):
+        try:
+            rule = Rule(
+                id=entry['id'],
+                group=entry.get('group', entry['id']),
+                field=entry['field'],
+                op=entry['op'],
+                value=entry['value'],
+                severity=entry['severity'],
+                title=entry['title'],
+                message=entry.get('message', ""),
+                icon=entry.get('icon', ""),
+                panel=entry.get('panel', PANEL_WARNINGS),
+                hysteresis=entry.get('hysteresis')
+            )
+        except (KeyError, TypeError) as e:
+            raise RuleError(f"Rule {i}: missing or invalid field {e}")
+
+        if rule.id in seen:
+            raise RuleError(f"Rule {i}: duplicate id '{rule.id}'")
+        seen.add(rule.id)
+        if rule.severity not in SEVERITY_LEVELS:
+            raise RuleError(f"Rule '{rule.id}': unknown severity '{rule.severity}'")
+        if rule.panel not in (PANEL_ALERTS, PANEL_WARNINGS):
+            raise RuleError(f"Rule '{rule.id}': unknown panel '{rule.panel}'")
+
+        if isinstance(rule.value, str) and rule.value.startswith('$'):
+            setting = rule.value[1:]
+            if not hasattr(Config, setting):
+                raise RuleError(f"Rule '{rule.id}': unknown setting '{setting}'")
+            rule.value = getattr(Config, setting)
+
+        if rule.hysteresis is not None and not isinstance(rule.hysteresis, (int, float)):
+            raise RuleError(f"Rule '{rule.id}': hysteresis must be numeric")
+
+        if rule.op == 'contains':
+            if rule.field != 'description' or not isinstance(rule.value, str):
+                raise RuleError(f"Rule '{rule.id}': 'contains' needs a description keyword")
+            rule.value = rule.value.lower()
+        elif rule.op in NUMERIC_OPS:
+            if not isinstance(rule.value, (int, float)):
+                raise RuleError(f"Rule '{rule.id}': '{rule.op}' needs a numeric value")
+        else:
+            raise RuleError(f"Rule '{rule.id}': unknown op '{rule.op}'")
+        rules.append(rule)
+    return rules
+
+class RuleEngine:
+    """Compiled evaluator for weather rules"""
+
+    DEFAULT_RULES_FILE = Path(__file__).parent / 'default_rules.json'
+
+    # Limit on memoised descriptions (OpenWeather uses a small fixed vocabulary)
+    MAX_CACHED_DESCRIPTIONS = 1024
+
+    _shared: Optional['RuleEngine'] = None
+
+    def __init__(self, path: Optional[Path] = None, check_interval: float = 2.0):
+        self.path = Path(path) if path else None
+        self.check_interval = check_interval
+        self.rules: List[Rule] = []
+        self._signature = None
+        self._last_check = 0.0
+        self.reload()
+
+    @classmethod
+    def shared(cls) -> 'RuleEngine':
+        """Get the engine used by the app"""
+        if cls._shared is None:
+            cls._shared = cls(Config.RULES_FILE)
+        return cls._shared
+
+    def source(self) -> Path:
+        """The rules file in effect: the user file if present, otherwise the defaults"""
+        if self.path and self.path.exists():
+            return self.path
+        return self.DEFAULT_RULES_FILE
+
+    def _file_signature(self, path: Path) -> Tuple:
+        stat = os.stat(path)
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+
+    def _load(self, path: Path):
+        """Read, validate and compile a rules file"""
+        with open(path, encoding='utf-8') as f:
+            self._compile(parse_rules(json.load(f)))
+
+    def reload(self) -> bool:
+        """Load and compile the rules file; keeps the current rules if it is invalid"""
+        path = self.source()
+        signature = None
+        try:
+            signature = self._file_signature(path)
+            self._load(path)
+            return True
+        except (OSError, ValueError) as e:
+            print(f"Error loading rules from {path}: {e}")
+            if not self.rules and path != self.DEFAULT_RULES_FILE:
+                self._load(self.DEFAULT_RULES_FILE)
+            return False
+        finally:
+            # A broken file is only retried once it changes again
+            self._signature = signature
+
+    def reload_if_changed(self) -> bool:
+        """Reload the rules if the file changed (checked at most every check_interval)"""
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return False
+        self._last_check = now
+
+        path = self.source()
+        try:
+            signature = self._file_signature(path)
+        except OSError:
+            return False
+        if signature == self._signature:
+            return False
+        return self.reload()
+
+    def _compile(self, rules: List[Rule]):
+        """Build per-group predicates and the keyword table"""
+        self.rules = rules
+        self.keywords: List[str] = []
+        keyword_index: Dict[str, int] = {}
+        self._description_cache: Dict[str, FrozenSet[int]] = {}
+
+        groups: Dict[str, List[Tuple[Callable, int]]] = {}
+        for rule_number, rule in enumerate(rules):
+            if rule.op == 'contains':
+                if rule.value not in keyword_index:
+                    keyword_index[rule.value] = len(self.keywords)
+                    self.keywords.append(rule.value)
+                keyword = keyword_index[rule.value]
+                predicate = lambda data, matched, keyword=keyword: keyword in matched
+            else:
+                predicate = (lambda data, matched, get=attrgetter(rule.field),
+                             compare=NUMERIC_OPS[rule.op], value=rule.value:
+                             compare(get(data), value))
+            groups.setdefault(rule.group, []).append((predicate, rule_number))
+
+        self._groups = list(groups.values())
+        self._keyword_of_rule = [keyword_index.get(rule.value) if rule.op == 'contains' else None
+                                 for rule in rules]
+
+    def matched_keywords(self, description: str) -> FrozenSet[int]:
+        """Indexes of the keywords contained in a description (memoised)"""
+        matched = self._description_cache.get(description)
+        if matched is None:
+            lowered = description.lower()
+            matched = frozenset(i for i, keyword in enumerate(self.keywords) if keyword in lowered)
+            if len(self._description_cache) >= self.MAX_CACHED_DESCRIPTIONS:
+                self._description_cache.clear()
+            self._description_cache[description] = matched
+        return matched
+
+    def evaluate(self, weather_data) -> List[Rule]:
+        """Get the rules that fire for a single WeatherData, in rule order"""
+        self.reload_if_changed()
+        matched = self.matched_keywords(weather_data.description)
+        fired = []
+        for group in self._groups:
+            for predicate, rule_number in group:
+                if predicate(weather_data, matched):
+                    fired.append(rule_number)
+                    break
+        return [self.rules[i] for i in sorted(fired)]
+
+    def evaluate_series(self, series_list: Sequence) -> np.ndarray:
+        """Run every rule over whole forecast series at once.
+
+        Returns a WARNING_TABLE_DTYPE array sorted by (series, time_index, rule).
+        """
+        self.reload_if_changed()
+        severity_index = {severity: i for i, severity in enumerate(SEVERITY_LEVELS)}
+        chunks = []
+
+        for series_number, series in enumerate(series_list):
+            n = len(series)
+            if not n:
+                continue
+
+            # Keyword hits per distinct condition, broadcast through the condition codes
+            condition_keywords = [self.matched_keywords(description)
+                                  for description, _ in series.conditions]
+
+            remaining = {}
+            for rule_number, rule in enumerate(self.rules):
+                if rule.op == 'contains':
+                    keyword = self._keyword_of_rule[rule_number]
+                    by_condition = np.array([keyword in matched for matched in condition_keywords],
+                                            dtype=bool)
+                    mask = by_condition[series.condition_codes]
+                else:
+                    mask = NUMERIC_OPS[rule.op](getattr(series, rule.field), rule.value)
+
+                free = remaining.setdefault(rule.group, np.ones(n, dtype=bool))
+                hits = mask & free
+                free &= ~hits
+                time_index = np.flatnonzero(hits)
+                if not len(time_index):
+                    continue
+                chunk = np.empty(len(time_index), dtype=WARNING_TABLE_DTYPE)
+                chunk['series'] = series_number
+                chunk['time_index'] = time_index
+                chunk['rule'] = rule_number
+                chunk['severity'] = severity_index[rule.severity]
+                chunks.append(chunk)
+
+        if not chunks:
+            return np.empty(0, dtype=WARNING_TABLE_DTYPE)
+        table = np.concatenate(chunks)
+        return table[np.lexsort((table['rule'], table['time_index'], table['series']))]
+
+    def panel_rule_numbers(self, panel: str) -> np.ndarray:
+        """Indexes of the rules shown in a panel"""
+        return np.array([i for i, rule in enumerate(self.rules) if rule.panel == panel],
+                        dtype=np.int16)
@@ -1,3 +1,5 @@
+from .weather_warnings import WeatherWarnings
+
 class Styles:
     """Application-wide styles"""
     
@@ -24,117 +26,141 @@ class Styles:
     PADDING = "20px"
     SPACING = "15px"
     
-    # Styles
-    RAINBOW_ANIMATION = """
-        @keyframes rainbow {
-            0% { border-color: #ff0000; }
-            17% { border-color: #ff00ff; }
-            33% { border-color: #0000ff; }
-            50% { border-color: #00ffff; }
-            67% { border-color: #00ff00; }
-            83% { border-color: #ffff00; }
-            100% { border-color: #ff0000; }
-        }
-    """
+    @staticmethod
+    def rgba(color: str, alpha: int) -> str:
+        """A #RRGGBB color with alpha (Qt reads 8-digit hex as #AARRGGBB)"""
+        red, green, blue = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+        return f"rgba({red}, {green}, {blue}, {alpha})"
     
-    MAIN_WINDOW = f"""
-        QMainWindow {{
-            background-color: {BACKGROUND_COLOR};
-            border: 2px solid {PRIMARY_COLOR};
+    @classmethod
+    def stylesheet(cls) -> str:
+        """The whole application's stylesheet, built from the current colors.
+        
+        Widgets are selected by class and object name, and their state
+        (hover, selected, severity) by pseudo-states and dynamic properties,
+        so nothing needs to call setStyleSheet after startup.
+        """
+        severities = "".join(f"""
+        WarningCard[severity="{severity}"] {{
+            background-color: {color}22;
+            border-color: {color};
+        }}""" for severity, color in WeatherWarnings.SEVERITY_COLORS.items())
+        
+        return f"""
+        MainWindow {{
+            background-color: {cls.BACKGROUND_COLOR};
+        }}
+        QLineEdit#cityInput {{
+            padding: 10px;
+            border: 1px solid {cls.BORDER_COLOR};
+            border-radius: 5px;
+            font-size: 14px;
+            background-color: {cls.CARD_COLOR};
+            color: {cls.TEXT_COLOR};
         }}
-    """
-    
-    WEATHER_CARD = f"""
-        QFrame {{
-            background-color: {CARD_COLOR};
-            border-radius: {BORDER_RADIUS};
-            padding: {PADDING};
+        QLineEdit#cityInput:focus {{
+            border-color: {cls.PRIMARY_COLOR};
+        }}
+        QPushButton#searchButton {{
+            background-color: {cls.PRIMARY_COLOR};
+            color: {cls.BACKGROUND_COLOR};
+            border: none;
+            padding: 10px 20px;
+            border-radius: 5px;
+            font-size: 14px;
+            font-weight: bold;
+        }}
+        QPushButton#searchButton:hover {{
+            background-color: {cls.PRIMARY_DARK};
+        }}
+        QLabel#sectionTitle {{
+            color: {cls.TEXT_COLOR};
+            font-size: 14px;
+            font-weight: bold;
+            margin: 0px;
+        }}
+        QLabel#nextWarning {{
+            color: {cls.SECONDARY_TEXT};
+        }}
+        
+        WeatherCard {{
+            background-color: {cls.CARD_COLOR};
+            border-radius: {cls.BORDER_RADIUS};
+            padding: {cls.PADDING};
             margin: 10px;
-            border: 1px solid {BORDER_COLOR};
+            border: 1px solid {cls.BORDER_COLOR};
         }}
-        QLabel {{
-            color: {TEXT_COLOR};
+        WeatherCard QLabel {{
+            color: {cls.TEXT_COLOR};
             margin: 5px;
         }}
         QLabel#locationLabel {{
             font-size: 24px;
             font-weight: bold;
-            color: {PRIMARY_COLOR};
-            font-family: {FONT_FAMILY};
+            color: {cls.PRIMARY_COLOR};
+            font-family: {cls.FONT_FAMILY};
         }}
         QLabel#temperatureLabel {{
             font-size: 48px;
             font-weight: bold;
-            color: {TEXT_COLOR};
-            font-family: {FONT_FAMILY};
+            color: {cls.TEXT_COLOR};
+            font-family: {cls.FONT_FAMILY};
         }}
         QLabel#descriptionLabel {{
             font-size: 18px;
-            color: {SECONDARY_TEXT};
-            font-family: {FONT_FAMILY};
+            color: {cls.SECONDARY_TEXT};
+            font-family: {cls.FONT_FAMILY};
         }}
-    """
-    
-    SEARCH_BAR = f"""
-        QLineEdit {{
-            padding: 10px;
-            border: 1px solid {BORDER_COLOR};
-            border-radius: 5px;
-            font-size: 14px;
-            background-color: {CARD_COLOR};
-            color: {TEXT_COLOR};
+        QFrame#separator {{
+            background-color: {cls.BORDER_COLOR};
         }}
-        QLineEdit:focus {{
-            border-color: {PRIMARY_COLOR};
+        QLabel#nowcastLabel {{
+            color: {cls.SECONDARY_TEXT};
+            font-size: 11px;
         }}
-        QPushButton {{
-            background-color: {PRIMARY_COLOR};
-            color: {BACKGROUND_COLOR};
-            border: none;
-            padding: 10px 20px;
+        
+        DetailWidget {{
+            background-color: {cls.CARD_COLOR};
             border-radius: 5px;
+            padding: 10px;
+            border: 1px solid {cls.BORDER_COLOR};
+        }}
+        DetailWidget QLabel {{
+            color: {cls.TEXT_COLOR};
             font-size: 14px;
-            font-weight: bold;
         }}
-        QPushButton:hover {{
-            background-color: {PRIMARY_DARK};
+        QLabel#detailIcon {{
+            font-size: 24px;
+        }}
+        QLabel#detailTitle {{
+            color: #666666;
         }}
-    """
-    
-    ALERTS_FRAME = f"""
-        QFrame {{
-            background-color: {ERROR_BG};
-            border-radius: 5px;
-            padding: {PADDING};
-            border: 1px solid {ERROR_COLOR};
+        QLabel#detailValue {{
+            font-weight: bold;
         }}
-        QLabel {{
-            color: {ERROR_COLOR};
+        QLabel#detailSecondary {{
+            color: {cls.SECONDARY_TEXT};
+            font-size: 11px;
         }}
-    """
-    
-    DETAILS_WIDGET = f"""
-        QFrame {{
-            background-color: {CARD_COLOR};
+        
+        QFrame#alertsFrame {{
+            background-color: {cls.ERROR_BG};
             border-radius: 5px;
-            padding: 10px;
-            border: 1px solid {BORDER_COLOR};
+            padding: {cls.PADDING};
+            border: 1px solid {cls.ERROR_COLOR};
         }}
-        QLabel {{
-            color: {TEXT_COLOR};
-            font-size: 14px;
+        QFrame#alertsFrame QLabel {{
+            color: {cls.ERROR_COLOR};
         }}
-    """
-    
-    WARNING_CARD = f"""
-        QFrame {{
+        
+        WarningCard {{
             border-radius: 5px;
             padding: 10px;
             margin: 5px;
             border: 1px solid;
-        }}
-        QLabel {{
-            color: inherit;
+        }}{severities}
+        WarningCard QLabel {{
+            color: {cls.TEXT_COLOR};
         }}
         QLabel#warningTitle {{
             font-size: 14px;
@@ -146,22 +172,19 @@ class Styles:
         QLabel#warningIcon {{
             font-size: 20px;
         }}
-    """
-    
-    FORECAST_CARD = f"""
-        QFrame {{
-            background-color: {CARD_COLOR};
+        
+        ForecastCard {{
+            background-color: {cls.CARD_COLOR};
             border-radius: 5px;
             padding: 5px;
             margin: 2px;
-            border: 1px solid {BORDER_COLOR};
+            border: 1px solid {cls.BORDER_COLOR};
         }}
-        QFrame:hover {{
-            border-color: {PRIMARY_COLOR};
-            background-color: {CARD_COLOR};
+        ForecastCard:hover, ForecastCard[selected="true"] {{
+            border-color: {cls.PRIMARY_COLOR};
         }}
-        QLabel {{
-            color: {TEXT_COLOR};
+        ForecastCard QLabel {{
+            color: {cls.TEXT_COLOR};
         }}
         QLabel#forecastDate {{
             font-size: 12px;
@@ -173,48 +196,121 @@ class Styles:
         }}
         QLabel#forecastDesc {{
             font-size: 11px;
-            color: {SECONDARY_TEXT};
+            color: {cls.SECONDARY_TEXT};
         }}
         QLabel#forecastDetailLabel {{
             font-size: 10px;
-            color: {SECONDARY_TEXT};
+            color: {cls.SECONDARY_TEXT};
         }}
         QLabel#forecastDetailValue {{
             font-size: 10px;
         }}
         QLabel#forecastDetailSecondary {{
             font-size: 10px;
-            color: {SECONDARY_TEXT};
+            color: {cls.SECONDARY_TEXT};
         }}
-    """
-    
-    CAMERA_VIEWER = f"""
-        QFrame {{
-            background-color: {CARD_COLOR};
-            border-radius: {BORDER_RADIUS};
+        
+        CameraViewer {{
+            background-color: {cls.CARD_COLOR};
+            border-radius: {cls.BORDER_RADIUS};
             padding: 10px;
             margin: 0px;
-            border: 1px solid {BORDER_COLOR};
+            border: 1px solid {cls.BORDER_COLOR};
+        }}
+        CameraViewer QLabel {{
+            color: {cls.TEXT_COLOR};
         }}
-        QComboBox {{
-            background-color: {CARD_COLOR};
-            color: {TEXT_COLOR};
-            border: 1px solid {BORDER_COLOR};
+        CameraViewer QComboBox {{
+            background-color: {cls.CARD_COLOR};
+            color: {cls.TEXT_COLOR};
+            border: 1px solid {cls.BORDER_COLOR};
             border-radius: 3px;
             padding: 3px;
         }}
-        QComboBox:hover {{
-            border-color: {PRIMARY_COLOR};
+        CameraViewer QComboBox:hover {{
+            border-color: {cls.PRIMARY_COLOR};
         }}
-        QPushButton {{
-            background-color: {PRIMARY_COLOR};
+        CameraViewer QPushButton {{
+            background-color: {cls.PRIMARY_COLOR};
             color: white;
             border: none;
             border-radius: 12px;
             font-size: 14px;
             font-weight: bold;
         }}
-        QPushButton:hover {{
-            background-color: {PRIMARY_DARK};
+        CameraViewer QPushButton:hover {{
+            background-color: {cls.PRIMARY_DARK};
+        }}
+        ResizableLabel {{
+            background-color: {cls.BACKGROUND_COLOR};
+            border: 1px solid {cls.BORDER_COLOR};
+            border-radius: 5px;
+            padding: 5px;
+        }}
+        EventStrip, QWidget#eventStripContents {{
+            background-color: transparent;
+            border: none;
+        }}
+        EventStrip QScrollBar:horizontal {{
+            height: 6px;
+            background: transparent;
+        }}
+        EventStrip QScrollBar::handle:horizontal {{
+            background: {cls.BORDER_COLOR};
+            border-radius: 3px;
+            min-width: 20px;
         }}
-    """ 
\ No newline at end of file
+        EventStrip QScrollBar::add-line:horizontal, EventStrip QScrollBar::sub-line:horizontal {{
+            width: 0px;
+        }}
+        EventTile {{
+            background-color: {cls.BACKGROUND_COLOR};
+            border: 1px solid {cls.BORDER_COLOR};
+            border-radius: 3px;
+        }}
+        EventTile:hover {{
+            border-color: {cls.PRIMARY_COLOR};
+        }}
+        QLabel#eventCaption {{
+            color: {cls.SECONDARY_TEXT};
+            font-size: 9px;
+        }}
+        FullscreenCameraWindow QSlider::groove:horizontal {{
+            height: 4px;
+            background: {cls.BORDER_COLOR};
+            border-radius: 2px;
+        }}
+        FullscreenCameraWindow QSlider::handle:horizontal {{
+            background: {cls.PRIMARY_COLOR};
+            width: 12px;
+            margin: -4px 0px;
+            border-radius: 6px;
+        }}
+        ResizableLabel QSizeGrip {{
+            background-color: {cls.PRIMARY_COLOR};
+            border-radius: 2px;
+        }}
+        
+        PerfHud {{
+            background-color: {cls.rgba(cls.BACKGROUND_COLOR, 0xDD)};
+            color: {cls.ACCENT_COLOR};
+            border: 1px solid {cls.PRIMARY_COLOR};
+            border-radius: 5px;
+            padding: 8px;
+            font-family: {cls.MONOSPACE_FONT};
+            font-size: 11px;
+        }}
+        """
+    
+    @classmethod
+    def apply(cls, app, **colors):
+        """Style the whole application, optionally overriding colors first.
+        
+        Switching theme is a single call, e.g.
+        ``Styles.apply(app, PRIMARY_COLOR="#00838F", PRIMARY_DARK="#005662")``.
+        """
+        for name, value in colors.items():
+            if not hasattr(cls, name):
+                raise AttributeError(f"Unknown style color {name}")
+            setattr(cls, name, value)
+        app.setStyleSheet(cls.stylesheet())
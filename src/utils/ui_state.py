@@ -0,0 +1,141 @@
+"""Last-known UI state for an instant first paint.
+
+After each successful refresh the main window saves what it rendered: the
+city, the current weather, the forecast, the weather icons it used, the
+7-day chart as a PNG and the last camera frame. On the next launch the
+window shows this before the event loop starts, so a kiosk paints real
+content straight after a reboot and refreshes in the background.
+
+The file is an uncompressed NumPy ``.npz`` archive in ``Config.CACHE_DIR``:
+forecast columns are stored as their own arrays, images as raw bytes and
+everything else as one JSON record. It is loaded without pickling and
+replaced atomically, so a crash mid-save leaves the previous state.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+import json
+import os
+import time
+import zipfile
+import numpy as np
+from .config import Config
+from ..models.weather_data import ForecastData, ForecastSeries, PrecipitationSeries, WeatherData
+
+# Bumped when the layout changes; older files are ignored
+STATE_VERSION = 1
+
+SERIES_COLUMNS = ('timestamps', 'temperature', 'feels_like', 'humidity', 'wind_speed',
+                  'wind_deg', 'pressure', 'condition_codes', 'precipitation', 'pop')
+
+def _blob(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype=np.uint8)
+
+@dataclass
+class UiState:
+    """What the main window showed after its last successful refresh"""
+    city: str
+    current: WeatherData
+    forecast: Optional[ForecastData] = None
+    pressure_trend: str = "–"
+    icons: Dict[str, bytes] = field(default_factory=dict)  # Icon code -> PNG
+    chart: Optional[bytes] = None  # 7-day chart as PNG
+    camera: Optional[str] = None
+    camera_frame: Optional[bytes] = None  # JPEG as received from Frigate
+    saved_at: float = 0.0
+
+    @staticmethod
+    def default_path() -> Path:
+        return Config.CACHE_DIR / "ui_state.npz"
+
+    def save(self, path: Path = None):
+        """Write the state, replacing the previous file atomically"""
+        path = Path(path) if path is not None else self.default_path()
+        current = {name: getattr(self.current, name) for name in WeatherData.__slots__}
+        current['timestamp'] = self.current.timestamp.timestamp()
+        meta = {
+            'version': STATE_VERSION,
+            'saved_at': self.saved_at or time.time(),
+            'city': self.city,
+            'current': current,
+            'pressure_trend': self.pressure_trend,
+            'camera': self.camera,
+            'icons': sorted(self.icons),
+        }
+        arrays = {f'icon.{code}': _blob(data) for code, data in self.icons.items()}
+        if self.forecast is not None:
+            meta['forecast'] = {'location': self.forecast.location}
+            for name in ('daily', 'hourly'):
+                series = getattr(self.forecast, name)
+                if series is None:
+                    continue
+                meta['forecast'][name] = {'location': series.location, 'conditions': series.conditions}
+                for column in SERIES_COLUMNS:
+                    arrays[f'{name}.{column}'] = getattr(series, column)
+            minutely = self.forecast.minutely
+            if minutely is not None:
+                meta['forecast']['minutely'] = {'location': minutely.location}
+                arrays['minutely.timestamps'] = minutely.timestamps
+                arrays['minutely.precipitation'] = minutely.precipitation
+        if self.chart:
+            arrays['chart'] = _blob(self.chart)
+        if self.camera_frame:
+            arrays['camera_frame'] = _blob(self.camera_frame)
+        arrays['meta'] = _blob(json.dumps(meta).encode())
+
+        temporary = path.with_suffix('.tmp')
+        try:
+            with open(temporary, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(temporary, path)
+        except OSError as e:
+            print(f"Error saving UI state: {e}")
+
+    @classmethod
+    def load(cls, path: Path = None) -> Optional['UiState']:
+        """Read the saved state, or None if there is none (or it is unreadable)"""
+        path = Path(path) if path is not None else cls.default_path()
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                arrays = {name: archive[name] for name in archive.files}
+            meta = json.loads(arrays['meta'].tobytes())
+            if meta.get('version') != STATE_VERSION:
+                return None
+
+            current = dict(meta['current'])
+            current['timestamp'] = datetime.fromtimestamp(current['timestamp'])
+            forecast = None
+            if 'forecast' in meta:
+                series = {}
+                for name in ('daily', 'hourly'):
+                    info = meta['forecast'].get(name)
+                    if info is not None:
+                        # Columns up to condition_codes are positional; the rest are keywords
+                        series[name] = ForecastSeries(
+                            info['location'], *(arrays[f'{name}.{column}'] for column in SERIES_COLUMNS[:8]),
+                            [tuple(condition) for condition in info['conditions']],
+                            precipitation=arrays[f'{name}.precipitation'], pop=arrays[f'{name}.pop'])
+                minutely = meta['forecast'].get('minutely')
+                if minutely is not None:
+                    minutely = PrecipitationSeries(minutely['location'], arrays['minutely.timestamps'],
+                                                   arrays['minutely.precipitation'])
+                forecast = ForecastData(meta['forecast']['location'], series['daily'],
+                                        series.get('hourly'), minutely)
+
+            return cls(
+                city=meta['city'],
+                current=WeatherData(**current),
+                forecast=forecast,
+                pressure_trend=meta['pressure_trend'],
+                icons={code: arrays[f'icon.{code}'].tobytes() for code in meta['icons']},
+                chart=arrays['chart'].tobytes() if 'chart' in arrays else None,
+                camera=meta['camera'],
+                camera_frame=arrays['camera_frame'].tobytes() if 'camera_frame' in arrays else None,
+                saved_at=meta['saved_at']
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, zipfile.BadZipFile) as e:
+            print(f"Error loading UI state: {e}")
+            return None
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Sequence, Tuple
+import time
+import numpy as np
+from .rule_engine import Rule, RuleEngine, PANEL_WARNINGS, SEVERITY_LEVELS
 
 @dataclass
 class WeatherWarning:
@@ -11,19 +14,20 @@ class WeatherWarning:
 
 class WeatherWarnings:
     """Weather warnings manager"""
-    
+
     # Severity levels
     SEVERITY_LOW = "low"
     SEVERITY_MEDIUM = "medium"
     SEVERITY_HIGH = "high"
-    
+    SEVERITY_LEVELS = SEVERITY_LEVELS
+
     # Severity colors (dark theme)
     SEVERITY_COLORS = {
         SEVERITY_LOW: "#FDD835",      # Yellow
         SEVERITY_MEDIUM: "#FB8C00",   # Orange
         SEVERITY_HIGH: "#D32F2F"      # Red
     }
-    
+
     # Warning icons
     ICONS = {
         "temperature_high": "🌡️",
@@ -34,97 +38,65 @@ class WeatherWarnings:
         "humidity": "💧",
         "snow": "🌨️"
     }
-    
+
+    @classmethod
+    def from_rules(cls, rules: Sequence[Rule], weather_data=None) -> List[WeatherWarning]:
+        """Build warnings for fired rules"""
+        return [
+            WeatherWarning(
+                severity=rule.severity,
+                title=rule.format_title(weather_data) if weather_data is not None else rule.title,
+                message=rule.message,
+                icon=rule.icon
+            )
+            for rule in rules
+        ]
+
     @classmethod
     def check_warnings(cls, weather_data) -> List[WeatherWarning]:
         """Check for all possible weather warnings"""
-        warnings = []
-        
-        # Temperature warnings
-        if weather_data.temperature > 35:
-            warnings.append(WeatherWarning(
-                severity=cls.SEVERITY_HIGH,
-                title="Extreme Heat Warning",
-                message="Temperature is dangerously high. Stay hydrated and avoid prolonged sun exposure.",
-                icon=cls.ICONS["temperature_high"]
-            ))
-        elif weather_data.temperature > 30:
-            warnings.append(WeatherWarning(
-                severity=cls.SEVERITY_MEDIUM,
-                title="High Temperature Alert",
-                message="High temperatures expected. Stay hydrated and seek shade when possible.",
-                icon=cls.ICONS["temperature_high"]
-            ))
-        elif weather_data.temperature < 0:
-            warnings.append(WeatherWarning(
-                severity=cls.SEVERITY_HIGH,
-                title="Freezing Temperature Warning",
-                message="Temperature is below freezing. Risk of ice formation.",
-                icon=cls.ICONS["temperature_low"]
-            ))
-        elif weather_data.temperature < 5:
-            warnings.append(WeatherWarning(
-                severity=cls.SEVERITY_MEDIUM,
-                title="Low Temperature Alert",
-                message="Cold temperatures expected. Dress warmly.",
-                icon=cls.ICONS["temperature_low"]
-            ))
-        
-        # Wind warnings
-        if weather_data.wind_speed > 20:
-            warnings.append(WeatherWarning(
-                severity=cls.SEVERITY_HIGH,
-                title="Strong Wind Warning",
-                message="Dangerous wind conditions. Secure loose objects and avoid unnecessary travel.",
-                icon=cls.ICONS["wind"]
-            ))
-        elif weather_data.wind_speed > 15:
-            warnings.append(WeatherWarning(
-                severity=cls.SEVERITY_MEDIUM,
-                title="Wind Advisory",
-                message="Strong winds expected. Exercise caution outdoors.",
-                icon=cls.ICONS["wind"]
-            ))
-        
-        # Storm warnings
-        if "thunderstorm" in weather_data.description.lower():
-            warnings.append(WeatherWarning(
-                severity=cls.SEVERITY_HIGH,
-                title="Thunderstorm Warning",
-                message="Severe thunderstorm conditions. Seek shelter immediately.",
-                icon=cls.ICONS["storm"]
-            ))
-        elif "storm" in weather_data.description.lower():
-            warnings.append(WeatherWarning(
-                severity=cls.SEVERITY_MEDIUM,
-                title="Storm Alert",
-                message="Stormy conditions expected. Stay prepared.",
-                icon=cls.ICONS["storm"]
-            ))
-        
-        # Rain and snow warnings
-        if "heavy rain" in weather_data.description.lower():
-            warnings.append(WeatherWarning(
-                severity=cls.SEVERITY_MEDIUM,
-                title="Heavy Rain Alert",
-                message="Heavy rainfall expected. Be aware of flooding risks.",
-                icon=cls.ICONS["rain"]
-            ))
-        elif "snow" in weather_data.description.lower():
-            warnings.append(WeatherWarning(
-                severity=cls.SEVERITY_MEDIUM,
-                title="Snow Alert",
-                message="Snowy conditions expected. Exercise caution while traveling.",
-                icon=cls.ICONS["snow"]
-            ))
-        
-        # Humidity warnings
-        if weather_data.humidity > 85:
-            warnings.append(WeatherWarning(
-                severity=cls.SEVERITY_LOW,
-                title="High Humidity Alert",
-                message="Very humid conditions. Stay hydrated.",
-                icon=cls.ICONS["humidity"]
-            ))
-        
-        return warnings 
\ No newline at end of file
+        fired = RuleEngine.shared().evaluate(weather_data)
+        return cls.from_rules([r for r in fired if r.panel == PANEL_WARNINGS], weather_data)
+
+    @classmethod
+    def evaluate_series(cls, *series_list) -> np.ndarray:
+        """Evaluate every alert and warning rule over one or more ForecastSeries.
+
+        Returns a WARNING_TABLE_DTYPE table; ``rule`` indexes
+        ``RuleEngine.shared().rules`` and ``series`` indexes the arguments, so
+        many cities can be evaluated in one call.
+        """
+        return RuleEngine.shared().evaluate_series(series_list)
+
+    @classmethod
+    def warning_for(cls, table_row, series=None) -> WeatherWarning:
+        """Build the WeatherWarning for a row of an evaluated table"""
+        rule = RuleEngine.shared().rules[table_row['rule']]
+        point = series[int(table_row['time_index'])] if series is not None else None
+        return cls.from_rules([rule], point)[0]
+
+    @classmethod
+    def next_warning(cls, series, table: np.ndarray, series_number: int = 0,
+                     now: Optional[float] = None,
+                     min_severity: str = SEVERITY_LOW) -> Optional[Tuple[float, WeatherWarning]]:
+        """Get (seconds until onset, warning) for the next warning in a series"""
+        now = time.time() if now is None else now
+        min_level = cls.SEVERITY_LEVELS.index(min_severity)
+        rows = table[(table['series'] == series_number) & (table['severity'] >= min_level)]
+        if not len(rows):
+            return None
+
+        onsets = series.timestamps[rows['time_index']]
+        # A point that started before now is still in effect until the next point
+        upcoming = np.flatnonzero(onsets >= now - cls._point_spacing(series))
+        if not len(upcoming):
+            return None
+        row = rows[upcoming[0]]
+        return max(0.0, float(series.timestamps[row['time_index']] - now)), cls.warning_for(row, series)
+
+    @staticmethod
+    def _point_spacing(series) -> int:
+        """Spacing in seconds between consecutive points of a series"""
+        if len(series) < 2:
+            return 0
+        return int(series.timestamps[1] - series.timestamps[0])
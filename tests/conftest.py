@@ -0,0 +1,11 @@
+import os
+import pytest
+
+# Widget tests run without a display
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+@pytest.fixture(scope='session')
+def qapp():
+    """The QApplication shared by the widget tests"""
+    QtWidgets = pytest.importorskip('PyQt5.QtWidgets')
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
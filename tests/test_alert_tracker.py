@@ -0,0 +1,42 @@
+from datetime import datetime
+from src.models.weather_data import WeatherData
+from src.notifications.alert_tracker import (AlertTracker, ALERT_RAISED, ALERT_CHANGED,
+                                             ALERT_CLEARED)
+from src.utils.rule_engine import RuleEngine
+
+def observation(temperature, description='clear sky'):
+    return WeatherData(temperature=temperature, feels_like=temperature, humidity=50,
+                       wind_speed=1.0, wind_deg=0, pressure=1013, description=description,
+                       timestamp=datetime.now(), location="London", icon_code='01d')
+
+def make_tracker(min_hold=600):
+    return AlertTracker(RuleEngine(path=None), min_hold=min_hold)
+
+def test_only_transitions_are_reported():
+    tracker = make_tracker()
+    events = tracker.update(observation(31), now=0)
+    assert [(e.kind, e.rule.id) for e in events] == [(ALERT_RAISED, 'high_temperature')]
+    assert tracker.update(observation(31.5), now=60) == []
+    assert [rule.id for rule in tracker.active("London")] == ['high_temperature']
+
+def test_hysteresis_prevents_flicker():
+    tracker = make_tracker(min_hold=0)
+    tracker.update(observation(30.5), now=0)
+    # Dipping just below the threshold stays within the 1°C clear margin
+    assert tracker.update(observation(29.5), now=60) == []
+    assert tracker.update(observation(30.2), now=120) == []
+    events = tracker.update(observation(28.5), now=180)
+    assert [e.kind for e in events] == [ALERT_CLEARED]
+
+def test_minimum_hold_time():
+    tracker = make_tracker(min_hold=600)
+    tracker.update(observation(31), now=0)
+    assert tracker.update(observation(20), now=300) == []
+    assert [e.kind for e in tracker.update(observation(20), now=601)] == [ALERT_CLEARED]
+
+def test_escalation_is_immediate():
+    tracker = make_tracker()
+    tracker.update(observation(31), now=0)
+    events = tracker.update(observation(36), now=10)
+    assert [(e.kind, e.previous.id, e.rule.id) for e in events] == \
+        [(ALERT_CHANGED, 'high_temperature', 'heat_alert')]
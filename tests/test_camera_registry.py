@@ -0,0 +1,36 @@
+from src.api.camera_registry import CameraRegistry
+
+def camera(name, width=1280):
+    return {'name': name, 'width': width, 'height': 720, 'fps': 5}
+
+class FakeFrigate:
+    def __init__(self, cameras):
+        self.cameras = cameras
+
+    def fetch_cameras(self):
+        if self.cameras is None:
+            raise ConnectionError("offline")
+        return list(self.cameras)
+
+def test_refresh_reports_additions_removals_and_updates(tmp_path):
+    frigate = FakeFrigate([camera("front"), camera("back")])
+    registry = CameraRegistry(frigate, tmp_path / "cameras.json")
+    diff = registry.refresh()
+    assert [c['name'] for c in diff.added] == ["front", "back"]
+
+    frigate.cameras = [camera("front", width=1920), camera("garage")]
+    diff = registry.refresh()
+    assert [c['name'] for c in diff.added] == ["garage"]
+    assert [c['name'] for c in diff.removed] == ["back"]
+    assert [c['name'] for c in diff.updated] == ["front"]
+    assert not registry.refresh().changed
+
+def test_starts_from_cache(tmp_path):
+    path = tmp_path / "cameras.json"
+    CameraRegistry(FakeFrigate([camera("front")]), path).refresh()
+    registry = CameraRegistry(FakeFrigate(None), path)
+    assert registry.names() == ["front"]
+
+    # An unreachable Frigate keeps the cached list
+    assert not registry.refresh().changed
+    assert registry.names() == ["front"]
@@ -0,0 +1,61 @@
+import copy
+from datetime import datetime
+from src.api.onecall_parser import parse_series
+from src.models.change_detection import ChangeDetector, weather_key
+from src.models.weather_data import ForecastData, WeatherData
+
+def daily(temperatures):
+    return [
+        {
+            'dt': 1760000000 + 86400 * i,
+            'temp': {'day': temperature},
+            'feels_like': {'day': temperature - 1},
+            'humidity': 60,
+            'wind_speed': 5.0,
+            'wind_deg': 90,
+            'pressure': 1015,
+            'weather': [{'description': 'clear sky', 'icon': '01d'}]
+        }
+        for i, temperature in enumerate(temperatures)
+    ]
+
+def forecast(temperatures, hourly=None):
+    return ForecastData(location="London", daily=parse_series(daily(temperatures), "London"),
+                        hourly=parse_series(hourly or daily(temperatures[:2]), "London"))
+
+def observation(ts=1760000000, temperature=12.0):
+    return WeatherData(temperature=temperature, feels_like=11.0, humidity=70, wind_speed=3.0,
+                       wind_deg=200, pressure=1012, description="clear sky",
+                       timestamp=datetime.fromtimestamp(ts), location="London", icon_code='01d')
+
+def test_first_refresh_changes_everything():
+    changes = ChangeDetector().update(observation(), forecast([20, 21, 22]))
+    assert changes.observation and changes.chart and changes.hourly
+    assert changes.days == (0, 1, 2)
+
+def test_identical_refresh_is_unchanged():
+    detector = ChangeDetector()
+    detector.update(observation(), forecast([20, 21, 22]))
+    assert detector.update(copy.deepcopy(observation()), forecast([20, 21, 22])).unchanged
+
+def test_only_changed_parts_are_dirty():
+    detector = ChangeDetector()
+    detector.update(observation(), forecast([20, 21, 22], hourly=daily([5, 6])))
+
+    # Same values republished with a new observation time
+    changes = detector.update(observation(ts=1760000600), forecast([20, 23, 22], hourly=daily([5, 6])))
+    assert changes.observation
+    assert weather_key(observation(ts=1760000600)) == weather_key(observation())
+    assert changes.days == (1,)
+    assert changes.chart and not changes.hourly
+
+def test_day_count_change_dirties_all_days():
+    detector = ChangeDetector()
+    detector.update(observation(), forecast([20, 21, 22]))
+    assert detector.update(observation(), forecast([20, 21])).days == (0, 1)
+
+def test_reset_forgets_previous_refresh():
+    detector = ChangeDetector()
+    detector.update(observation(), forecast([20, 21]))
+    detector.reset()
+    assert not detector.update(observation(), forecast([20, 21])).unchanged
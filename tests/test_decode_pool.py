@@ -0,0 +1,48 @@
+import time
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QSize
+from PyQt5.QtGui import QColor, QImage
+
+from src.ui.decode_pool import DecodePool, decode_image, gray_thumbnail
+
+def jpeg(width=1280, height=720):
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(QColor("#336699"))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "JPG")
+    return bytes(data)
+
+def test_decodes_to_fit_size():
+    image = decode_image(jpeg(), QSize(320, 320))
+    assert (image.width(), image.height()) == (320, 180)
+    # Never scaled up
+    assert decode_image(jpeg(), QSize(4000, 4000)).width() == 1280
+
+def test_pool_delivers_latest_frame_per_key(qapp):
+    pool = DecodePool(workers=2)
+    results = []
+    try:
+        for width in (640, 800, 960):
+            pool.submit("front", jpeg(width, 360), QSize(2000, 2000), lambda image: results.append(image.width()))
+        deadline = time.monotonic() + 5
+        while len(results) < 2 and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+    finally:
+        pool.shutdown()
+
+    # The middle frame was replaced while the first was decoding
+    assert results == [640, 960]
+
+def test_inline_decoding_without_workers(qapp):
+    results = []
+    DecodePool(workers=0).submit("front", jpeg(), QSize(160, 90), lambda image: results.append(image.size()))
+    assert results == [QSize(160, 90)]
+
+def test_gray_thumbnail():
+    image = QImage(320, 180, QImage.Format_RGB32)
+    image.fill(QColor("#808080"))
+    thumbnail = gray_thumbnail(image)
+    assert thumbnail.shape == (32, 32)
+    assert abs(int(thumbnail.mean()) - 128) <= 1
@@ -0,0 +1,20 @@
+import numpy as np
+from src.utils.downsample import lttb, lttb_indices
+
+def test_short_series_is_returned_unchanged():
+    assert lttb_indices(np.arange(10), np.arange(10), 50).tolist() == list(range(10))
+
+def test_keeps_endpoints_and_peaks():
+    x = np.arange(5000, dtype=float)
+    y = np.sin(x / 100)
+    y[1234] = 100.0
+    indices = lttb_indices(x, y, 200)
+    assert len(indices) == 200
+    assert indices[0] == 0 and indices[-1] == 4999
+    assert 1234 in indices
+    assert np.all(np.diff(indices) > 0)
+
+def test_lttb_returns_values():
+    x, y = lttb(np.arange(100), np.arange(100) * 2, 10)
+    assert len(x) == len(y) == 10
+    assert np.array_equal(y, x * 2)
@@ -0,0 +1,23 @@
+import time
+from src.ui.event_loop_watchdog import EventLoopWatchdog, STALLS
+
+def blocking_call():
+    time.sleep(0.4)
+
+def test_stall_is_reported_with_stack(qapp, capsys):
+    watchdog = EventLoopWatchdog(threshold=0.2, interval=0.05)
+    watchdog.start()
+    stalls = STALLS.value()
+    try:
+        blocking_call()
+        deadline = time.monotonic() + 1
+        while STALLS.value() == stalls and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.01)
+    finally:
+        watchdog.stop()
+
+    assert STALLS.value() == stalls + 1
+    err = capsys.readouterr().err
+    assert "Event loop stalled for" in err
+    assert "blocking_call" in err
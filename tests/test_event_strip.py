@@ -0,0 +1,75 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QColor, QImage
+
+from src.api.frigate_service import FrigateService
+from src.models.frigate_event import FrigateEvent
+from src.ui.event_strip import EventStrip
+
+def jpeg():
+    image = QImage(320, 200, QImage.Format_RGB32)
+    image.fill(QColor("#336699"))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "JPG")
+    return bytes(data)
+
+@pytest.fixture
+def frigate_server():
+    requests = []
+    thumbnail = jpeg()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append((self.path, self.headers.get('Authorization')))
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/jpeg')
+            self.send_header('Content-Length', str(len(thumbnail)))
+            self.end_headers()
+            self.wfile.write(thumbnail)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", requests
+    server.shutdown()
+
+def test_thumbnails_download_in_background_for_visible_tiles(qapp, frigate_server):
+    url, requests = frigate_server
+    service = FrigateService()
+    service.base_url, service.headers = url, {'Authorization': "Bearer token"}
+    service.events.add([FrigateEvent(id=f"e{i}", camera="front", label="person", start_time=1760000000 + i,
+                                     end_time=1760000001 + i, has_snapshot=True) for i in range(20)])
+    strip = EventStrip(service)
+    strip.resize(250, 84)
+    strip.show()
+    strip.set_camera("front")
+
+    # Refreshing returns before anything is downloaded
+    assert not requests and not service.thumbnails
+    deadline = time.monotonic() + 5
+    requested = lambda: [tile for tile in strip.tiles.values() if tile.thumbnail_requested]
+    while time.monotonic() < deadline and not (
+            requested() and all(tile.thumbnail_label.pixmap() for tile in requested())):
+        qapp.processEvents()
+        time.sleep(0.01)
+
+    shown = [event_id for event_id, tile in strip.tiles.items() if tile.thumbnail_requested]
+    # Only the tiles in view (newest first) are fetched, with the API key
+    assert shown and shown == list(strip.tiles)[:len(shown)] and len(shown) < len(strip.tiles)
+    assert sorted(requests) == sorted((f"/api/events/{event_id}/thumbnail.jpg", "Bearer token")
+                                      for event_id in shown)
+    assert set(service.thumbnails) == set(shown)
+    pixmap = strip.tiles[shown[0]].thumbnail_label.pixmap()
+    assert (pixmap.width(), pixmap.height()) == (64, 40)
+
+    # Scrolling to the end requests the tiles that come into view
+    strip.horizontalScrollBar().setValue(strip.horizontalScrollBar().maximum())
+    assert strip.tiles["e0"].thumbnail_requested
+    strip.close()
@@ -0,0 +1,35 @@
+from src.utils.frame_ring import FrameRing
+
+def test_frames_are_kept_per_camera(tmp_path):
+    ring = FrameRing(tmp_path / "replay.ring", size=1024, window=60)
+    ring.add("front", b"a" * 100, timestamp=1000)
+    ring.add("back", b"b" * 100, timestamp=1001)
+    ring.add("front", b"c" * 100, timestamp=1002)
+    assert ring.timestamps("front", now=1002) == [1000, 1002]
+    assert ring.frame("front", 1002) == b"c" * 100
+    assert ring.frame("back", 1001) == b"b" * 100
+    assert ring.frame("back", 1000) is None
+    ring.close()
+
+def test_overwritten_frames_are_dropped(tmp_path):
+    ring = FrameRing(tmp_path / "replay.ring", size=1000, window=60)
+    for i in range(25):
+        ring.add("front", bytes([i]) * 300, timestamp=1000 + i)
+    # Only three 300-byte frames fit; none straddle the end of the file
+    assert ring.timestamps("front", now=1024) == [1022, 1023, 1024]
+    assert ring.frame("front", 1022) == bytes([22]) * 300
+    assert ring.frame("front", 1021) is None
+    assert (tmp_path / "replay.ring").stat().st_size == 1000
+    ring.close()
+
+def test_frames_expire_after_window(tmp_path):
+    ring = FrameRing(tmp_path / "replay.ring", size=1024, window=60)
+    ring.add("front", b"old", timestamp=1000)
+    ring.add("front", b"new", timestamp=1050)
+    assert ring.timestamps("front", now=1070) == [1050]
+
+def test_disabled_ring_records_nothing(tmp_path):
+    ring = FrameRing(tmp_path / "replay.ring", size=0)
+    ring.add("front", b"frame", timestamp=1000)
+    assert ring.timestamps("front", now=1000) == []
+    assert not (tmp_path / "replay.ring").exists()
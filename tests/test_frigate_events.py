@@ -0,0 +1,137 @@
+from types import SimpleNamespace
+import pytest
+from src.api import frigate_service as frigate_service_module
+from src.api.frigate_service import FrigateService, EVENTS_OVERLAP, EVENTS_PAGE_SIZE
+from src.models.frigate_event import FrigateEvent
+from src.utils.event_index import EventIndex
+
+START = 1760000000
+
+def event(i, camera="front", label="person", ended=True):
+    return FrigateEvent(id=f"e{i}", camera=camera, label=label, start_time=START + 10 * i,
+                        end_time=START + 10 * i + 5 if ended else None, score=0.8)
+
+def test_index_reports_only_new_or_changed_events():
+    index = EventIndex()
+    assert [e.id for e in index.add([event(2), event(1)])] == ["e1", "e2"]
+    assert index.add([event(1), event(2)]) == []
+    assert [e.id for e in index.add([event(2, ended=False)])] == ["e2"]
+
+def test_index_filters_by_camera_and_label():
+    index = EventIndex()
+    index.add([event(1), event(2, label="car"), event(3, camera="back"), event(4)])
+    assert [e.id for e in index.recent("front")] == ["e4", "e2", "e1"]
+    assert [e.id for e in index.recent("front", "person")] == ["e4", "e1"]
+    assert index.labels("front") == {"car": 1, "person": 2}
+
+def test_index_is_bounded():
+    index = EventIndex(max_events=3)
+    index.add([event(i) for i in range(5)])
+    assert len(index) == 3
+    assert [e.id for e in index.recent()] == ["e4", "e3", "e2"]
+    assert index.labels() == {"person": 3}
+
+def test_index_lists_events_in_progress():
+    index = EventIndex()
+    index.add([event(1, ended=False), event(2, ended=False), event(3)])
+    assert index.in_progress() == ["e1", "e2"]
+    assert index.in_progress(since=START + 15) == ["e2"]
+    index.add([event(2)])
+    assert index.in_progress() == ["e1"]
+    assert index.latest == START + 30
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+@pytest.fixture
+def frigate(monkeypatch):
+    requests = []
+    events = [{'id': f"e{i}", 'camera': "front", 'label': "person", 'start_time': START + i,
+               'end_time': START + i + 1, 'top_score': 0.9} for i in range(120)]
+
+    def fake_get(url, params=None, **kwargs):
+        if not url.endswith("/api/events"):
+            event_id = url.rsplit('/', 1)[1]
+            requests.append(event_id)
+            return FakeResponse(next(item for item in events if item['id'] == event_id))
+        requests.append(params)
+        matching = [item for item in events
+                    if ('after' not in params or item['start_time'] > params['after'])
+                    and ('before' not in params or item['start_time'] < params['before'])]
+        matching.sort(key=lambda item: item['start_time'], reverse=True)
+        return FakeResponse(matching[:params['limit']])
+
+    monkeypatch.setattr(frigate_service_module.requests, 'get', fake_get)
+    return FrigateService(), events, requests
+
+def test_polls_transfer_only_new_events(frigate):
+    service, events, requests = frigate
+    # The first poll takes the latest page only
+    assert len(service.poll_events()) == EVENTS_PAGE_SIZE
+    assert 'after' not in requests[0] and requests[0]['include_thumbnails'] == 0
+
+    events.append({'id': "new", 'camera': "back", 'label': "car", 'start_time': START + 500,
+                   'end_time': None, 'top_score': 0.7})
+    assert [e.id for e in service.poll_events()] == ["new"]
+    assert requests[-1]['after'] == START + 119 - EVENTS_OVERLAP
+
+def test_poll_pages_through_bursts(frigate):
+    service, events, requests = frigate
+    service.poll_events()
+    events.extend({'id': f"b{i}", 'camera': "front", 'label': "car", 'start_time': START + 200 + i,
+                   'end_time': START + 201 + i} for i in range(70))
+    assert len(service.poll_events()) == 70
+    assert len(requests) == 3
+
+def test_paging_keeps_events_sharing_the_page_boundary(frigate):
+    service, events, requests = frigate
+    service.poll_events()
+    # 30 events start together; the first page ends part-way through them
+    events.extend({'id': f"b{i}", 'camera': "front", 'label': "car",
+                   'start_time': START + 200 + max(0, i - 29), 'end_time': START + 300} for i in range(70))
+    assert sorted(e.id for e in service.poll_events()) == sorted(f"b{i}" for i in range(70))
+
+def test_open_events_are_refreshed_by_id(frigate, monkeypatch):
+    service, events, requests = frigate
+    monkeypatch.setattr(frigate_service_module, 'time', SimpleNamespace(time=lambda: START + 600))
+    events.append({'id': "open", 'camera': "front", 'label': "car", 'start_time': START + 119.5,
+                   'end_time': None, 'top_score': 0.6})
+    service.poll_events()
+    events.extend({'id': f"n{i}", 'camera': "front", 'label': "person", 'start_time': START + 300 + i,
+                   'end_time': START + 301 + i} for i in range(3))
+    service.poll_events()
+    service.poll_events()
+    # The event in progress does not hold the poll back; it is fetched by id
+    assert requests[-2]['after'] == START + 302 - EVENTS_OVERLAP and requests[-1] == "open"
+    events[-4]['end_time'] = START + 400
+    changed = service.poll_events()
+    assert [e.id for e in changed] == ["open"] and not changed[0].in_progress
+    # Once ended it is no longer refreshed
+    service.poll_events()
+    assert requests[-1] != "open"
+
+def test_stuck_events_stop_being_refreshed(frigate, monkeypatch):
+    service, events, requests = frigate
+    events.append({'id': "stuck", 'camera': "front", 'label': "car", 'start_time': START + 119.5,
+                   'end_time': None, 'top_score': 0.6})
+    service.poll_events()
+    # Two hours later
+    monkeypatch.setattr(frigate_service_module, 'time', SimpleNamespace(time=lambda: START + 7200))
+    events.append({'id': "later", 'camera': "front", 'label': "car", 'start_time': START + 300,
+                   'end_time': START + 301})
+    service.poll_events()
+    service.poll_events()
+    assert requests[-1]['after'] == START + 300 - EVENTS_OVERLAP and "stuck" not in requests
+
+def test_overlapping_polls_are_skipped(frigate):
+    service, events, requests = frigate
+    with service._poll_lock:  # A poll still running on another thread
+        assert service.poll_events() == []
+    assert requests == []
@@ -0,0 +1,36 @@
+from src.api.onecall_parser import parse_alerts
+from src.notifications.government_alerts import GovernmentAlertFeed
+
+def alerts_block(description="Strong winds expected.", end=7200):
+    return parse_alerts([
+        {'sender_name': 'Met Office', 'event': 'Yellow wind warning', 'start': 0, 'end': end,
+         'description': description, 'tags': ['Wind']},
+        {'sender_name': 'Met Office', 'event': 'Flood alert', 'start': 3600, 'end': 10800,
+         'description': "Flooding possible.", 'tags': ['Flood']},
+    ])
+
+def test_only_changes_are_reported():
+    feed = GovernmentAlertFeed()
+    diff = feed.update("London", alerts_block(), now=0)
+    assert [alert.event for alert in diff.new] == ['Yellow wind warning', 'Flood alert']
+    assert not feed.update("London", alerts_block(), now=60).changed
+
+def test_updated_and_expired_alerts():
+    feed = GovernmentAlertFeed()
+    feed.update("London", alerts_block(), now=0)
+    diff = feed.update("London", alerts_block("Gusts up to 70 mph."), now=60)
+    assert [alert.event for alert in diff.updated] == ['Yellow wind warning']
+    assert diff.new == [] and diff.expired == []
+
+    # The wind warning ends, the flood alert is withdrawn
+    diff = feed.update("London", alerts_block(end=7200)[:1], now=8000)
+    assert [alert.event for alert in diff.expired] == ['Yellow wind warning', 'Flood alert']
+    assert feed.active("London") == []
+
+def test_warnings_for_window():
+    feed = GovernmentAlertFeed()
+    feed.update("London", alerts_block(), now=0)
+    assert len(feed.warnings("London")) == 2
+    warnings = feed.warnings("London", start=7300, end=9000)
+    assert [warning.title for warning in warnings] == ['Flood alert (Met Office)']
+    assert warnings[0].severity == 'high'
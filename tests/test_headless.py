@@ -0,0 +1,57 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Runs headless one-shot in a fresh interpreter with WeatherService replaced
+SCRIPT = """
+import sys
+from datetime import datetime
+sys.path.insert(0, {root!r})
+from src.utils.config import Config
+Config.OPENWEATHER_API_KEY = "test"
+Config.METRICS_PORT = 0
+from src.api import weather_service
+from src.api.onecall_parser import OneCallResult
+from src.models.weather_data import WeatherData
+
+class FakeWeatherService:
+    def __init__(self):
+        pass
+
+    def get_weather(self, city):
+        current = WeatherData(temperature=12.3, feels_like=11.0, humidity=80, wind_speed=4.1,
+                              wind_deg=200, pressure=1008, description="light rain",
+                              timestamp=datetime.fromtimestamp(1760000000), location=city,
+                              icon_code="10d")
+        return OneCallResult(current, None)
+
+weather_service.WeatherService = FakeWeatherService
+import headless
+status = headless.main(["London", "Paris", "--no-history"])
+gui = sorted(name for name in sys.modules if name.split('.')[0] in ("PyQt5", "matplotlib"))
+print("GUI_MODULES", ",".join(gui), file=sys.stderr)
+sys.exit(status)
+"""
+
+def run_headless():
+    env = dict(os.environ)
+    env.pop('QT_QPA_PLATFORM', None)
+    return subprocess.run([sys.executable, "-c", SCRIPT.format(root=str(ROOT))], cwd=ROOT,
+                          capture_output=True, text=True, timeout=60, env=env)
+
+def test_one_shot_emits_one_json_line_per_location():
+    result = run_headless()
+    assert result.returncode == 0, result.stderr
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [record['type'] for record in records] == ['current', 'current']
+    assert [record['location'] for record in records] == ['London', 'Paris']
+    assert records[0]['weather']['temperature'] == 12.3
+
+def test_one_shot_imports_no_gui_modules():
+    result = run_headless()
+    gui = [line for line in result.stderr.splitlines() if line.startswith("GUI_MODULES")]
+    assert gui == ["GUI_MODULES "]
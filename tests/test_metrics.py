@@ -0,0 +1,63 @@
+import urllib.request
+from src.utils.metrics import MetricsRegistry, start_metrics_server
+
+def test_render_prometheus_text():
+    registry = MetricsRegistry()
+    requests = registry.counter('requests', "Requests made", ('endpoint',))
+    latency = registry.histogram('latency_seconds', "Request latency", buckets=(0.1, 1.0))
+    registry.gauge('temperature', "Last temperature").set(12.5)
+
+    requests.inc(endpoint='onecall')
+    requests.inc(2, endpoint='onecall')
+    for value in (0.05, 0.5, 3.0):
+        latency.observe(value)
+
+    assert latency.last() == 3.0
+    assert requests.label_sets() == [('onecall',)]
+
+    text = registry.render()
+    assert '# TYPE requests_total counter' in text
+    assert 'requests_total{endpoint="onecall"} 3' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+    assert 'latency_seconds_count 3' in text
+    assert 'temperature 12.5' in text
+
+def test_metadata_names_match_samples():
+    registry = MetricsRegistry()
+    registry.counter('errors', "Failed requests").inc()
+    registry.gauge('queue', "Queued items").set(2)
+    registry.histogram('wait_seconds', "Wait time", buckets=(1.0,)).observe(0.5)
+    lines = registry.render().splitlines()
+    # Counters are documented under their _total sample name, as prometheus_client does
+    assert lines[:3] == ["# HELP errors_total Failed requests", "# TYPE errors_total counter",
+                         "errors_total 1"]
+    assert "# TYPE queue gauge" in lines and "# TYPE wait_seconds histogram" in lines
+    families = {line.split()[2] for line in lines if line.startswith("# TYPE")}
+    for line in lines:
+        if not line.startswith("#"):
+            name = line.split("{")[0].split()[0]
+            assert name in families or name.rsplit("_", 1)[0] in families
+
+def test_timed_decorator_and_endpoint():
+    registry = MetricsRegistry()
+    latency = registry.histogram('update_seconds', "Update time", ('method',))
+
+    @latency.timed(method='refresh')
+    def refresh():
+        return 42
+
+    assert refresh() == 42
+    assert latency.count(method='refresh') == 1
+
+    server = start_metrics_server(0, registry=registry)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url) as response:
+            body = response.read().decode()
+            assert response.headers['Content-Type'].startswith('text/plain')
+        assert 'update_seconds_count{method="refresh"} 1' in body
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from src.utils.motion_scheduler import MotionScheduler, motion_score
+
+def frame(value=100):
+    return np.full((32, 32), value, np.uint8)
+
+def test_motion_score_ignores_noise():
+    noisy = frame() + np.random.default_rng(1).integers(0, 5, (32, 32)).astype(np.uint8)
+    assert motion_score(frame(), noisy) == 0.0
+    moved = frame()
+    moved[:8, :8] = 200
+    assert motion_score(frame(), moved) == pytest.approx(64 / 1024)
+    assert motion_score(None, frame()) == 0.0
+
+def test_active_view_gets_more_frames_within_budget():
+    scheduler = MotionScheduler(budget=1.5, min_interval=1, max_interval=5)
+    for key in ("front", "back"):
+        scheduler.observe(key, frame(), now=0)
+    moved = frame()
+    moved[:16] = 200
+    scheduler.observe("front", moved, now=1)
+    scheduler.observe("back", frame(), now=1)
+
+    front, back = scheduler.interval("front", now=1), scheduler.interval("back", now=1)
+    assert back == pytest.approx(5)
+    assert front < 1.5
+    assert 1 / front + 1 / back <= 1.5 + 1e-9
+
+def test_activity_decays_toward_minimum_rate():
+    scheduler = MotionScheduler(budget=1.5, min_interval=1, max_interval=5)
+    moved = frame()
+    moved[:16] = 200
+    scheduler.observe("front", frame(), now=0)
+    scheduler.observe("front", moved, now=1)
+    assert scheduler.interval("front", now=1) == pytest.approx(1)
+
+    intervals = [scheduler.interval("front", now=1)]
+    for now in (30, 60, 120, 300):
+        scheduler.observe("front", moved, now=now)
+        intervals.append(scheduler.interval("front", now=now))
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == pytest.approx(5, abs=0.1)
+
+def test_budget_is_shared_when_every_view_is_busy():
+    scheduler = MotionScheduler(budget=1.5, min_interval=1, max_interval=5)
+    moved = frame()
+    moved[:16] = 200
+    for key in ("a", "b", "c"):
+        scheduler.observe(key, frame(), now=0)
+        scheduler.observe(key, moved, now=1)
+    rates = [1 / scheduler.interval(key, now=1) for key in ("a", "b", "c")]
+    assert sum(rates) == pytest.approx(1.5)
+    scheduler.forget("c")
+    assert sum(1 / scheduler.interval(key, now=1) for key in ("a", "b")) == pytest.approx(1.5)
+
+def test_activity_decays_without_new_frames():
+    scheduler = MotionScheduler(budget=1.5, min_interval=1, max_interval=5)
+    moved = frame()
+    moved[:16] = 200
+    scheduler.observe("front", frame(), now=0)
+    scheduler.observe("front", moved, now=1)
+    assert scheduler.interval("front", now=1) == pytest.approx(1)
+    # No frame arrives (slow or stalled fetch), yet the view still cools down
+    assert scheduler.interval("front", now=21) == pytest.approx(1 / (0.2 + 0.8 * 0.5))
+    assert scheduler.interval("front", now=300) == pytest.approx(5, abs=0.1)
@@ -0,0 +1,36 @@
+import numpy as np
+from src.models.weather_data import PrecipitationSeries
+from src.utils.nowcast import Nowcast, NowcastBuffer
+
+START = 1_700_000_040  # On a minute boundary
+
+def minutely(first_minute, values):
+    timestamps = START + 60 * (first_minute + np.arange(len(values)))
+    return PrecipitationSeries("London", timestamps, values)
+
+def test_refresh_writes_only_new_or_revised_minutes():
+    buffer = NowcastBuffer("London")
+    assert buffer.update(minutely(0, np.zeros(60))) == 60
+    # Five minutes later: 55 minutes overlap unchanged, 5 are new
+    assert buffer.update(minutely(5, np.zeros(60))) == 5
+    values = np.zeros(60)
+    values[10] = 1.5
+    assert buffer.update(minutely(5, values)) == 1
+
+def test_window_skips_unknown_minutes():
+    buffer = NowcastBuffer("London")
+    buffer.update(minutely(0, np.ones(30)))
+    window = buffer.window(now=START + 60 * 10)
+    assert np.all(window[:20] == 1)
+    assert np.all(np.isnan(window[20:]))
+
+def test_rain_warning():
+    nowcast = Nowcast()
+    values = np.zeros(60)
+    values[12:20] = 2.0
+    nowcast.update("London", minutely(0, values))
+    warning = nowcast.rain_warning("London", now=START)
+    assert warning.title == "Rain starting in 12 minutes"
+    # Already raining, or dry for the whole hour
+    assert nowcast.rain_warning("London", now=START + 60 * 15) is None
+    assert nowcast.rain_warning("Paris", now=START) is None
@@ -0,0 +1,38 @@
+from datetime import datetime
+import numpy as np
+from src.models.weather_data import WeatherData
+from src.utils.observation_store import ObservationStore
+
+START = 1_700_000_000
+
+def observation(ts, temperature, location="London", description="clear sky"):
+    return WeatherData(temperature=temperature, feels_like=temperature - 1, humidity=60,
+                       wind_speed=3.0, wind_deg=180, pressure=1012, description=description,
+                       timestamp=datetime.fromtimestamp(ts), location=location, icon_code='01d')
+
+def make_store(tmp_path):
+    return ObservationStore(tmp_path / "observations.db", retention_days=1)
+
+def test_range_returns_columns(tmp_path):
+    store = make_store(tmp_path)
+    for i in range(10):
+        store.append(observation(START + 300 * i, 10 + i, description="rain" if i % 2 else "clear sky"),
+                     now=START)
+    store.append(observation(START, 99, location="Paris"), now=START)
+    # Repeated timestamps are ignored
+    store.append(observation(START, 50), now=START)
+
+    series = store.range("London", START + 300, START + 1500)
+    assert series.temperature.dtype == np.float32
+    np.testing.assert_allclose(series.temperature, [11, 12, 13, 14, 15])
+    assert series.descriptions() == ["rain", "clear sky", "rain", "clear sky", "rain"]
+    assert store.range("London", START, START)[0].temperature == 10
+    assert len(store.range("Berlin", START, START + 3600)) == 0
+
+def test_retention(tmp_path):
+    store = make_store(tmp_path)
+    store.append(observation(START, 10), now=START)
+    store.append(observation(START + 86400 * 2, 12), now=START)
+    assert store.compact(now=START + 86400 * 2) == 1
+    assert len(store.range("London", 0, START + 86400 * 3)) == 1
+    assert store.locations() == ["London"]
@@ -0,0 +1,44 @@
+from PyQt5.QtWidgets import QWidget
+from src.ui.perf_hud import PerfHud
+from src.utils.metrics import REGISTRY
+from src.utils.styles import Styles
+
+def test_refresh_renders_sampled_figures(qapp):
+    window = QWidget()
+    window.resize(800, 600)
+    window.show()
+    hud = PerfHud(window)
+    try:
+        assert not hud.isVisible()
+        hud.toggle()
+        assert hud.isVisible() and hud.timer.isActive()
+
+        updates = REGISTRY.histogram('ui_update_seconds', "Time spent in main window updates", ('method',))
+        updates.observe(0.120, method='update_weather')
+        updates.observe(0.045, method='update_forecast_graph')
+        REGISTRY.counter('frigate_snapshots', "Snapshots fetched from Frigate", ('camera',)).inc(camera='front')
+
+        # One second after a sample with 30 fewer frames
+        previous = hud._sample()
+        previous['time'] -= 1.0
+        previous['frames'] = hud.frames - 30
+        previous['fetched'] = {}
+        hud._previous = previous
+        hud.refresh()
+
+        lines = hud.text().splitlines()
+        assert lines[0].startswith("UI  30.0 fps")
+        assert "Refresh 120 ms" in lines
+        assert any(line.split() == ["graph", "45.0", "ms"] for line in lines)
+        assert any(line.split()[:2] == ["front", "1.0"] for line in lines)
+        assert hud.x() + hud.width() == window.width() - 12
+
+        hud.toggle()
+        assert not hud.isVisible() and not hud.timer.isActive()
+    finally:
+        window.close()
+
+def test_hud_background_is_translucent_dark():
+    sheet = Styles.stylesheet()
+    assert "rgba(18, 18, 18, 221)" in sheet
+    assert Styles.rgba("#6200EA", 128) == "rgba(98, 0, 234, 128)"
@@ -0,0 +1,46 @@
+from datetime import datetime
+import numpy as np
+from src.models.weather_data import WeatherData
+from src.utils.observation_store import ObservationStore
+from src.utils.pressure_tendency import PressureTendency, describe_tendency, series_tendency
+
+START = 1_700_000_000
+
+def observation(ts, pressure):
+    return WeatherData(temperature=10, feels_like=9, humidity=60, wind_speed=3.0, wind_deg=180,
+                       pressure=pressure, description="clear sky",
+                       timestamp=datetime.fromtimestamp(ts), location="London", icon_code='01d')
+
+def test_three_hour_change_is_incremental():
+    tracker = PressureTendency()
+    # Falling 1 hPa per hour, sampled every 5 minutes
+    for i in range(48):
+        tendency = tracker.update(observation(START + 300 * i, 1020 - i // 12))
+        if i < 12:
+            assert tendency is None
+    assert tendency == -3
+    assert len(tracker._samples["London"]) == 37
+    assert tracker.label("London").startswith("↓ -3.0 hPa/3h")
+
+def test_seeded_from_history(tmp_path):
+    store = ObservationStore(tmp_path / "observations.db")
+    for i in range(36):
+        store.append(observation(START + 300 * i, 1000 + i // 6), now=START)
+    tracker = PressureTendency(store)
+    assert tracker.update(observation(START + 300 * 36, 1006)) == 6
+
+def test_labels():
+    assert describe_tendency(None) == "–"
+    assert describe_tendency(0.4).startswith("→")
+    assert describe_tendency(4.0).startswith("⇈")
+    assert describe_tendency(-8.0, hours=24).startswith("↓")
+
+def test_series_tendency():
+    class Series:
+        timestamps = START + 3600 * np.arange(48)
+        pressure = np.arange(48, dtype=np.int16)
+        def __len__(self):
+            return 48
+    change = series_tendency(Series(), [START + 3600, START + 3600 * 10, START + 3600 * 60])
+    assert np.isnan(change[0]) and np.isnan(change[2])
+    assert change[1] == 3
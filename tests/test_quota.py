@@ -0,0 +1,48 @@
+import pytest
+from src.api.quota import QuotaManager, QuotaExceeded, TokenBucket
+
+DAY = 1_760_000_000 - 1_760_000_000 % 86400  # Midnight UTC
+
+def test_token_bucket_limits_bursts():
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    assert bucket.try_acquire(now=bucket.updated)
+    assert bucket.try_acquire(now=bucket.updated)
+    assert not bucket.try_acquire(now=bucket.updated)
+    assert bucket.try_acquire(now=bucket.updated + 1)
+
+def test_daily_budget_is_shared_and_resets(tmp_path):
+    path = tmp_path / "quota.json"
+    quota = QuotaManager(daily_budget=3, per_minute=600, path=path)
+    quota.acquire(now=DAY + 10)
+    quota.acquire(now=DAY + 20)
+
+    # Another process picks up the same count
+    other = QuotaManager(daily_budget=3, per_minute=600, path=path)
+    other.acquire(now=DAY + 30)
+    with pytest.raises(QuotaExceeded) as error:
+        other.acquire(now=DAY + 40)
+    assert error.value.reason == 'daily'
+
+    assert other.remaining(now=DAY + 86400) == 3
+
+def test_suggested_interval_spreads_budget():
+    quota = QuotaManager(daily_budget=100, per_minute=600, path="/nonexistent/quota.json")
+    # Half a day left and 100 calls: one call every 432 s, per location
+    assert quota.suggested_interval(1, now=DAY + 43200) == pytest.approx(432)
+    assert quota.suggested_interval(4, now=DAY + 43200) == pytest.approx(1728)
+
+def _reserve(path, count):
+    quota = QuotaManager(daily_budget=100000, per_minute=10 ** 9, path=path)
+    for _ in range(count):
+        quota.acquire()
+
+def test_concurrent_processes_do_not_lose_counts(tmp_path):
+    import multiprocessing
+    path = tmp_path / "quota.json"
+    workers = [multiprocessing.Process(target=_reserve, args=(path, 50)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+    assert QuotaManager(daily_budget=100000, path=path).used == 200
+    assert not (tmp_path / "quota.tmp").exists()
@@ -0,0 +1,65 @@
+from datetime import datetime
+from src.models.weather_data import WeatherData
+from src.utils.refresh_scheduler import (RefreshScheduler, MIN_DELAY, PUBLISH_GRACE,
+                                         PUBLISH_INTERVAL, MAX_BACKOFF)
+
+START = 1_700_000_400  # A multiple of PUBLISH_INTERVAL
+
+def observation(ts, temperature=10.0, pressure=1015, wind_speed=3.0, location="London"):
+    return WeatherData(temperature=temperature, feels_like=temperature, humidity=60,
+                       wind_speed=wind_speed, wind_deg=180, pressure=pressure,
+                       description="clear sky", timestamp=datetime.fromtimestamp(ts),
+                       location=location, icon_code='01d')
+
+class FakeQuota:
+    def __init__(self, interval):
+        self.interval = interval
+
+    def suggested_interval(self, locations=1, now=None):
+        return self.interval
+
+def test_aligns_to_publish_slot():
+    scheduler = RefreshScheduler(base_interval=600)
+    # Observation two minutes old: the next one is published 8 minutes from now
+    delay = scheduler.next_delay(observation(START), now=START + 120)
+    assert delay == PUBLISH_INTERVAL - 120 + PUBLISH_GRACE
+
+def test_stale_observation_waits_for_next_slot():
+    scheduler = RefreshScheduler(base_interval=300)
+    # The expected publish time has passed without new data
+    now = START + PUBLISH_INTERVAL + PUBLISH_GRACE + 60
+    assert scheduler.next_publish(observation(START), now) == START + 2 * PUBLISH_INTERVAL + PUBLISH_GRACE
+
+def test_backs_off_while_stable():
+    scheduler = RefreshScheduler(base_interval=600)
+    delays = []
+    for i in range(8):
+        ts = START + i * 3600
+        delays.append(scheduler.next_delay(observation(ts), now=ts + 10))
+    assert delays == sorted(delays) and delays[-1] > delays[0]
+    assert delays[-1] <= 600 * MAX_BACKOFF + PUBLISH_INTERVAL
+    assert delays[-1] >= 600 * MAX_BACKOFF - PUBLISH_INTERVAL
+
+def test_tightens_for_fast_changes_and_warnings():
+    scheduler = RefreshScheduler(base_interval=600)
+    scheduler.next_delay(observation(START), now=START + 10)
+    # Pressure dropping 3 hPa in ten minutes
+    assert scheduler.next_delay(observation(START + 600, pressure=1012), now=START + 610) == 300
+    assert scheduler.volatility >= 1
+
+    calm = RefreshScheduler(base_interval=600)
+    assert calm.next_delay(observation(START), warnings_active=True, now=START + 10) == 300
+
+def test_location_change_resets_history():
+    scheduler = RefreshScheduler(base_interval=600)
+    scheduler.next_delay(observation(START), now=START + 10)
+    scheduler.next_delay(observation(START + 600, temperature=30, location="Paris"), now=START + 610)
+    assert scheduler.volatility is None
+
+def test_respects_minimum_and_quota():
+    scheduler = RefreshScheduler(base_interval=30)
+    assert scheduler.next_delay(observation(START), warnings_active=True, now=START) == MIN_DELAY
+
+    limited = RefreshScheduler(base_interval=300, quota=FakeQuota(1800))
+    assert limited.next_delay(observation(START), now=START + 10) == 1800
+    assert limited.next_delay(None, now=START + 10) == 1800
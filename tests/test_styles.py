@@ -0,0 +1,30 @@
+import pytest
+from src.utils.styles import Styles
+from src.utils.weather_warnings import WeatherWarnings
+
+class FakeApp:
+    def __init__(self):
+        self.sheets = []
+
+    def setStyleSheet(self, sheet):
+        self.sheets.append(sheet)
+
+def test_stylesheet_covers_widget_states():
+    sheet = Styles.stylesheet()
+    for severity, color in WeatherWarnings.SEVERITY_COLORS.items():
+        assert f'WarningCard[severity="{severity}"]' in sheet
+        assert f"{color}22" in sheet
+    assert 'ForecastCard[selected="true"]' in sheet
+    assert "ForecastCard:hover" in sheet
+    assert sheet.count("{") == sheet.count("}")
+
+def test_theme_switch_is_one_stylesheet(monkeypatch):
+    monkeypatch.setattr(Styles, 'PRIMARY_COLOR', Styles.PRIMARY_COLOR)
+    app = FakeApp()
+    Styles.apply(app, PRIMARY_COLOR="#00838F")
+    assert len(app.sheets) == 1
+    assert "#00838F" in app.sheets[0]
+
+def test_unknown_color_is_rejected():
+    with pytest.raises(AttributeError):
+        Styles.apply(FakeApp(), NOT_A_COLOR="#000000")
@@ -0,0 +1,30 @@
+import json
+import time
+from src.utils.tracing import Tracer
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer(enabled=False)
+    with tracer.span("refresh"):
+        pass
+    assert len(tracer.events) == 0
+
+def test_nested_spans_export_as_chrome_trace(tmp_path):
+    tracer = Tracer(enabled=True)
+    with tracer.span("update_weather"):
+        with tracer.span("fetch", "http", city="London"):
+            time.sleep(0.001)
+        with tracer.span("tight_layout"):
+            pass
+
+    path = tmp_path / "trace.json"
+    tracer.export(path)
+    document = json.loads(path.read_text())
+    spans = {event['name']: event for event in document['traceEvents'] if event['ph'] == 'X'}
+    assert set(spans) == {"update_weather", "fetch", "tight_layout"}
+
+    outer, fetch = spans["update_weather"], spans["fetch"]
+    assert outer['ts'] <= fetch['ts']
+    assert fetch['ts'] + fetch['dur'] <= outer['ts'] + outer['dur']
+    assert fetch['dur'] >= 1000  # microseconds
+    assert fetch['args'] == {'city': 'London'}
+    assert any(event['ph'] == 'M' for event in document['traceEvents'])
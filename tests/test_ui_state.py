@@ -0,0 +1,64 @@
+from datetime import datetime
+from src.api.onecall_parser import parse_series
+from src.models.change_detection import series_digest, weather_key
+from src.models.weather_data import ForecastData, PrecipitationSeries, WeatherData
+from src.utils.ui_state import UiState
+
+def daily(temperatures):
+    return [
+        {
+            'dt': 1760000000 + 86400 * i,
+            'temp': {'day': temperature},
+            'feels_like': {'day': temperature - 1},
+            'humidity': 60,
+            'wind_speed': 5.0,
+            'wind_deg': 90,
+            'pressure': 1015,
+            'pop': 0.4,
+            'weather': [{'description': 'light rain' if i % 2 else 'clear sky',
+                         'icon': '10d' if i % 2 else '01d'}]
+        }
+        for i, temperature in enumerate(temperatures)
+    ]
+
+def state():
+    current = WeatherData(temperature=12.3, feels_like=11.0, humidity=70, wind_speed=3.5,
+                          wind_deg=200, pressure=1012, description="light rain",
+                          timestamp=datetime.fromtimestamp(1760000000), location="London",
+                          icon_code='10d')
+    forecast = ForecastData("London", parse_series(daily([20, 21, 22]), "London"),
+                            parse_series(daily([18, 19]), "London"),
+                            PrecipitationSeries("London", [1760000000, 1760000060], [0.0, 1.5]))
+    return UiState(city="London", current=current, forecast=forecast, pressure_trend="↓ falling",
+                   icons={'10d': b'\x89PNG icon'}, chart=b'\x89PNG chart',
+                   camera="front", camera_frame=b'\xff\xd8 frame')
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "ui_state.npz"
+    saved = state()
+    saved.save(path)
+    loaded = UiState.load(path)
+
+    assert loaded.city == "London" and loaded.pressure_trend == "↓ falling"
+    assert weather_key(loaded.current) == weather_key(saved.current)
+    assert loaded.current.timestamp == saved.current.timestamp
+    assert series_digest(loaded.forecast.daily) == series_digest(saved.forecast.daily)
+    assert series_digest(loaded.forecast.hourly) == series_digest(saved.forecast.hourly)
+    assert loaded.forecast.minutely.precipitation.tolist() == [0.0, 1.5]
+    assert loaded.icons == {'10d': b'\x89PNG icon'}
+    assert (loaded.chart, loaded.camera, loaded.camera_frame) == (b'\x89PNG chart', "front", b'\xff\xd8 frame')
+
+def test_missing_or_corrupt_state(tmp_path):
+    path = tmp_path / "ui_state.npz"
+    assert UiState.load(path) is None
+    path.write_bytes(b"not an archive")
+    assert UiState.load(path) is None
+
+def test_save_without_forecast_or_images(tmp_path):
+    path = tmp_path / "ui_state.npz"
+    saved = state()
+    saved.forecast = saved.chart = saved.camera_frame = None
+    saved.save(path)
+    loaded = UiState.load(path)
+    assert loaded.forecast is None and loaded.chart is None and loaded.camera_frame is None
+    assert not (tmp_path / "ui_state.tmp").exists()
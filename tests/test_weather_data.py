@@ -0,0 +1,49 @@
+import numpy as np
+from src.api.onecall_parser import parse_series, parse_minutely
+from src.models.weather_data import WeatherData
+
+DAILY = [
+    {
+        'dt': 1760000000 + 86400 * i,
+        'temp': {'day': 20.5 + i, 'min': 10, 'max': 25},
+        'feels_like': {'day': 19.25 + i},
+        'humidity': 60,
+        'wind_speed': 5.13,
+        'wind_deg': 90,
+        'pressure': 1015,
+        'rain': 1.5,
+        'weather': [{'description': 'light rain' if i % 2 else 'clear sky', 'icon': '01d'}]
+    }
+    for i in range(7)
+]
+
+def test_daily_series_is_columnar():
+    series = parse_series(DAILY, "London")
+    assert len(series) == 7
+    assert series.timestamps.dtype == np.int64
+    assert series.temperature.dtype == np.float32
+    # Two distinct conditions are shared by all rows
+    assert len(series.conditions) == 2
+
+def test_row_view_behaves_like_weather_data():
+    series = parse_series(DAILY, "London")
+    row = series[1]
+    assert row.temperature == 21.5
+    assert row.feels_like == 20.25
+    assert row.wind_speed == 5.13
+    assert row.description == 'light rain'
+    assert row.location == "London"
+    assert row.get_wind_direction() == 'E'
+    assert isinstance(row.to_weather_data(), WeatherData)
+    assert [r.description for r in series][:2] == ['clear sky', 'light rain']
+
+def test_hourly_rain_and_minutely_precipitation():
+    hourly = [dict(DAILY[0], temp=12.0, feels_like=11.0, rain={'1h': 0.7})]
+    series = parse_series(hourly, "London")
+    assert series[0].temperature == 12.0
+    assert abs(float(series.precipitation[0]) - 0.7) < 1e-6
+
+    minutely = parse_minutely(
+        [{'dt': 1760000000 + 60 * i, 'precipitation': float(i)} for i in range(60)], "London")
+    assert len(minutely) == 60
+    assert minutely.precipitation[59] == 59.0
@@ -1 +1,75 @@
- 
\ No newline at end of file
+import json
+import pytest
+from src.api import weather_service as weather_service_module
+from src.api.weather_service import WeatherService
+from src.models.weather_data import WeatherData
+
+NOW = 1760000000
+
+PAYLOAD = {
+    'current': {
+        'dt': NOW, 'temp': 12.3, 'feels_like': 11.0, 'humidity': 80, 'wind_speed': 4.1,
+        'wind_deg': 200, 'pressure': 1008,
+        'weather': [{'description': 'light rain', 'icon': '10d'}]
+    },
+    'minutely': [{'dt': NOW + 60 * i, 'precipitation': 0.5} for i in range(60)],
+    'hourly': [
+        {'dt': NOW + 3600 * i, 'temp': 10.0, 'feels_like': 9.0, 'humidity': 70, 'wind_speed': 3.0,
+         'wind_deg': 180, 'pressure': 1010, 'weather': [{'description': 'overcast clouds', 'icon': '04d'}]}
+        for i in range(48)
+    ],
+    'daily': [
+        {'dt': NOW + 86400 * i, 'temp': {'day': 20.0}, 'feels_like': {'day': 19.0}, 'humidity': 60,
+         'wind_speed': 5.0, 'wind_deg': 90, 'pressure': 1015,
+         'weather': [{'description': 'clear sky', 'icon': '01d'}]}
+        for i in range(8)
+    ]
+}
+
+class FakeResponse:
+    def __init__(self, data, status_code=200):
+        self.content = json.dumps(data).encode()
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        pass
+
+@pytest.fixture
+def calls(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_get(url, params=None, **kwargs):
+        calls.append(url)
+        if 'geo' in url:
+            return FakeResponse([{'lat': 51.5, 'lon': -0.1}])
+        return FakeResponse(PAYLOAD)
+
+    monkeypatch.setattr(weather_service_module.Config, 'OPENWEATHER_API_KEY', 'test-key')
+    monkeypatch.setattr(weather_service_module.Config, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(weather_service_module.requests, 'get', fake_get)
+    return calls
+
+def test_get_weather_parses_all_blocks(calls):
+    result = WeatherService().get_weather("London")
+    assert isinstance(result.current, WeatherData)
+    assert result.current.description == 'light rain'
+    assert result.current.location == "London"
+    assert len(result.forecast.daily_forecasts) == 7
+    assert len(result.forecast.hourly) == 48
+    assert len(result.forecast.minutely) == 60
+
+def test_coordinates_are_cached(calls):
+    service = WeatherService()
+    service.get_current_weather("London")
+    service.get_forecast("London")
+    assert sum('geo' in url for url in calls) == 1
+    assert sum('onecall' in url for url in calls) == 2
+
+def test_falls_back_to_cached_result_over_quota(calls):
+    service = WeatherService()
+    service.quota.daily_budget = 1
+    first = service.get_weather("London")
+    second = service.get_weather("London")
+    assert not first.cached and second.cached
+    assert second.current.temperature == first.current.temperature
+    assert sum('onecall' in url for url in calls) == 1
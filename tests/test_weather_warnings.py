@@ -0,0 +1,112 @@
+import json
+import numpy as np
+import pytest
+from src.api.onecall_parser import parse_series
+from src.notifications.alert_service import AlertService
+from src.utils.config import Config
+from src.utils.rule_engine import RuleEngine, PANEL_ALERTS
+from src.utils.weather_warnings import WeatherWarnings
+
+NOW = 1760000000
+DESCRIPTIONS = ['clear sky', 'heavy rain', 'thunderstorm', 'light snow', 'storm clouds']
+
+@pytest.fixture(autouse=True)
+def default_rules(monkeypatch):
+    """Use the bundled rules only, whatever is in the user's rules.json"""
+    engine = RuleEngine(path=None)
+    monkeypatch.setattr(RuleEngine, '_shared', engine)
+    return engine
+
+def point(temperature=20.0, wind_speed=3.0, description='clear sky', humidity=50):
+    return parse_series([{'dt': NOW, 'temp': temperature, 'feels_like': 0.0, 'humidity': humidity,
+                          'wind_speed': wind_speed, 'wind_deg': 0, 'pressure': 1013,
+                          'weather': [{'description': description, 'icon': '01d'}]}], "Test")[0]
+
+def make_hourly(n=48, seed=1):
+    rng = np.random.default_rng(seed)
+    return parse_series([
+        {'dt': NOW + 3600 * i, 'temp': float(rng.uniform(-5, 40)), 'feels_like': 0.0,
+         'humidity': int(rng.integers(40, 100)), 'wind_speed': float(rng.uniform(0, 25)),
+         'wind_deg': 0, 'pressure': 1013,
+         'weather': [{'description': DESCRIPTIONS[i % len(DESCRIPTIONS)], 'icon': '01d'}]}
+        for i in range(n)
+    ], "Test")
+
+def test_batch_matches_scalar_evaluation(default_rules):
+    engine = default_rules
+    series = make_hourly()
+    table = WeatherWarnings.evaluate_series(series)
+    for i, point in enumerate(series):
+        expected = [rule.id for rule in engine.evaluate(point)]
+        rows = table[table['time_index'] == i]
+        assert [engine.rules[r].id for r in rows['rule']] == expected
+
+def test_multiple_series_are_indexed():
+    first, second = make_hourly(seed=1), make_hourly(seed=2)
+    table = WeatherWarnings.evaluate_series(first, second)
+    assert set(np.unique(table['series'])) <= {0, 1}
+    assert np.array_equal(table[table['series'] == 0][['time_index', 'rule']],
+                          WeatherWarnings.evaluate_series(first)[['time_index', 'rule']])
+
+def test_next_warning():
+    series = make_hourly()
+    table = WeatherWarnings.evaluate_series(series)
+    # Index 2 is always a thunderstorm
+    seconds, warning = WeatherWarnings.next_warning(
+        series, table, now=NOW + 3600 * 2, min_severity=WeatherWarnings.SEVERITY_HIGH)
+    assert seconds == 0
+    assert warning.severity == WeatherWarnings.SEVERITY_HIGH
+
+def test_one_rule_per_group(default_rules):
+    sample = make_hourly()[0]
+    fired = default_rules.evaluate(sample)
+    groups = [rule.group for rule in fired]
+    assert len(groups) == len(set(groups))
+    alerts = AlertService().check_alerts(sample)
+    warnings = WeatherWarnings.check_warnings(sample)
+    assert len(alerts) + len(warnings) == len(fired)
+
+def messages(sample):
+    """Banner and card titles shown for one observation"""
+    # Alerts are "<icon> <title>\n<message>"
+    return ([alert.split('\n')[0].split(' ', 1)[1] for alert in AlertService().check_alerts(sample)],
+            [warning.title for warning in WeatherWarnings.check_warnings(sample)])
+
+def test_hot_day_shows_one_message(monkeypatch):
+    monkeypatch.setattr(Config, 'MAX_TEMP_THRESHOLD', 35.0)
+    assert messages(point(temperature=38.0)) == (["High temperature alert: 38.0°C"], [])
+    assert messages(point(temperature=32.0)) == ([], ["High Temperature Alert"])
+
+def test_stormy_day_shows_one_message_per_hazard(monkeypatch):
+    monkeypatch.setattr(Config, 'SEVERE_WIND_THRESHOLD', 20.0)
+    stormy = point(wind_speed=22.0, description='thunderstorm with heavy rain', humidity=90)
+    assert messages(stormy) == (["High wind alert: 22.0 m/s", "Severe weather warning!"],
+                                ["Heavy Rain Alert", "High Humidity Alert"])
+    assert messages(point(wind_speed=17.0, description='storm clouds')) == \
+        ([], ["Wind Advisory", "Storm Alert"])
+
+def test_alert_uses_configured_threshold(monkeypatch):
+    monkeypatch.setattr(Config, 'MAX_TEMP_THRESHOLD', 36.0)
+    engine = RuleEngine(path=None)
+    warm = point(temperature=35.5)
+    fired = engine.evaluate(warm)
+    assert [rule.id for rule in fired] == ['extreme_heat']
+    assert AlertService(engine).check_alerts(warm) == []
+
+def test_rules_reload_when_file_changes(tmp_path):
+    rules_file = tmp_path / "rules.json"
+    engine = RuleEngine(path=rules_file, check_interval=0)
+    assert engine.source() == RuleEngine.DEFAULT_RULES_FILE
+
+    rules_file.write_text(json.dumps({'rules': [
+        {'id': 'warm', 'field': 'temperature', 'op': '>', 'value': 10, 'severity': 'low',
+         'title': "Warm: {value}°C", 'panel': PANEL_ALERTS}
+    ]}))
+    sample = make_hourly()[0]
+    assert [rule.id for rule in engine.evaluate(sample)] == (['warm'] if sample.temperature > 10 else [])
+    assert len(engine.rules) == 1
+
+    # An invalid file keeps the previous rules
+    rules_file.write_text("{not json")
+    engine.evaluate(sample)
+    assert len(engine.rules) == 1